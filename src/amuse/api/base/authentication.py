@@ -1,8 +1,7 @@
 from rest_framework.request import HttpRequest
 from amuse.tokens import otp_token_generator
 from django.conf import settings
-from users.models import User
-from django.core.exceptions import ObjectDoesNotExist
+from users.principal import AuthenticatedUser, get_principal
 from django.utils.module_loading import import_string
 from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.authentication import BaseAuthentication
@@ -13,15 +12,14 @@ def authenticate_from_otp_cookie(request: HttpRequest):
     if raw_token is None:
         raise AuthenticationFailed({"reason": "Missing token", "code": 'missing-token'})
     user_id = otp_token_generator.get_user_id(raw_token)
-    try:
-        user = User.objects.get(id=user_id)
-        if not user.is_active:
-            raise AuthenticationFailed(
-                {"reason": "User account is deactivated", "code": 'user-deactivated'}
-            )
-        return user
-    except (ObjectDoesNotExist, TypeError):
+    principal = get_principal(user_id) if user_id is not None else None
+    if principal is None:
         return None
+    if not principal.is_active:
+        raise AuthenticationFailed(
+            {"reason": "User account is deactivated", "code": 'user-deactivated'}
+        )
+    return AuthenticatedUser(principal)
 
 
 class JWTCookieAuthentication(BaseAuthentication):
@@ -32,17 +30,16 @@ class JWTCookieAuthentication(BaseAuthentication):
         if token is None:
             return None
         user_id = self.token_generator_class.get_user_id(token)
-        try:
-            user = User.objects.get(id=user_id)
-            if not user.is_active:
-                raise AuthenticationFailed(
-                    {
-                        "reason": "User account is deactivated",
-                        "code": 'user-deactivated',
-                    }
-                )
-            return user, token
-        except (ObjectDoesNotExist, TypeError):
+        principal = get_principal(user_id) if user_id is not None else None
+        if principal is None:
             raise AuthenticationFailed(
                 {"reason": "User account not found", "code": 'user-not-found'}
             )
+        if not principal.is_active:
+            raise AuthenticationFailed(
+                {
+                    "reason": "User account is deactivated",
+                    "code": 'user-deactivated',
+                }
+            )
+        return AuthenticatedUser(principal), token
@@ -6,6 +6,7 @@ from rest_framework.decorators import permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from amuse import blacklist
 from amuse.api.v4.serializers.artist import ArtistSearchSerializer
 from amuse.api.v4.serializers.blacklisted_artist_name import (
     BlacklistedArtistNameSerializer,
@@ -15,16 +16,10 @@ from amuse.api.base.views.exceptions import (
     WrongAPIversionError,
     MissingQueryParameterError,
 )
-from amuse.vendor.spotify.artist_blacklist.blacklist import fuzzify
-from releases.models.exceptions import (
-    SongsIDsDoNotExistError,
-    ArtistsIDsDoNotExistError,
-)
 from releases.models.blacklisted_artist_name import BlacklistedArtistName
 from releases.models.release import ReleaseArtistRole, Release
 from releases.models.song import Song, SongArtistRole
 from users.models.artist_v2 import UserArtistRole, ArtistV2
-from users.models.exceptions import ArtistsDoNotExistError
 
 
 logger = logging.getLogger(__name__)
@@ -78,21 +73,23 @@ class RelatedArtistView(generics.ListAPIView):
             raise MissingQueryParameterError()
 
     def get_queryset(self):
+        """
+        Returns the artists having a non-writer role on any song of the artist,
+        fetched in a single query with the songs and roles as subqueries.
+        """
         artist_id = self.request.query_params.get('artist_id')
-        try:
-            songs_ids = SongArtistRole.get_songs_ids_by_artist_id(artist_id)
-            artists_ids = SongArtistRole.get_artists_ids_by_songs_ids(
-                artist_id, songs_ids
-            )
-
-            return ArtistV2.get_artists_by_ids(artists_ids)
-        except (
-            SongsIDsDoNotExistError,
-            ArtistsIDsDoNotExistError,
-            ArtistsDoNotExistError,
-        ) as e:
-            logger.debug(e.message)
+        songs_ids = SongArtistRole.objects.filter(artist_id=artist_id).values('song_id')
+        artists_ids = (
+            SongArtistRole.objects.filter(song_id__in=songs_ids)
+            .exclude(artist_id=artist_id)
+            .exclude(role=SongArtistRole.ROLE_WRITER)
+            .values('artist_id')
+        )
+        artists = ArtistV2.objects.filter(id__in=artists_ids)
+        if not artists:
+            logger.debug('Related artists were not found.')
             raise Http404()
+        return artists
 
 
 @permission_classes([IsAuthenticated])
@@ -110,5 +107,7 @@ class BlacklistedArtistNameSearchView(generics.ListAPIView):
 
     def get_queryset(self):
         name = self.request.query_params.get('name')
-        fuzzy_name = fuzzify(name)
-        return BlacklistedArtistName.objects.filter(fuzzy_name=fuzzy_name)
+        return [
+            BlacklistedArtistName(pk=pk, name=blacklisted_name)
+            for pk, blacklisted_name in blacklist.search(name)
+        ]
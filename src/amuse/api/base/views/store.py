@@ -3,7 +3,7 @@ from rest_framework import permissions, generics
 from amuse.api.base.mixins import ArtistAuthorizationMixin
 from amuse.api.base.views.exceptions import WrongAPIversionError
 from amuse.api.v4.serializers import store as v4
-from releases.models import Store
+from releases.store_registry import store_registry
 
 
 class StoreView(ArtistAuthorizationMixin, generics.ListAPIView):
@@ -16,11 +16,8 @@ class StoreView(ArtistAuthorizationMixin, generics.ListAPIView):
             raise WrongAPIversionError()
 
     def get_queryset(self):
-        qs = (
-            Store.objects.select_related('category')
-            .exclude(internal_name='audiomack')
-            .order_by('order')
-        )
+        stores = sorted(store_registry.all(), key=lambda store: store.order)
+        qs = [store for store in stores if store.internal_name != 'audiomack']
 
         if not self.request.user.is_authenticated:
             return qs
@@ -34,6 +31,6 @@ class StoreView(ArtistAuthorizationMixin, generics.ListAPIView):
         )
 
         if artist and artist.audiomack_id is not None:
-            return Store.objects.select_related('category').all().order_by('order')
+            return stores
 
         return qs
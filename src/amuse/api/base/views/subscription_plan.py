@@ -1,4 +1,3 @@
-from django.db.models import F
 from rest_framework import generics
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
@@ -12,6 +11,7 @@ from amuse.api.v5.serializers.subscription_plan import (
     SubscriptionPlanSerializer as SubscriptionPlanV5Serializer,
 )
 from countries.models import Country
+from subscriptions import price_cards
 from subscriptions.models import SubscriptionPlan
 
 
@@ -46,31 +46,37 @@ class SubscriptionPlansView(logmixins.LogMixin, generics.ListAPIView):
     def filter_queryset(self, queryset):
         """
         If a Plan on V5 doesn't have a PriceCard for the Country provided,
-        exclude it from the queryset instead of raising a ValidationError
+        exclude it from the queryset instead of raising a ValidationError.
+        IntroductoryPriceCards are not in the map of PriceCards, so Plans with
+        only IntroductoryPriceCards are excluded as well.
+
+        The PriceCards are looked up in the in-memory price card map, so only
+        the plans themselves are queried.
         """
 
-        queryset = super().filter_queryset(queryset)
-        queryset = queryset.filter(
-            pricecard__introductorypricecard__isnull=True
-        ).distinct()
+        plans = list(super().filter_queryset(queryset))
         if self.request.version == '5':
             country_code = self._get_country_code(self.request)
         else:
             country_code = 'US'
 
-        filtered_queryset = queryset.filter(pricecard__countries__code=country_code)
-        if not filtered_queryset.exists():
+        filtered_plans = [
+            plan for plan in plans if price_cards.get_price_cards(plan.pk, country_code)
+        ]
+        if not filtered_plans:
             # we don't have any plans for this Country
             # instead of returning [], return Plans for US as a global default
-            filtered_queryset = queryset.filter(pricecard__countries__code='US')
-        return filtered_queryset
+            filtered_plans = [
+                plan for plan in plans if price_cards.get_price_cards(plan.pk, 'US')
+            ]
+        return filtered_plans
 
     def list(self, request, *args, **kwargs):
         try:
-            queryset = self.filter_queryset(self.get_queryset())
+            plans = self.filter_queryset(self.get_queryset())
 
-            serializer = self.get_serializer(queryset, many=True)
-            data = self._get_data_with_best_deals(queryset, serializer.data)
+            serializer = self.get_serializer(plans, many=True)
+            data = self._get_data_with_best_deals(plans, serializer.data)
 
             return Response(data)
         except ValueError as err:
@@ -78,6 +84,12 @@ class SubscriptionPlansView(logmixins.LogMixin, generics.ListAPIView):
             raise ValidationError(err)
 
     def _get_country_code(self, request):
+        # The country is needed by the filtering, serializer and best deals
+        if getattr(self, '_country_code', None) is None:
+            self._country_code = self._lookup_country_code(request)
+        return self._country_code
+
+    def _lookup_country_code(self, request):
         country_id = request.query_params.get('country')
         if not country_id:
             country_id = request.META.get('HTTP_CF_IPCOUNTRY', 'US')
@@ -88,11 +100,18 @@ class SubscriptionPlansView(logmixins.LogMixin, generics.ListAPIView):
         except Country.DoesNotExist:
             raise ValidationError(f'Invalid Country: {country_id}')
 
-    def _get_data_with_best_deals(self, queryset, data):
-        if queryset.exists():
-            best_deal_id = (
-                queryset.order_by(F("pricecard__price") / F("period")).first().id
-            )
+    def _get_data_with_best_deals(self, plans, data):
+        country_code = 'US'
+        if self.request.version == '5':
+            country_code = self._get_country_code(self.request)
+
+        deals = [
+            (plan.get_price_card(country_code).price / plan.period, plan.id)
+            for plan in plans
+            if plan.period
+        ]
+        if deals:
+            best_deal_id = min(deals)[1]
 
             for plan in data:
                 plan["best_deal"] = plan["id"] == best_deal_id
@@ -1,10 +1,13 @@
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
 from django.views.decorators.cache import cache_control
 from rest_framework import mixins, permissions, status, viewsets
 from rest_framework.response import Response
 from django_filters import rest_framework as filters
 
-from amuse.api.v4.serializers.release import ReleaseSerializer as ReleaseV4Serializer
+from amuse.api.v4.serializers.release import (
+    ReleaseSerializer as ReleaseV4Serializer,
+    prefetch_release_data,
+)
 from amuse.permissions import (
     FrozenUserPermission,
     IsOwnerPermission,
@@ -66,22 +69,22 @@ class ReleaseViewSet(
 
     def get_queryset(self):
         user = self.request.user
-        artists = list(user.artists.values_list("id", flat=True))
-        songs = list(
-            SongArtistRole.objects.filter(artist_id__in=artists).values_list(
-                "song_id", flat=True
+        # Releases of the user and releases with songs by any of the user's
+        # artists, resolved by the database in a single query.
+        has_user_artist = Exists(
+            SongArtistRole.objects.filter(
+                song__release=OuterRef('pk'),
+                artist__in=user.artists.values('pk'),
             )
         )
-
-        r1 = list(Release.objects.filter(songs__in=songs).values_list("id", flat=True))
-        r2 = list(Release.objects.filter(user=user).values_list("id", flat=True))
-
-        return (
-            self.queryset.filter(id__in=r1 + r2)
-            .exclude(status__in=[Release.STATUS_DELETED, Release.STATUS_REJECTED])
-            .distinct()
+        queryset = self.queryset.filter(Q(user=user) | has_user_artist).exclude(
+            status__in=[Release.STATUS_DELETED, Release.STATUS_REJECTED]
         )
 
+        if self.action == 'retrieve':
+            queryset = prefetch_release_data(queryset)
+        return queryset
+
     @cache_control(max_age=7200)
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
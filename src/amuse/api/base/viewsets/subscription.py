@@ -17,6 +17,7 @@ from amuse.api.v5.serializers.subscription import (
 )
 from amuse.permissions import CanDeleteAdyenSubscription
 from amuse.utils import get_ip_address
+from subscriptions.entitlements import shared_entitlements
 
 
 @permission_classes([IsAuthenticated, CanDeleteAdyenSubscription])
@@ -40,6 +41,7 @@ class SubscriptionViewSet(logmixins.LogMixin, viewsets.GenericViewSet):
         if not self.request.version in ['4', '5']:
             raise WrongAPIversionError()
 
+    @shared_entitlements
     def list(self, request, *args, **kwargs):
         subscription = self.get_object()
         if subscription is None:
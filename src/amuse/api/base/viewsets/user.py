@@ -58,6 +58,7 @@ from app.forms import PasswordResetForm
 from countries.models import Country
 from releases.models import Release
 from slayer import clientwrapper as slayer
+from subscriptions.entitlements import shared_entitlements
 from subscriptions.models import SubscriptionPlan
 from users.models import ArtistV2, User
 from users.models.user import OtpDevice, UserMetadata
@@ -113,6 +114,10 @@ class UserViewSet(
             return (SendSmsThrottle(),)
         return []
 
+    @shared_entitlements
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
     def _response(self, obj=None):
         return Response([obj] if obj else [])
 
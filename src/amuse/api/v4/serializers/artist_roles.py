@@ -11,11 +11,36 @@ CONFLICTING_ROLES_MESSAGE = (
 )
 
 
+class ArtistRolesListSerializer(serializers.ListSerializer):
+    def get_attribute(self, instance):
+        artists_roles = super().get_attribute(instance)
+        if 'songartistrole_set' not in getattr(
+            instance, '_prefetched_objects_cache', {}
+        ):
+            return artists_roles
+
+        # Lets ArtistRolesSerializer use the prefetched artists of the song
+        artist_names = {
+            role.artist_id: role.artist.name
+            for role in instance.songartistrole_set.all()
+            if role.artist_id is not None
+        }
+        return [
+            {**artist_role, 'artist_name': artist_names[artist_role['artist_id']]}
+            if artist_role['artist_id'] in artist_names
+            else artist_role
+            for artist_role in artists_roles
+        ]
+
+
 class ArtistRolesSerializer(serializers.Serializer):
     artist_id = serializers.IntegerField()
     roles = ListField(allow_empty=False)
     artist_name = serializers.SerializerMethodField(read_only=True)
 
+    class Meta:
+        list_serializer_class = ArtistRolesListSerializer
+
     def validate_roles(self, value):
         role_name_list = {role[1] for role in SongArtistRole.ROLE_CHOICES}
         for role_name in value:
@@ -28,6 +53,8 @@ class ArtistRolesSerializer(serializers.Serializer):
         return value
 
     def get_artist_name(self, obj):
+        if 'artist_name' in obj:
+            return obj['artist_name']
         try:
             return ArtistV2.objects.get(id=obj['artist_id']).name
         except:
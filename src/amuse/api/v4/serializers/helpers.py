@@ -345,9 +345,9 @@ def get_serialized_active_royalty_splits(song):
             'photo': royalty_split.get_user_profile_photo_url(),
             'rate': float(royalty_split.rate),
         }
-        for royalty_split in song.royalty_splits.filter(
-            status=RoyaltySplit.STATUS_ACTIVE
-        )
+        # Filtered in Python so prefetched royalty splits are reused
+        for royalty_split in song.royalty_splits.all()
+        if royalty_split.status == RoyaltySplit.STATUS_ACTIVE
     ]
 
 
@@ -2,7 +2,7 @@ import logging
 from datetime import timedelta, datetime
 
 from django.utils import timezone
-from django.db.models import Q
+from django.db.models import Prefetch, Q, QuerySet
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
@@ -53,11 +53,26 @@ from amuse.tasks import create_asset_labels, send_email_first_time_cid_use
 logger = logging.getLogger(__name__)
 
 
+def prefetch_release_data(queryset):
+    """
+    Loads everything ReleaseSerializer reads from the releases in a fixed
+    number of queries, independent of the number of releases.
+    """
+    return queryset.select_related('genre', 'upc', 'cover_art').prefetch_related(
+        'excluded_countries',
+        'stores',
+        'releaseartistrole_set__artist',
+        Prefetch('songs', queryset=Song.objects.select_related('isrc', 'genre')),
+        'songs__songartistrole_set__artist',
+        'songs__song_invitations__artist',
+        'songs__royalty_splits__user',
+    )
+
+
 class ReleaseListSerializer(serializers.ListSerializer):
     def to_representation(self, data):
-        data = data.exclude(status=Release.STATUS_DELETED).prefetch_related(
-            'upc', 'songs__songartistrole', 'songs__isrc', 'songs__genre'
-        )
+        if isinstance(data, QuerySet):
+            data = prefetch_release_data(data.exclude(status=Release.STATUS_DELETED))
         return super().to_representation(data)
 
 
@@ -129,6 +144,9 @@ class ReleaseSerializer(serializers.Serializer):
     link = serializers.CharField(read_only=True)
     include_pre_save_link = serializers.BooleanField(required=False, default=False)
 
+    class Meta:
+        list_serializer_class = ReleaseListSerializer
+
     def to_representation(self, instance):
         data = super().to_representation(instance)
         status = int(data['status'])
@@ -235,7 +235,9 @@ class CreatePaymentSerializer(serializers.Serializer):
             if pmt_object.status == "COMPLETED":
                 if not is_royalty_advance:
                     update_withdrawal(
-                        self.revenue_system_transaction_id, "is_completed"
+                        self.revenue_system_transaction_id,
+                        "is_completed",
+                        user_id=self.user.pk,
                     )
 
             return {
@@ -250,7 +252,11 @@ class CreatePaymentSerializer(serializers.Serializer):
                 error_code in settings.HYPERWALLET_CANCEL_ERROR_CODES
             )
             if not is_royalty_advance and should_cancel_payment:
-                update_withdrawal(self.revenue_system_transaction_id, "is_cancelled")
+                update_withdrawal(
+                    self.revenue_system_transaction_id,
+                    "is_cancelled",
+                    user_id=self.user.pk,
+                )
             return {
                 "is_success": False,
                 "data": None,
@@ -1,12 +1,101 @@
+"""
+In-memory index of blacklisted artist names.
+
+Every content review checks all artist names of a release against the
+blacklist, so the blacklist is loaded once per process into a dict keyed on
+the fuzzified name and kept as a VersionedIndex: saving or deleting a
+BlacklistedArtistName replaces the version and every process rebuilds its
+index.
+
+A trigram index over the fuzzy names finds near misses, like a single added or
+swapped letter, without comparing the text with every blacklisted name.
+"""
+from collections import defaultdict
+
 from amuse.vendor.spotify.artist_blacklist.blacklist import fuzzify
+from amuse.versioned_index import VersionedIndex
 from releases.models.blacklisted_artist_name import BlacklistedArtistName
 
+VERSION_CACHE_KEY = 'blacklist:index:version'
+NGRAM_SIZE = 3
+
+
+def get_ngrams(fuzzy_name):
+    padded = f'  {fuzzy_name} '
+    return {padded[i : i + NGRAM_SIZE] for i in range(len(padded) - NGRAM_SIZE + 1)}
+
+
+class BlacklistIndex:
+    def __init__(self, rows):
+        # Fuzzy name => [(id, name)] ordered by id
+        self.names = defaultdict(list)
+        self.ngrams = defaultdict(set)
+
+        for id, name, fuzzy_name in rows:
+            self.names[fuzzy_name].append((id, name))
+        for fuzzy_name in self.names:
+            for ngram in get_ngrams(fuzzy_name):
+                self.ngrams[ngram].add(fuzzy_name)
+
+    def get(self, text):
+        return self.names.get(fuzzify(text), [])
+
+    def find_similar(self, text, min_similarity):
+        fuzzy_name = fuzzify(text)
+        ngrams = get_ngrams(fuzzy_name)
+        shared = defaultdict(int)
+        for ngram in ngrams:
+            for candidate in self.ngrams.get(ngram, ()):
+                shared[candidate] += 1
+
+        matches = []
+        for candidate, count in shared.items():
+            # Dice coefficient of the trigram sets
+            similarity = 2 * count / (len(ngrams) + len(get_ngrams(candidate)))
+            if similarity >= min_similarity:
+                matches.append((similarity, self.names[candidate][0][1]))
+        return [name for _, name in sorted(matches, key=lambda m: -m[0])]
+
+
+def _build_index():
+    rows = BlacklistedArtistName.objects.order_by('id').values_list(
+        'id', 'name', 'fuzzy_name'
+    )
+    return BlacklistIndex(rows)
+
+
+_index = VersionedIndex(VERSION_CACHE_KEY, _build_index)
+
+
+def get_index():
+    return _index.get()
+
+
+def invalidate():
+    _index.invalidate()
+
 
 def find(text):
-    fuzzified_text = fuzzify(text)
-    queryset = BlacklistedArtistName.objects.filter(fuzzy_name=fuzzified_text)
-    if queryset.count() >= 1:
-        blacklisted_artist_name = queryset.first()
-        return blacklisted_artist_name.name
-    else:
-        return None
+    names = get_index().get(text)
+    return names[0][1] if names else None
+
+
+def find_many(texts):
+    """Returns the blacklisted name matching each of the texts that match."""
+    index = get_index()
+    matches = {}
+    for text in texts:
+        names = index.get(text)
+        if names:
+            matches[text] = names[0][1]
+    return matches
+
+
+def search(text):
+    """Returns all (id, name) pairs of blacklisted names matching the text."""
+    return list(get_index().get(text))
+
+
+def find_similar(text, min_similarity=0.6):
+    """Returns blacklisted names similar to the text, most similar first."""
+    return get_index().find_similar(text, min_similarity)
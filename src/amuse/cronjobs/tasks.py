@@ -1,8 +1,10 @@
 import datetime
 
+from django.conf import settings
 from django.core.management import call_command
 
 from amuse.celery import app
+from amuse.services import sns_inbox
 from amuse.vendor.aws import cloudwatch
 from amuse.vendor.fuga import cronjob
 from amuse.vendor.spotify import cron
@@ -11,6 +13,8 @@ from releases import jobs as release_jobs
 from releases import splits_reminders
 from releases.models import Release
 from subscriptions import helpers as sub_helpers
+from subscriptions import renewal
+from subscriptions.models import Subscription
 from users.artistv2_cleanup import delete_orphan_artistv2
 
 
@@ -130,17 +134,39 @@ def expire_subscriptions_task():
 @app.task
 def renew_adyen_subscriptios():
     """
-    Adyen autorenew subscriptions
+    Adyen autorenew subscriptions, renewed in chunks by separate tasks
     """
-    sub_helpers.renew_adyen_subscriptions(is_dry_run=False)
+    for subscription_ids in renewal.get_chunks(Subscription.objects.active_adyen()):
+        renew_adyen_subscriptions_chunk.delay(subscription_ids)
+
+
+@app.task
+def renew_adyen_subscriptions_chunk(subscription_ids):
+    report = sub_helpers.renew_adyen_subscriptions(
+        is_dry_run=False,
+        subscription_ids=subscription_ids,
+        workers=settings.SUBSCRIPTION_RENEWAL_WORKERS,
+    )
+    cloudwatch.subscription_renewal_metrics(report)
 
 
 @app.task
 def renew_apple_subscriptios():
     """
-    Apple autorenew subscriptions
+    Apple autorenew subscriptions, renewed in chunks by separate tasks
     """
-    sub_helpers.renew_apple_subscriptions(is_dry_run=False)
+    for subscription_ids in renewal.get_chunks(Subscription.objects.active_apple()):
+        renew_apple_subscriptions_chunk.delay(subscription_ids)
+
+
+@app.task
+def renew_apple_subscriptions_chunk(subscription_ids):
+    report = sub_helpers.renew_apple_subscriptions(
+        is_dry_run=False,
+        subscription_ids=subscription_ids,
+        workers=settings.SUBSCRIPTION_RENEWAL_WORKERS,
+    )
+    cloudwatch.subscription_renewal_metrics(report)
 
 
 @app.task
@@ -196,6 +222,11 @@ def cloudwatch_metrics_job():
     cloudwatch.standard_resolution_job()
 
 
+@app.task
+def sns_inbox_cron_job():
+    sns_inbox.drain()
+
+
 @app.task
 def release_status_cron_job():
     release_jobs.update_delivered()
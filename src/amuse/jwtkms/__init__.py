@@ -1,2 +1,3 @@
 from .token import Token, TokenHeader, TokenPayload
 from .kms import KmsManager
+from .verifier import LocalVerifier
@@ -0,0 +1,107 @@
+"""
+Micro-benchmark of the per-request cost of verifying KMS signed access tokens.
+
+KMS is replaced by LocalKmsClient, which signs and verifies with a generated
+RSA key and sleeps `latency` seconds per call to simulate the round trip. Use
+the benchmark_jwt_auth command.
+"""
+import statistics
+import time
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+
+from .kms import KmsManager
+
+MODES = ["kms", "local"]
+
+
+class LocalKmsClient:
+    """Implements the KMS calls used by KmsManager with a local RSA key"""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = 0
+        self.private_key = rsa.generate_private_key(
+            public_exponent=65537, key_size=2048
+        )
+
+    def _call(self):
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def get_public_key(self, KeyId):
+        self._call()
+        public_key = self.private_key.public_key().public_bytes(
+            serialization.Encoding.DER,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        return {"KeyId": KeyId, "PublicKey": public_key}
+
+    def sign(self, KeyId, Message, MessageType, SigningAlgorithm):
+        self._call()
+        signature = self.private_key.sign(
+            Message.encode(), padding.PKCS1v15(), hashes.SHA256()
+        )
+        return {"KeyId": KeyId, "Signature": signature}
+
+    def verify(self, KeyId, Message, MessageType, Signature, SigningAlgorithm):
+        self._call()
+        try:
+            self.private_key.public_key().verify(
+                Signature, Message.encode(), padding.PKCS1v15(), hashes.SHA256()
+            )
+        except InvalidSignature:
+            return {"KeyId": KeyId, "SignatureValid": False}
+        return {"KeyId": KeyId, "SignatureValid": True}
+
+
+def _percentile(durations, percentile):
+    return durations[min(len(durations) - 1, int(len(durations) * percentile))]
+
+
+def run_benchmark(iterations=1000, latency=0.0, modes=MODES):
+    """
+    Returns the per-request cost of KmsJwtManager.get_user_id for every mode,
+    "kms" verifies every token via KMS and "local" uses the cached public key.
+    """
+    from amuse.tokens import KmsJwtManager
+
+    results = []
+    for mode in modes:
+        client = LocalKmsClient(latency=latency)
+        manager = type(
+            "BenchmarkKmsJwtManager",
+            (KmsJwtManager,),
+            {
+                "_kms": KmsManager(client=client, arn="benchmark"),
+                "_verifier": None,
+                "kms_verify": mode == "kms",
+            },
+        )
+        token = manager.make_access_token(user_id=1)
+        # The first request loads the public key
+        manager.get_user_id(token)
+        client.calls = 0
+
+        durations = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            manager.get_user_id(token)
+            durations.append((time.perf_counter() - started) * 1_000_000)
+        durations.sort()
+
+        results.append(
+            {
+                "mode": mode,
+                "iterations": iterations,
+                "kms_latency_ms": latency * 1000,
+                "mean_us": round(statistics.mean(durations), 1),
+                "p50_us": round(_percentile(durations, 0.5), 1),
+                "p99_us": round(_percentile(durations, 0.99), 1),
+                "kms_calls": client.calls,
+            }
+        )
+    return {"results": results}
@@ -23,11 +23,18 @@ class KmsManager:
         if pk := cache.get(cache_key):
             return pk
 
-        response = self.client.get_public_key(KeyId=self.arn)
-        pk = base64.urlsafe_b64encode(response["PublicKey"]).decode()
+        pk = base64.urlsafe_b64encode(self.get_public_key()).decode()
         cache.set(cache_key, pk, settings.JWT_KMS_PUBKEY_CACHE_TTL_SECS)
         return pk
 
+    def get_public_key(self) -> bytes:
+        """Retrieves the DER-encoded public key from KMS, uncached
+
+        :return: Public Key (bytes)
+        """
+
+        return self.client.get_public_key(KeyId=self.arn)["PublicKey"]
+
     def sign(self, unsigned: str) -> bytes:
         """Signs the given data and returns the signature encoded in bytes
 
@@ -0,0 +1,150 @@
+import base64
+import binascii
+import json
+import logging
+import threading
+import time
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.serialization import load_der_public_key
+
+from .kms import KmsManager
+
+logger = logging.getLogger(__name__)
+
+
+class LocalVerifier:
+    def __init__(
+        self, kms: KmsManager, refresh_interval: float, reload_interval: float = 60
+    ):
+        """Verifies token signatures in-process with the KMS public key
+
+        The parsed public key is kept in memory and refreshed in a background
+        thread once it is older than `refresh_interval` seconds, so requests
+        never wait for KMS after the first load. Tokens that are not RS256 are
+        rejected without verifying them. A signature that does not match the
+        cached key, e.g. after a key rotation, reloads the public key and is
+        verified again, at most once every `reload_interval` seconds so forged
+        tokens cannot make every request call KMS. KMS is only called to
+        verify when the public key cannot be fetched.
+
+        :param kms: Manager for interacting with AWS KMS
+        :param refresh_interval: Seconds before the public key is refreshed
+        :param reload_interval: Minimum seconds between reloads of the public
+            key for signatures that do not match it
+        """
+
+        self.kms = kms
+        self.refresh_interval = refresh_interval
+        self.reload_interval = reload_interval
+        self._public_key = None
+        self._loaded_at = None
+        self._reloaded_at = None
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    def _load_public_key(self):
+        public_key = load_der_public_key(self.kms.get_public_key())
+        self._public_key, self._loaded_at = public_key, time.monotonic()
+        return public_key
+
+    def _refresh(self):
+        try:
+            self._load_public_key()
+        except Exception:
+            logger.warning("Unable to refresh KMS public key", exc_info=True)
+        finally:
+            self._refreshing = False
+
+    def _refresh_in_background(self):
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._refresh, daemon=True).start()
+
+    @property
+    def public_key(self):
+        """Returns the cached public key, loading it on first use"""
+
+        public_key = self._public_key
+        if public_key is None:
+            with self._lock:
+                return self._public_key or self._load_public_key()
+
+        if time.monotonic() - self._loaded_at >= self.refresh_interval:
+            self._refresh_in_background()
+        return public_key
+
+    def _reload_public_key(self):
+        """Returns the reloaded public key, or None when it was reloaded recently"""
+
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self._reloaded_at is not None
+                and now - self._reloaded_at < self.reload_interval
+            ):
+                return None
+            self._reloaded_at = now
+
+        try:
+            return self._load_public_key()
+        except Exception:
+            logger.warning("Unable to reload KMS public key", exc_info=True)
+            return None
+
+    @staticmethod
+    def _is_rs256(header: bytes) -> bool:
+        try:
+            header = json.loads(
+                base64.urlsafe_b64decode(header + b"=" * (-len(header) % 4))
+            )
+        except (ValueError, binascii.Error):
+            return False
+        return isinstance(header, dict) and header.get("alg") == "RS256"
+
+    @staticmethod
+    def _verify_signature(public_key, signing_input: bytes, signature: bytes) -> bool:
+        try:
+            public_key.verify(
+                signature, signing_input, padding.PKCS1v15(), hashes.SHA256()
+            )
+        except InvalidSignature:
+            return False
+        return True
+
+    def verify(self, token: str) -> bool:
+        """Verify header+payload, locally when possible
+
+        :param token: Token string
+        :return: True if valid, otherwise false
+        """
+
+        try:
+            signing_input, signature = token.encode().rsplit(b".", 1)
+            signature = base64.urlsafe_b64decode(
+                signature + b"=" * (-len(signature) % 4)
+            )
+        except (ValueError, binascii.Error):
+            return False
+
+        if not self._is_rs256(signing_input.split(b".", 1)[0]):
+            return False
+
+        try:
+            public_key = self.public_key
+        except Exception:
+            logger.warning("KMS public key unavailable", exc_info=True)
+            return self.kms.verify(token)
+
+        if self._verify_signature(public_key, signing_input, signature):
+            return True
+
+        # Not signed with the cached key, the key might have been rotated
+        public_key = self._reload_public_key()
+        return public_key is not None and self._verify_signature(
+            public_key, signing_input, signature
+        )
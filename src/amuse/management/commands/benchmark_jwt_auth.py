@@ -0,0 +1,37 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from amuse.jwtkms.benchmark import MODES, run_benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the per-request cost of verifying KMS signed access tokens. "
+        "KMS is replaced by a local RSA key with a simulated round trip."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=1000)
+        parser.add_argument(
+            "--kms-latency-ms",
+            type=float,
+            default=10.0,
+            help="Simulated round trip of every KMS call",
+        )
+        parser.add_argument(
+            "--modes",
+            type=str,
+            nargs="+",
+            choices=MODES,
+            default=MODES,
+            help="Space-separated verification modes to run",
+        )
+
+    def handle(self, *args, **kwargs):
+        results = run_benchmark(
+            iterations=kwargs["iterations"],
+            latency=kwargs["kms_latency_ms"] / 1000,
+            modes=kwargs["modes"],
+        )
+        self.stdout.write(json.dumps(results, indent=2))
@@ -0,0 +1,41 @@
+# Generated by Django 3.2.15 on 2026-10-17 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('amuse', '0061_bulkdeliveryjob_youtube_content_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SnsNotification',
+            fields=[
+                (
+                    'id',
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('message_id', models.CharField(max_length=128, unique=True)),
+                ('topic_arn', models.CharField(max_length=256)),
+                ('message', models.TextField()),
+                (
+                    'status',
+                    models.PositiveSmallIntegerField(
+                        choices=[(0, 'pending'), (1, 'processed'), (99, 'failed')],
+                        default=0,
+                    ),
+                ),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('error', models.TextField(blank=True, default='')),
+                ('date_created', models.DateTimeField(auto_now_add=True)),
+                ('date_processed', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={'index_together': {('status', 'topic_arn')}},
+        ),
+    ]
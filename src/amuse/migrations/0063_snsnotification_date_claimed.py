@@ -0,0 +1,30 @@
+# Generated by Django 3.2.15 on 2026-10-17 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('amuse', '0062_snsnotification'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='snsnotification',
+            name='date_claimed',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='snsnotification',
+            name='status',
+            field=models.PositiveSmallIntegerField(
+                choices=[
+                    (0, 'pending'),
+                    (1, 'processed'),
+                    (2, 'in progress'),
+                    (99, 'failed'),
+                ],
+                default=0,
+            ),
+        ),
+    ]
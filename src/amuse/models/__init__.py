@@ -2,5 +2,6 @@ from .acrcloud import ACRCloudMatch
 from .event import Event
 from .image import Image
 from .link import Link
+from .sns_notification import SnsNotification
 from .support import SupportEvent, SupportRelease
 from .transcoding import Transcoding
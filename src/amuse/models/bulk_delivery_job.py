@@ -1,18 +1,21 @@
 import csv
 import gc
 import time
+from collections import defaultdict
 from logging import getLogger
 
 from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.functions import Lower
 
 from amuse.services.delivery.checks import get_store_delivery_checks
 from amuse.services.release_delivery_info import ReleaseDeliveryInfo
 from amuse.storages import S3Storage
 from amuse.vendor.fuga.fuga_api import FugaAPIClient
 from releases.models import Store, ReleaseArtistRole, FugaMetadata, Song, Release
+from releases.store_registry import store_registry
 from users.models import User
 
 logger = getLogger(__name__)
@@ -126,99 +129,140 @@ class BulkDeliveryJob(models.Model):
     class Meta:
         verbose_name_plural = 'Bulk Delivery Jobs'
 
-    def get_release_and_song_ids(self):
-        from releases.models.release import Release
+    INPUT_COLUMNS = [
+        'release_id',
+        'release__id',
+        'user_id',
+        'user_email',
+        'artist_id',
+        'isrc',
+    ]
+    INPUT_CHUNK_SIZE = 1000
+
+    def iter_input_file_rows(self):
+        """
+        Streams the input file rows from S3 line by line instead of downloading
+        and reading the whole file into memory.
+        """
+        body = self.input_file.storage.bucket.Object(self.input_file.name).get()['Body']
+        lines = (line.decode('utf-8') for line in body.iter_lines())
+        return csv.DictReader(lines)
 
-        with self.input_file.open('r') as f:
-            content = [line.decode('utf-8') for line in f.readlines()]
-            rows = csv.DictReader(content)
-            release_ids = []
-            song_ids = []
+    def get_release_and_song_ids(self):
+        rows = self.iter_input_file_rows()
+        column = next(
+            (c for c in self.INPUT_COLUMNS if c in (rows.fieldnames or [])), None
+        )
+        release_ids = set()
+        song_ids = set()
+        unresolved = []
+
+        if column:
+            resolve = {
+                'release_id': self._resolve_release_ids,
+                'release__id': self._resolve_release_ids,
+                'user_id': self._resolve_user_ids,
+                'user_email': self._resolve_user_emails,
+                'artist_id': self._resolve_artist_ids,
+                'isrc': self._resolve_isrcs,
+            }[column]
+
+            chunk = []
             for row in rows:
-                if "release_id" in row:
-                    try:
-                        release_ids.append(int(row["release_id"]))
-                    except ValueError:
-                        # We are just skipping invalid release ids and log them
-                        logger.info(
-                            f'BulkDeliveryJob {self.id} invalid release_id: {row["release_id"]}'
-                        )
-                elif "release__id" in row:
-                    try:
-                        release_ids.append(int(row["release__id"]))
-                    except ValueError:
-                        # We are just skipping invalid release ids and log them
-                        logger.info(
-                            f'BulkDeliveryJob {self.id} invalid release_id: {row["release__id"]}'
-                        )
-                elif "user_id" in row:
-                    try:
-                        user_id = int(row["user_id"])
-                        user_release_ids = Release.objects.filter(
-                            user_id=user_id
-                        ).values_list('id', flat=True)
-                        if user_release_ids:
-                            release_ids.extend(user_release_ids)
-                    except ValueError:
-                        # We are just skipping invalid user ids and log them
-                        logger.info(
-                            f'BulkDeliveryJob {self.id} invalid user_id: {row["user_id"]}'
-                        )
-                elif "user_email" in row:
-                    user_email = row["user_email"]
-                    if not user_email:
-                        continue
-                    user = User.objects.filter(email=user_email).first()
-                    if not user:
-                        user = User.objects.filter(email=user_email.lower()).first()
-                    if not user:
-                        user = User.objects.filter(
-                            email=user_email[0].lower() + user_email[1:]
-                        ).first()
-                    if not user:
-                        user = User.objects.filter(
-                            email=user_email[0].upper() + user_email[1:]
-                        ).first()
-                    if user:
-                        user_release_ids = Release.objects.filter(
-                            user_id=user.id
-                        ).values_list('id', flat=True)
-                        if user_release_ids:
-                            release_ids.extend(user_release_ids)
-                    else:
-                        # We are just skipping invalid user_emails and log them
-                        logger.info(
-                            f'BulkDeliveryJob {self.id} invalid user_email: {user_email}'
-                        )
-                elif "artist_id" in row:
-                    try:
-                        artist_id = int(row["artist_id"])
-                        artists_release_ids = ReleaseArtistRole.objects.filter(
-                            artist_id=artist_id, main_primary_artist=True
-                        ).values_list('release_id', flat=True)
-
-                        if artists_release_ids:
-                            release_ids.extend(artists_release_ids)
-
-                    except ValueError:
-                        # We are just skipping invalid user ids and log them
-                        logger.info(
-                            f'BulkDeliveryJob {self.id} invalid artist_id: {row["artist_id"]}'
-                        )
-                elif "isrc" in row:
-                    try:
-                        isrc = row["isrc"]
-                        song = Song.objects.filter(isrc__code=isrc)
-                        if song.exists():
-                            release_ids.extend(song.values_list('release', flat=True))
-                            song_ids.extend(song.values_list('id', flat=True))
-                    except ValueError:
-                        # Skip invalid ISRCs
-                        logger.info(
-                            f'BulkDeliveryJob {self.id} invalid ISRC: {row["isrc"]}'
-                        )
-
-            return sorted(list(set(song_ids))), sorted(list(set(release_ids)))
+                chunk.append(row[column])
+                if len(chunk) == self.INPUT_CHUNK_SIZE:
+                    unresolved.extend(resolve(chunk, release_ids, song_ids))
+                    chunk = []
+            if chunk:
+                unresolved.extend(resolve(chunk, release_ids, song_ids))
+
+        if unresolved:
+            # We are just skipping unresolved identifiers and log them
+            logger.info(
+                f'BulkDeliveryJob {self.id} skipped {len(unresolved)} invalid or '
+                f'unknown {column} values: {unresolved[:100]}'
+            )
+
+        return sorted(song_ids), sorted(release_ids)
+
+    @staticmethod
+    def _parse_ids(values):
+        ids = []
+        invalid = []
+        for value in values:
+            try:
+                ids.append(int(value))
+            except (TypeError, ValueError):
+                invalid.append(value)
+        return ids, invalid
+
+    def _resolve_release_ids(self, values, release_ids, song_ids):
+        ids, invalid = self._parse_ids(values)
+        release_ids.update(ids)
+        return invalid
+
+    def _resolve_user_ids(self, values, release_ids, song_ids):
+        user_ids, invalid = self._parse_ids(values)
+        found_user_ids = set()
+        for user_id, release_id in Release.objects.filter(
+            user_id__in=user_ids
+        ).values_list('user_id', 'id'):
+            found_user_ids.add(user_id)
+            release_ids.add(release_id)
+        return invalid + [
+            user_id for user_id in user_ids if user_id not in found_user_ids
+        ]
+
+    def _resolve_user_emails(self, values, release_ids, song_ids):
+        emails = [email for email in values if email]
+        users_by_lower_email = defaultdict(list)
+        for user_id, email, email_lower in (
+            User.objects.annotate(email_lower=Lower('email'))
+            .filter(email_lower__in={email.lower() for email in emails})
+            .order_by('pk')
+            .values_list('id', 'email', 'email_lower')
+        ):
+            users_by_lower_email[email_lower].append((user_id, email))
+
+        user_ids = set()
+        unresolved = []
+        for email in emails:
+            users = users_by_lower_email.get(email.lower())
+            if not users:
+                unresolved.append(email)
+                continue
+            # Prefer the exact match over case-insensitive ones
+            user_ids.add(
+                next((uid for uid, user_email in users if user_email == email), None)
+                or users[0][0]
+            )
+
+        release_ids.update(
+            Release.objects.filter(user_id__in=user_ids).values_list('id', flat=True)
+        )
+        return unresolved
+
+    def _resolve_artist_ids(self, values, release_ids, song_ids):
+        artist_ids, invalid = self._parse_ids(values)
+        found_artist_ids = set()
+        for artist_id, release_id in ReleaseArtistRole.objects.filter(
+            artist_id__in=artist_ids, main_primary_artist=True
+        ).values_list('artist_id', 'release_id'):
+            found_artist_ids.add(artist_id)
+            release_ids.add(release_id)
+        return invalid + [
+            artist_id for artist_id in artist_ids if artist_id not in found_artist_ids
+        ]
+
+    def _resolve_isrcs(self, values, release_ids, song_ids):
+        found_isrcs = set()
+        for isrc, song_id, release_id in Song.objects.filter(
+            isrc__code__in=values
+        ).values_list('isrc__code', 'id', 'release_id'):
+            found_isrcs.add(isrc)
+            song_ids.add(song_id)
+            release_ids.add(release_id)
+        return [isrc for isrc in values if isrc not in found_isrcs]
 
     def get_delivery_command(self):
         return self.MAP_JOB_TYPE_TO_DELIVERY_COMMAND[self.type]
@@ -236,62 +280,76 @@ class BulkDeliveryJob(models.Model):
         ]
 
     def perform_checks(self, store: str, releases: list) -> list:
+        store = store_registry.get_by_internal_name(store)
+        failed_releases = self.evaluate_store_checks(store, releases)
+        return [release for release in releases if release.pk not in failed_releases]
+
+    def releases_passing_delivery_checks(self, releases: list) -> list:
+        releases = list(releases)
+        store_release_ids = defaultdict(set)
+        for release_id, store_id in Release.stores.through.objects.filter(
+            release_id__in=[release.pk for release in releases]
+        ).values_list('release_id', 'store_id'):
+            store_release_ids[store_id].add(release_id)
+
+        failed_releases = {}
+        for store_id in sorted(store_release_ids):
+            store = store_registry.get(store_id)
+            store_releases = [
+                release
+                for release in releases
+                if release.pk in store_release_ids[store.pk]
+                and release.pk not in failed_releases
+            ]
+            failed_releases.update(self.evaluate_store_checks(store, store_releases))
+
+        return [release for release in releases if release.pk not in failed_releases]
+
+    def evaluate_store_checks(self, store: Store, releases: list) -> dict:
+        """
+        Runs every non-overridden check for the store once for the whole list of
+        releases and marks the results of the failing releases as prevented with
+        one update per failure reason.
+
+        Returns a dict of failing release id -> failure message of the first
+        check the release failed.
+        """
         from amuse.models.bulk_delivery_job_results import BulkDeliveryJobResult
 
-        store_releases = []
+        operation = self.get_delivery_command()
+        remaining_releases = list(releases)
+        failed_releases = {}
+        release_ids_by_failure = defaultdict(list)
 
-        for release in releases:
-            checks = [
-                check(
-                    release=release,
-                    store=Store.from_internal_name(store),
-                    operation=self.get_delivery_command(),
-                )
-                for check in get_store_delivery_checks(store)
-            ]
-            checks = self.get_checks_after_override(checks)
+        for check in get_store_delivery_checks(store.internal_name):
+            if check.__name__ in self.checks_to_override or not remaining_releases:
+                continue
 
-            success = True
-            for check in checks:
-                if not check.passing():
-                    BulkDeliveryJobResult.objects.filter(
-                        job=self,
-                        release=release,
-                        status=BulkDeliveryJobResult.STATUS_UNPROCESSED,
-                    ).update(
-                        store=Store.from_internal_name(store),
-                        status=BulkDeliveryJobResult.STATUS_PREVENTED,
-                        description=check.failure_message,
-                    )
-                    success = False
-                    break
-            if success:
-                store_releases.append(release)
-        return store_releases
+            failing_release_ids = check.failing_release_ids(
+                remaining_releases, store, operation
+            )
+            for release_id in failing_release_ids:
+                failed_releases[release_id] = check.failure_message
+                release_ids_by_failure[check.failure_message].append(release_id)
+
+            remaining_releases = [
+                release
+                for release in remaining_releases
+                if release.pk not in failing_release_ids
+            ]
 
-    def passed_delivery_checks(self, release):
-        from amuse.models.bulk_delivery_job_results import BulkDeliveryJobResult
+        for failure_message, release_ids in release_ids_by_failure.items():
+            BulkDeliveryJobResult.objects.filter(
+                job=self,
+                release_id__in=release_ids,
+                status=BulkDeliveryJobResult.STATUS_UNPROCESSED,
+            ).update(
+                store=store,
+                status=BulkDeliveryJobResult.STATUS_PREVENTED,
+                description=failure_message,
+            )
 
-        for store in release.stores.all():
-            for check in get_store_delivery_checks(store.internal_name):
-                if check.__name__ not in self.checks_to_override:
-                    check_obj = check(
-                        release=release,
-                        store=store,
-                        operation=self.get_delivery_command(),
-                    )
-                    if not check_obj.passing():
-                        BulkDeliveryJobResult.objects.filter(
-                            job=self,
-                            release=release,
-                            status=BulkDeliveryJobResult.STATUS_UNPROCESSED,
-                        ).update(
-                            store=store,
-                            status=BulkDeliveryJobResult.STATUS_PREVENTED,
-                            description=check_obj.failure_message,
-                        )
-                        return False
-        return True
+        return failed_releases
 
     def passed_mode_checks(self):
         if self.mode == BulkDeliveryJob.MODE_ONLY_FUGA_RELEASE_STORES:
@@ -443,10 +501,10 @@ class BulkDeliveryJob(models.Model):
                 user=self.user,
             )
         if self.mode == BulkDeliveryJob.MODE_ONLY_RELEASE_STORES:
-            for release in releases:
-                if not self.passed_delivery_checks(release):
-                    continue
-                release_delivery_info = ReleaseDeliveryInfo(release)
+            cleared_releases = self.releases_passing_delivery_checks(releases)
+            delivery_infos = ReleaseDeliveryInfo.for_releases(cleared_releases)
+            for release in cleared_releases:
+                release_delivery_info = delivery_infos[release.pk]
                 stores = release_delivery_info.get_direct_delivery_channels(
                     delivery_type
                 )
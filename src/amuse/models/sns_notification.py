@@ -0,0 +1,40 @@
+from django.db import models
+
+
+class SnsNotification(models.Model):
+    """
+    SNS notification received on the notification endpoint and stored for
+    asynchronous handling. The SNS MessageId is unique so redelivered messages
+    are only stored, and handled, once.
+    """
+
+    STATUS_PENDING = 0
+    STATUS_PROCESSED = 1
+    STATUS_IN_PROGRESS = 2
+    STATUS_FAILED = 99
+
+    STATUS_CHOICES = (
+        (STATUS_PENDING, 'pending'),
+        (STATUS_PROCESSED, 'processed'),
+        (STATUS_IN_PROGRESS, 'in progress'),
+        (STATUS_FAILED, 'failed'),
+    )
+
+    message_id = models.CharField(max_length=128, unique=True)
+    topic_arn = models.CharField(max_length=256)
+    message = models.TextField()
+    status = models.PositiveSmallIntegerField(
+        choices=STATUS_CHOICES, default=STATUS_PENDING
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(blank=True, default='')
+
+    date_created = models.DateTimeField(auto_now_add=True)
+    date_processed = models.DateTimeField(null=True, blank=True)
+    date_claimed = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        index_together = [('status', 'topic_arn')]
+
+    def __str__(self):
+        return f'{self.topic_arn} {self.message_id}'
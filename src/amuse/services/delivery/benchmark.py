@@ -0,0 +1,253 @@
+"""
+Benchmark harness for the delivery pipeline.
+
+Generates a synthetic catalog with test factories and measures wall time,
+query count and peak Python memory of the delivery stages. Everything runs in
+one transaction that is rolled back, and S3, SQS and Zendesk are stubbed, so it
+is safe to run against a local database. Releases are encoded in the calling
+thread since encode workers use connections that cannot see the uncommitted
+catalog. Use the benchmark_delivery command.
+"""
+import random
+import time
+import tracemalloc
+from contextlib import ExitStack, contextmanager
+from unittest import mock
+
+from django.db import connection, transaction
+
+from amuse.deliveries import CHANNELS
+from amuse.models.bulk_delivery_job import BulkDeliveryJob
+from amuse.models.deliveries import Batch, BatchDelivery, BatchDeliveryRelease
+from amuse.services.delivery.encoder import release_json
+from amuse.services.delivery.helpers import deliver_batches
+from amuse.services.release_delivery_info import ReleaseDeliveryInfo
+from releases.models import Release, SongFile, Store
+
+STORE_INTERNAL_NAMES = [
+    'spotify',
+    'apple',
+    'deezer',
+    'tidal',
+    'amazon',
+    'twitch',
+    'soundcloud',
+    'youtube_music',
+]
+CHANNEL_MAP = dict(map(reversed, CHANNELS.items()))
+BENCHMARK_CHECKSUM = 'b' * 32
+
+STAGES = [
+    'release_delivery_info',
+    'release_json',
+    'deliver_batches',
+    'bulk_delivery_job',
+]
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+@contextmanager
+def stub_external_services():
+    """Stubs S3 requests, SQS messages, Zendesk syncs and delivery delays."""
+    batch_storage = Batch._meta.get_field('file').storage
+    song_file_storage = SongFile._meta.get_field('file').storage
+    with ExitStack() as stack:
+        stack.enter_context(
+            mock.patch.object(batch_storage, '_save', side_effect=lambda name, _: name)
+        )
+        stack.enter_context(
+            mock.patch.object(batch_storage, 'url', side_effect=lambda name: name)
+        )
+        stack.enter_context(
+            mock.patch.object(song_file_storage, 'size', return_value=0)
+        )
+        stack.enter_context(mock.patch('amuse.vendor.aws.sqs.send_message'))
+        stack.enter_context(mock.patch('amuse.services.delivery.helpers.sleep'))
+        stack.enter_context(mock.patch('amuse.tasks.zendesk_create_or_update_user'))
+        stack.enter_context(
+            mock.patch(
+                'amuse.services.delivery.encoder.get_verified_file_checksum',
+                return_value=(BENCHMARK_CHECKSUM, 0),
+            )
+        )
+        yield
+
+
+def generate_catalog(
+    release_count, songs_per_release, artists_per_release, stores, history
+):
+    """
+    Creates releases with songs, FLAC files, artists, cover art, stores and
+    delivery history. File fields only hold names, nothing is uploaded.
+    """
+    from amuse.tests.factories import BatchDeliveryFactory
+    from releases.tests.factories import (
+        CoverArtFactory,
+        ReleaseArtistRoleFactory,
+        ReleaseFactory,
+        ReleaseStoreDeliveryStatusFactory,
+        SongArtistRoleFactory,
+        SongFactory,
+        SongFileFactory,
+    )
+    from users.tests.factories import Artistv2Factory, UserFactory
+
+    users = [UserFactory() for _ in range(max(1, release_count // 10))]
+    artists = [
+        Artistv2Factory(owner=random.choice(users))
+        for _ in range(max(artists_per_release, release_count // 5))
+    ]
+    deliveries = {
+        store.pk: BatchDeliveryFactory(
+            channel=CHANNEL_MAP[store.internal_name],
+            status=BatchDelivery.STATUS_SUCCEEDED,
+        )
+        for store in stores
+    }
+
+    releases = []
+    for _ in range(release_count):
+        user = random.choice(users)
+        release = ReleaseFactory(user=user, status=Release.STATUS_APPROVED)
+        release_stores = random.sample(stores, random.randint(1, len(stores)))
+        release.stores.set(release_stores)
+        CoverArtFactory(
+            release=release,
+            user=user,
+            file='benchmark/cover.jpg',
+            checksum=BENCHMARK_CHECKSUM,
+        )
+
+        release_artists = random.sample(artists, artists_per_release)
+        for sequence, artist in enumerate(release_artists, start=1):
+            ReleaseArtistRoleFactory(
+                release=release,
+                artist=artist,
+                artist_sequence=sequence,
+                main_primary_artist=sequence == 1,
+            )
+
+        for _ in range(songs_per_release):
+            song = SongFactory(release=release, genre=release.genre)
+            SongFileFactory(
+                song=song,
+                type=SongFile.TYPE_FLAC,
+                file='benchmark/song.flac',
+                checksum=BENCHMARK_CHECKSUM,
+            )
+            for sequence, artist in enumerate(release_artists, start=1):
+                SongArtistRoleFactory(
+                    song=song, artist=artist, artist_sequence=sequence
+                )
+
+        for store in release_stores[:history]:
+            delivery_release = BatchDeliveryRelease.objects.create(
+                delivery=deliveries[store.pk],
+                release=release,
+                type=BatchDeliveryRelease.DELIVERY_TYPE_INSERT,
+                status=BatchDeliveryRelease.STATUS_SUCCEEDED,
+            )
+            ReleaseStoreDeliveryStatusFactory(
+                release=release, store=store, latest_delivery_log=delivery_release
+            )
+
+        releases.append(release)
+    return releases
+
+
+def measure(func, release_count):
+    """Runs func and returns its wall time, query count and peak memory."""
+    counter = QueryCounter()
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        with connection.execute_wrapper(counter):
+            func()
+        wall_time = time.perf_counter() - started
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'wall_time_s': round(wall_time, 4),
+        'queries': counter.count,
+        'queries_per_release': round(counter.count / release_count, 3),
+        'peak_memory_bytes': peak_memory,
+    }
+
+
+def _run_bulk_delivery_job(releases):
+    job = BulkDeliveryJob.objects.create(
+        input_file='benchmark/bulk_delivery_job.csv',
+        type=BulkDeliveryJob.JOB_TYPE_INSERT,
+        mode=BulkDeliveryJob.MODE_ONLY_RELEASE_STORES,
+    )
+    rows = [{'release_id': str(release.pk)} for release in releases]
+    with mock.patch.object(BulkDeliveryJob, 'iter_input_file_rows', return_value=rows):
+        job.execute()
+
+
+def run_stages(releases, stages=STAGES):
+    release_count = len(releases)
+    stage_functions = {
+        'release_delivery_info': lambda: [
+            info.get_direct_delivery_channels('insert')
+            for info in ReleaseDeliveryInfo.for_releases(releases).values()
+        ],
+        'release_json': lambda: [release_json(release) for release in releases],
+        'deliver_batches': lambda: deliver_batches(releases, 'insert', batchsize=100),
+        'bulk_delivery_job': lambda: _run_bulk_delivery_job(releases),
+    }
+    return {stage: measure(stage_functions[stage], release_count) for stage in stages}
+
+
+def run_benchmark(
+    sizes,
+    songs_per_release=2,
+    artists_per_release=2,
+    history=2,
+    stages=STAGES,
+    seed=0,
+):
+    """
+    Returns a dict with the results of every stage for every catalog size. All
+    generated data is rolled back.
+    """
+    random.seed(seed)
+    results = []
+
+    with stub_external_services():
+        for size in sizes:
+            with transaction.atomic():
+                stores = [
+                    Store.objects.get_or_create(
+                        internal_name=internal_name, defaults={'name': internal_name}
+                    )[0]
+                    for internal_name in STORE_INTERNAL_NAMES
+                ]
+                started = time.perf_counter()
+                releases = generate_catalog(
+                    size, songs_per_release, artists_per_release, stores, history
+                )
+                generation_time = time.perf_counter() - started
+                results.append(
+                    {
+                        'releases': size,
+                        'songs_per_release': songs_per_release,
+                        'artists_per_release': artists_per_release,
+                        'history_per_release': history,
+                        'generation_time_s': round(generation_time, 4),
+                        'stages': run_stages(releases, stages),
+                    }
+                )
+                transaction.set_rollback(True)
+
+    return {'results': results}
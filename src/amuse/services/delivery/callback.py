@@ -1,11 +1,13 @@
 from collections import defaultdict
 
+from django.db import transaction
 from django.utils import timezone
 from amuse.deliveries import CHANNELS
 from amuse.models.deliveries import Batch, BatchDelivery, BatchDeliveryRelease
 from amuse.services.delivery.helpers import get_taken_down_release_ids
 from amuse.vendor.fuga.fuga_api import FugaAPIClient
 from releases.models import Release, Store
+from releases.store_registry import store_registry
 from amuse.analytics import (
     segment_release_taken_down,
     segment_release_delivered,
@@ -56,97 +58,219 @@ def batch_update_handler(message):
 
 def delivery_created_handler(message):
     batch = Batch.objects.get(pk=message["batch_id"])
-    delivery = BatchDelivery.objects.create(
-        delivery_id=message["delivery_id"],
-        channel=CHANNEL_MAP[message["channel"]],
-        batch=batch,
-    )
-    for release_id, release_data in message["releases"].items():
-        release = Release.objects.get(pk=int(release_id))
-        batch_delivery_release = BatchDeliveryRelease.objects.create(
-            delivery=delivery,
-            release=release,
-            type=BATCH_DELIVERY_RELEASE_DELIVERY_TYPE_MAP[
-                release_data["delivery_type"]
-            ],
+    release_ids = [int(release_id) for release_id in message["releases"].keys()]
+    _ensure_releases_exist(release_ids)
+
+    with transaction.atomic():
+        delivery = BatchDelivery.objects.create(
+            delivery_id=message["delivery_id"],
+            channel=CHANNEL_MAP[message["channel"]],
+            batch=batch,
         )
-        release_stores = release.stores.all()
-        excluded_stores = Store.objects.exclude(
-            id__in=release_stores.values_list("id", flat=True)
+        batch_delivery_releases = BatchDeliveryRelease.objects.bulk_create(
+            [
+                BatchDeliveryRelease(
+                    delivery=delivery,
+                    release_id=int(release_id),
+                    type=BATCH_DELIVERY_RELEASE_DELIVERY_TYPE_MAP[
+                        release_data["delivery_type"]
+                    ],
+                )
+                for release_id, release_data in message["releases"].items()
+            ]
         )
-        batch_delivery_release.stores.set(release_stores)
-        batch_delivery_release.excluded_stores.set(excluded_stores)
 
-        if release_data.get("is_redelivery_for_bdr"):
-            old_bdr_id = release_data["is_redelivery_for_bdr"]
-            old_delivery = BatchDeliveryRelease.objects.get(id=old_bdr_id)
-            old_delivery.redeliveries.add(batch_delivery_release)
+        release_store_ids = defaultdict(set)
+        for release_id, store_id in Release.stores.through.objects.filter(
+            release_id__in=release_ids
+        ).values_list("release_id", "store_id"):
+            release_store_ids[release_id].add(store_id)
+        all_store_ids = store_registry.get_ids()
+
+        stores_through = BatchDeliveryRelease.stores.through
+        excluded_stores_through = BatchDeliveryRelease.excluded_stores.through
+        stores_rows = []
+        excluded_stores_rows = []
+        for batch_delivery_release in batch_delivery_releases:
+            store_ids = release_store_ids[batch_delivery_release.release_id]
+            stores_rows.extend(
+                stores_through(
+                    batchdeliveryrelease_id=batch_delivery_release.pk,
+                    store_id=store_id,
+                )
+                for store_id in store_ids
+            )
+            excluded_stores_rows.extend(
+                excluded_stores_through(
+                    batchdeliveryrelease_id=batch_delivery_release.pk,
+                    store_id=store_id,
+                )
+                for store_id in all_store_ids - store_ids
+            )
+        stores_through.objects.bulk_create(stores_rows)
+        excluded_stores_through.objects.bulk_create(excluded_stores_rows)
+
+        redeliveries = {
+            batch_delivery_release.pk: release_data["is_redelivery_for_bdr"]
+            for batch_delivery_release, release_data in zip(
+                batch_delivery_releases, message["releases"].values()
+            )
+            if release_data.get("is_redelivery_for_bdr")
+        }
+        if redeliveries:
+            old_bdr_ids = set(redeliveries.values())
+            if BatchDeliveryRelease.objects.filter(id__in=old_bdr_ids).count() != len(
+                old_bdr_ids
+            ):
+                raise BatchDeliveryRelease.DoesNotExist(
+                    "Redelivered BatchDeliveryRelease %s not found" % old_bdr_ids
+                )
+            redeliveries_through = BatchDeliveryRelease.redeliveries.through
+            redeliveries_through.objects.bulk_create(
+                [
+                    redeliveries_through(
+                        from_batchdeliveryrelease_id=old_bdr_id,
+                        to_batchdeliveryrelease_id=bdr_id,
+                    )
+                    for bdr_id, old_bdr_id in redeliveries.items()
+                ]
+            )
 
 
 def delivery_update_handler(message):
     delivery = BatchDelivery.objects.get(delivery_id=message["delivery_id"])
     delivery.status = BATCH_DELIVERY_STATUS_MAP[message["status"]]
     delivery.save()
-    for release_id, release_data in message["releases"].items():
-        delivery_release = BatchDeliveryRelease.objects.get(
-            delivery=delivery, release__pk=release_id
+
+    release_ids = [int(release_id) for release_id in message["releases"].keys()]
+    delivery_releases = {
+        delivery_release.release_id: delivery_release
+        for delivery_release in BatchDeliveryRelease.objects.filter(
+            delivery=delivery, release_id__in=release_ids
+        )
+    }
+    missing_release_ids = set(release_ids) - set(delivery_releases.keys())
+    if missing_release_ids:
+        raise BatchDeliveryRelease.DoesNotExist(
+            "BatchDeliveryRelease not found for delivery %s and releases %s"
+            % (delivery.delivery_id, missing_release_ids)
         )
+
+    for release_id, release_data in message["releases"].items():
+        delivery_release = delivery_releases[int(release_id)]
         delivery_release.status = BATCH_DELIVERY_RELEASE_STATUS_MAP[
             release_data["status"]
         ]
         if release_data["errors"]:
             delivery_release.errors = release_data["errors"]
-        delivery_release.save()
 
-        _update_release_store_delivery_status(delivery_release)
+    with transaction.atomic():
+        BatchDeliveryRelease.objects.bulk_update(
+            delivery_releases.values(), ["status", "errors"]
+        )
+        _update_release_store_delivery_statuses(
+            delivery, list(delivery_releases.values())
+        )
 
     _update_release_status(message["releases"].keys(), message['status'])
 
 
-def _update_release_store_delivery_status(delivery_release):
-    if (
-        delivery_release.status == BatchDeliveryRelease.STATUS_SUCCEEDED
+def _ensure_releases_exist(release_ids):
+    existing_release_ids = set(
+        Release.objects.filter(pk__in=release_ids).values_list("pk", flat=True)
+    )
+    missing_release_ids = set(release_ids) - existing_release_ids
+    if missing_release_ids:
+        raise Release.DoesNotExist("Releases %s not found" % missing_release_ids)
+
+
+def _get_delivery_status_stores(channel):
+    """
+    Returns the stores a successful delivery to the channel is recorded for,
+    including the bundled stores delivered through it.
+    """
+    store_internal_name = CHANNELS[channel]
+
+    if store_internal_name == "fuga":
+        # Skip creating release store delivery status entries for FUGA
+        return []
+
+    internal_names = [store_internal_name]
+    if store_internal_name == "twitch":
+        # Handle Twitch/Amazon bundling, deliveries to Twitch always include Amazon
+        internal_names.append("amazon")
+    if store_internal_name == "facebook":
+        # Handle Facebook/Instagram bundling, deliveries to Facebook always include Instagram
+        internal_names.append("instagram")
+
+    stores = [
+        store_registry.get_by_internal_name(internal_name)
+        for internal_name in internal_names
+    ]
+    missing_internal_names = [
+        internal_name
+        for internal_name, store in zip(internal_names, stores)
+        if store is None
+    ]
+    if missing_internal_names:
+        raise Store.DoesNotExist("Stores %s not found" % set(missing_internal_names))
+
+    return stores
+
+
+def _update_release_store_delivery_statuses(delivery, delivery_releases):
+    delivery_releases = [
+        delivery_release
+        for delivery_release in delivery_releases
+        if delivery_release.status == BatchDeliveryRelease.STATUS_SUCCEEDED
         and delivery_release.type
         in [
             BatchDeliveryRelease.DELIVERY_TYPE_INSERT,
             BatchDeliveryRelease.DELIVERY_TYPE_TAKEDOWN,
             BatchDeliveryRelease.DELIVERY_TYPE_PRO_TAKEDOWN,
         ]
-    ):
-        store_internal_name = CHANNELS[delivery_release.delivery.channel]
+    ]
+    if not delivery_releases:
+        return
 
-        if store_internal_name == "fuga":
-            # Skip creating release store delivery status entries for FUGA
-            return
+    stores = _get_delivery_status_stores(delivery.channel)
+    if not stores:
+        return
 
-        store = Store.objects.get(internal_name=store_internal_name)
-        defaults = {
-            "status": BATCH_DELIVERY_RELEASE_TYPE_TO_RELEASE_DELIVERY_STATUS_MAP[
-                delivery_release.type
-            ],
-            "latest_delivery_log": delivery_release,
-            "delivered_at": timezone.now(),
-        }
-
-        ReleaseStoreDeliveryStatus.objects.update_or_create(
-            release_id=delivery_release.release.id, store=store, defaults=defaults
+    now = timezone.now()
+    existing_statuses = {
+        (status.release_id, status.store_id): status
+        for status in ReleaseStoreDeliveryStatus.objects.filter(
+            release_id__in=[dr.release_id for dr in delivery_releases], store__in=stores
         )
+    }
+    statuses_to_update = []
+    statuses_to_create = []
 
-        if store_internal_name == "twitch":
-            # Handle Twitch/Amazon bundling, deliveries to Twitch always include Amazon
-            ReleaseStoreDeliveryStatus.objects.update_or_create(
-                release_id=delivery_release.release.id,
-                store=Store.objects.get(internal_name="amazon"),
-                defaults=defaults,
-            )
+    for delivery_release in delivery_releases:
+        for store in stores:
+            status = existing_statuses.get((delivery_release.release_id, store.id))
+            if status is None:
+                status = ReleaseStoreDeliveryStatus(
+                    release_id=delivery_release.release_id,
+                    store=store,
+                )
+                statuses_to_create.append(status)
+            else:
+                statuses_to_update.append(status)
 
-        if store_internal_name == "facebook":
-            # Handle Facebook/Instagram bundling, deliveries to Facebook always include Instagram
-            ReleaseStoreDeliveryStatus.objects.update_or_create(
-                release_id=delivery_release.release.id,
-                store=Store.objects.get(internal_name="instagram"),
-                defaults=defaults,
-            )
+            status.status = BATCH_DELIVERY_RELEASE_TYPE_TO_RELEASE_DELIVERY_STATUS_MAP[
+                delivery_release.type
+            ]
+            status.latest_delivery_log = delivery_release
+            status.delivered_at = now
+            status.updated_at = now
+
+    ReleaseStoreDeliveryStatus.objects.bulk_update(
+        statuses_to_update,
+        ["status", "latest_delivery_log", "delivered_at", "updated_at"],
+    )
+    ReleaseStoreDeliveryStatus.objects.bulk_create(statuses_to_create)
 
 
 def _update_release_status(release_ids, status):
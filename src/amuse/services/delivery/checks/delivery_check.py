@@ -14,3 +14,17 @@ class DeliveryCheck(ABC):
     @abstractmethod
     def passing(self) -> bool:
         raise NotImplementedError()
+
+    @classmethod
+    def failing_release_ids(cls, releases: list, store: Store, operation: str) -> set:
+        """
+        Returns the ids of the releases not passing this check.
+
+        Falls back to evaluating each release on its own, checks that can be
+        answered for the whole list of releases at once override this.
+        """
+        return {
+            release.pk
+            for release in releases
+            if not cls(release=release, store=store, operation=operation).passing()
+        }
@@ -9,3 +9,12 @@ class ExplicitReleaseCheck(DeliveryCheck):
         return not any(
             s.explicit == Song.EXPLICIT_TRUE for s in self.release.songs.all()
         )
+
+    @classmethod
+    def failing_release_ids(cls, releases: list, store, operation: str) -> set:
+        return set(
+            Song.objects.filter(
+                release_id__in=[release.pk for release in releases],
+                explicit=Song.EXPLICIT_TRUE,
+            ).values_list('release_id', flat=True)
+        )
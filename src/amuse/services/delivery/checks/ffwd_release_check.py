@@ -1,4 +1,5 @@
 from amuse.services.delivery.checks.delivery_check import DeliveryCheck
+from releases.models import RoyaltySplit
 
 
 class FFWDReleaseCheck(DeliveryCheck):
@@ -8,3 +9,14 @@ class FFWDReleaseCheck(DeliveryCheck):
         if self.operation == 'takedown':
             return not self.release.has_locked_splits()
         return True
+
+    @classmethod
+    def failing_release_ids(cls, releases: list, store, operation: str) -> set:
+        if operation != 'takedown':
+            return set()
+        return set(
+            RoyaltySplit.objects.filter(
+                song__release_id__in=[release.pk for release in releases],
+                is_locked=True,
+            ).values_list('song__release_id', flat=True)
+        )
@@ -1,4 +1,5 @@
 from amuse.services.delivery.checks.delivery_check import DeliveryCheck
+from releases.models import RoyaltySplit
 
 
 class FFWDUserCheck(DeliveryCheck):
@@ -8,3 +9,17 @@ class FFWDUserCheck(DeliveryCheck):
         if self.operation == 'takedown':
             return not self.release.user.has_locked_splits()
         return True
+
+    @classmethod
+    def failing_release_ids(cls, releases: list, store, operation: str) -> set:
+        if operation != 'takedown':
+            return set()
+        locked_user_ids = set(
+            RoyaltySplit.objects.filter(
+                user_id__in={release.user_id for release in releases},
+                is_locked=True,
+            ).values_list('user_id', flat=True)
+        )
+        return {
+            release.pk for release in releases if release.user_id in locked_user_ids
+        }
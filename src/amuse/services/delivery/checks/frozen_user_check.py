@@ -1,4 +1,5 @@
 from amuse.services.delivery.checks.delivery_check import DeliveryCheck
+from releases.models import Release
 
 
 class FrozenUserCheck(DeliveryCheck):
@@ -8,3 +9,13 @@ class FrozenUserCheck(DeliveryCheck):
         if self.operation in ['insert', 'update']:
             return not self.release.user.is_frozen
         return True
+
+    @classmethod
+    def failing_release_ids(cls, releases: list, store, operation: str) -> set:
+        if operation not in ['insert', 'update']:
+            return set()
+        return set(
+            Release.objects.filter(
+                pk__in=[release.pk for release in releases], user__is_frozen=True
+            ).values_list('pk', flat=True)
+        )
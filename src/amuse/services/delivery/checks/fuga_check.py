@@ -13,3 +13,15 @@ class FugaCheck(DeliveryCheck):
         ):
             return False
         return True
+
+    @classmethod
+    def failing_release_ids(cls, releases: list, store, operation: str) -> set:
+        if not store.fuga_store:
+            return set()
+        return set(
+            ReleaseStoreDeliveryStatus.objects.filter(
+                release_id__in=[release.pk for release in releases],
+                fuga_store=store.fuga_store,
+                status=ReleaseStoreDeliveryStatus.STATUS_DELIVERED,
+            ).values_list('release_id', flat=True)
+        )
@@ -15,3 +15,17 @@ class IsLiveOnStoreCheck(DeliveryCheck):
                 status=ReleaseStoreDeliveryStatus.STATUS_DELIVERED,
             ).exists()
         return True
+
+    @classmethod
+    def failing_release_ids(cls, releases: list, store, operation: str) -> set:
+        if operation not in ['update', 'takedown']:
+            return set()
+        release_ids = {release.pk for release in releases}
+        live_release_ids = set(
+            ReleaseStoreDeliveryStatus.objects.filter(
+                release_id__in=release_ids,
+                store=store,
+                status=ReleaseStoreDeliveryStatus.STATUS_DELIVERED,
+            ).values_list('release_id', flat=True)
+        )
+        return release_ids - live_release_ids
@@ -1,4 +1,5 @@
 from amuse.services.delivery.checks.delivery_check import DeliveryCheck
+from releases.models import Release
 from users.models import User
 
 
@@ -14,3 +15,14 @@ class LicensedCheck(DeliveryCheck):
         ):
             return False
         return True
+
+    @classmethod
+    def failing_release_ids(cls, releases: list, store, operation: str) -> set:
+        if operation != 'takedown':
+            return set()
+        return set(
+            Release.objects.filter(
+                pk__in=[release.pk for release in releases],
+                user__category=User.CATEGORY_PRIORITY,
+            ).values_list('pk', flat=True)
+        )
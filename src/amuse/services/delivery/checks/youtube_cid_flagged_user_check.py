@@ -1,5 +1,5 @@
 from amuse.services.delivery.checks.delivery_check import DeliveryCheck
-from releases.models import Song
+from releases.models import Release
 from users.models import User
 
 
@@ -10,3 +10,14 @@ class YoutubeCIDFlaggedUserCheck(DeliveryCheck):
         if self.operation == 'insert':
             return self.release.user.category != User.CATEGORY_FLAGGED
         return True
+
+    @classmethod
+    def failing_release_ids(cls, releases: list, store, operation: str) -> set:
+        if operation != 'insert':
+            return set()
+        return set(
+            Release.objects.filter(
+                pk__in=[release.pk for release in releases],
+                user__category=User.CATEGORY_FLAGGED,
+            ).values_list('pk', flat=True)
+        )
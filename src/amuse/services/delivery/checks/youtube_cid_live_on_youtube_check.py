@@ -1,5 +1,13 @@
 from amuse.services.delivery.checks.delivery_check import DeliveryCheck
 from releases.models import ReleaseStoreDeliveryStatus, Store
+from releases.store_registry import store_registry
+
+
+def _get_youtube_music_store():
+    store = store_registry.get_by_internal_name('youtube_music')
+    if store is None:
+        raise Store.DoesNotExist('youtube_music store not found')
+    return store
 
 
 class YoutubeCIDLiveOnYouTubeCheck(DeliveryCheck):
@@ -9,10 +17,25 @@ class YoutubeCIDLiveOnYouTubeCheck(DeliveryCheck):
 
     def passing(self) -> bool:
         if self.operation == 'insert':
-            youtube_music_store = Store.objects.get(internal_name='youtube_music')
+            youtube_music_store = _get_youtube_music_store()
             return ReleaseStoreDeliveryStatus.objects.filter(
                 release=self.release,
                 store=youtube_music_store,
                 status=ReleaseStoreDeliveryStatus.STATUS_DELIVERED,
             ).exists()
         return True
+
+    @classmethod
+    def failing_release_ids(cls, releases: list, store, operation: str) -> set:
+        if operation != 'insert':
+            return set()
+        youtube_music_store = _get_youtube_music_store()
+        release_ids = {release.pk for release in releases}
+        live_release_ids = set(
+            ReleaseStoreDeliveryStatus.objects.filter(
+                release_id__in=release_ids,
+                store=youtube_music_store,
+                status=ReleaseStoreDeliveryStatus.STATUS_DELIVERED,
+            ).values_list('release_id', flat=True)
+        )
+        return release_ids - live_release_ids
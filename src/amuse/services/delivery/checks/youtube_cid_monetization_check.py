@@ -12,3 +12,16 @@ class YoutubeCIDMonetizationCheck(DeliveryCheck):
                 for s in self.release.songs.all()
             )
         return True
+
+    @classmethod
+    def failing_release_ids(cls, releases: list, store, operation: str) -> set:
+        if operation != 'insert':
+            return set()
+        release_ids = {release.pk for release in releases}
+        monetized_release_ids = set(
+            Song.objects.filter(
+                release_id__in=release_ids,
+                youtube_content_id=Song.YT_CONTENT_ID_MONETIZE,
+            ).values_list('release_id', flat=True)
+        )
+        return release_ids - monetized_release_ids
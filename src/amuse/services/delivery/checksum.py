@@ -0,0 +1,102 @@
+import hashlib
+
+from django.core.cache import cache
+from storages.utils import clean_name
+
+from amuse.logging import logger
+
+BYTES_SKIPPED_CACHE_KEY = 'delivery:checksum:bytes_skipped'
+CHUNK_SIZE = 1 * 2**20
+
+
+def _checksum_cache_key(bucket_name, key, etag, size):
+    return f'delivery:checksum:{bucket_name}:{key}:{etag}:{size}'
+
+
+def _get_object_key(file):
+    """Returns the key of the file in its bucket, including the storage location."""
+    return file.storage._normalize_name(clean_name(file.name))
+
+
+def _calculate_object_checksum(body):
+    file_hash = hashlib.md5()
+    for chunk in body.iter_chunks(CHUNK_SIZE):
+        file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def _get_stored_checksum(instance, etag, size):
+    if (
+        instance.checksum
+        and instance.checksum_etag == etag
+        and instance.checksum_size == size
+    ):
+        return instance.checksum
+    return None
+
+
+def _store_verified_object(instance, etag, size):
+    type(instance).objects.filter(pk=instance.pk, checksum=instance.checksum).update(
+        checksum_etag=etag, checksum_size=size
+    )
+    instance.checksum_etag = etag
+    instance.checksum_size = size
+
+
+def get_verified_file_checksum(file):
+    """
+    Returns a tuple (md5 checksum, size) for a django file stored on S3.
+
+    Only a HEAD request is made when the ETag and size of the object match the ones
+    its row's checksum was verified against, or the ones of a checksum in the cache.
+    Otherwise the object is pulled from S3 and hashed, and the ETag and size of the
+    GetObject response are stored on the row when the checksum matches it.
+    """
+    instance = file.instance
+    bucket_name = file.storage.bucket_name
+    key = _get_object_key(file)
+    s3_object = file.storage.bucket.Object(key)
+    etag = s3_object.e_tag
+    size = s3_object.content_length
+
+    checksum = cache.get(_checksum_cache_key(bucket_name, key, etag, size))
+    if checksum is None:
+        checksum = _get_stored_checksum(instance, etag, size)
+        if checksum is not None:
+            cache.set(_checksum_cache_key(bucket_name, key, etag, size), checksum)
+    if checksum is not None:
+        _add_bytes_skipped(size)
+        return checksum, size
+
+    response = s3_object.get()
+    etag = response['ETag']
+    size = response['ContentLength']
+    checksum = _calculate_object_checksum(response['Body'])
+    cache.set(_checksum_cache_key(bucket_name, key, etag, size), checksum)
+    if checksum == instance.checksum:
+        _store_verified_object(instance, etag, size)
+    logger.info(
+        'Calculated checksum %s for %s with ETag %s and size %s',
+        checksum,
+        key,
+        etag,
+        size,
+    )
+
+    return checksum, size
+
+
+def get_bytes_skipped():
+    return cache.get(BYTES_SKIPPED_CACHE_KEY, 0)
+
+
+def _add_bytes_skipped(size):
+    cache.add(BYTES_SKIPPED_CACHE_KEY, 0, timeout=None)
+    try:
+        cache.incr(BYTES_SKIPPED_CACHE_KEY, size)
+    except ValueError:
+        # Key was evicted between add() and incr()
+        cache.set(BYTES_SKIPPED_CACHE_KEY, size, timeout=None)
+    else:
+        # incr() sets the default timeout with the database cache
+        cache.touch(BYTES_SKIPPED_CACHE_KEY, None)
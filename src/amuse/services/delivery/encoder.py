@@ -2,8 +2,8 @@ from collections import defaultdict
 
 from django.conf import settings
 
+from amuse.services.delivery.checksum import get_verified_file_checksum
 from amuse.services.release_delivery_info import ReleaseDeliveryInfo
-from amuse.tasks import _calculate_django_file_checksum
 from amuse.vendor.aws import s3
 from releases.models import SongArtistRole, FugaMetadata
 from releases.models.fuga_metadata import FugaStore
@@ -20,7 +20,7 @@ def release_json(release, check_empty_checksum=True) -> dict:
     label_name = default_label_name(release)
     original_release_date = default_original_release_date(release)
     main_genre, sub_genre = split_genres(release.genre)
-    checksum = _calculate_django_file_checksum(release.cover_art.file)
+    checksum, cover_art_size = get_verified_file_checksum(release.cover_art.file)
     is_fuga_release = FugaMetadata.objects.filter(release=release).first()
 
     if checksum != release.cover_art.checksum:
@@ -37,7 +37,7 @@ def release_json(release, check_empty_checksum=True) -> dict:
             ),
             'md5': release.cover_art.checksum,
             'proprietary_id': release.cover_art.pk,
-            'size': release.cover_art.file.size,
+            'size': cover_art_size,
         },
         'asset_labels': release_asset_labels_json(release),
         'cline_text': label_name,
@@ -2,12 +2,14 @@ import json
 import math
 import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep
 from uuid import uuid4
 
 from django.conf import settings
 from django.core.cache import cache
 from django.core.files.base import ContentFile
+from django.db import connection
 from django.db.models import Q
 
 from amuse.logging import logger
@@ -54,11 +56,17 @@ def create_batch_delivery_releases_list(
     override_stores: bool = False,
     stores: list = None,
     only_fuga: bool = False,
+    encode_workers: int = None,
 ) -> list:
     if override_stores and stores:
         raise ValueError("Can't specify both override_stores and stores")
 
+    releases = list(releases)
     releases_list = []
+    delivery_infos = {}
+
+    if not override_stores and not stores:
+        delivery_infos = ReleaseDeliveryInfo.for_releases(releases)
 
     for release in releases:
         if override_stores:
@@ -73,12 +81,12 @@ def create_batch_delivery_releases_list(
             # for fuga channels we pass in "full_update" instead of "update" to maintain
             # legacy behaviour (update would return no stores as fuga only supports full updates)
             store_list = list(
-                ReleaseDeliveryInfo(release).get_fuga_delivery_channels(
+                delivery_infos[release.pk].get_fuga_delivery_channels(
                     "full_update" if delivery_type == "update" else delivery_type
                 )
             )
         else:
-            release_delivery_info = ReleaseDeliveryInfo(release)
+            release_delivery_info = delivery_infos[release.pk]
             store_list = release_delivery_info.get_direct_delivery_channels(
                 delivery_type
             ) + release_delivery_info.get_fuga_delivery_channels(
@@ -97,13 +105,48 @@ def create_batch_delivery_releases_list(
                         release, "is_redelivery_for_bdr", None
                     ),
                 },
-                "release": release_json(release),
             }
         )
 
+    for release_dict, encoded_release in zip(
+        releases_list, encode_releases(releases, encode_workers)
+    ):
+        release_dict["release"] = encoded_release
+
     return releases_list
 
 
+def encode_releases(releases, workers=None):
+    """
+    Returns release_json for each release, in the same order as the releases.
+
+    With more than one worker the releases are split between a bounded pool of
+    threads. Every worker thread uses its own database connection which is
+    closed once the thread has encoded its share of the releases. The first
+    encoding error is re-raised.
+    """
+    if not workers or workers <= 1 or len(releases) <= 1:
+        return [release_json(release) for release in releases]
+
+    workers = min(workers, len(releases))
+    encoded_releases = [None] * len(releases)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_encode_releases_in_thread, releases[i::workers])
+            for i in range(workers)
+        ]
+        for i, future in enumerate(futures):
+            encoded_releases[i::workers] = future.result()
+    return encoded_releases
+
+
+def _encode_releases_in_thread(releases):
+    try:
+        return [release_json(release) for release in releases]
+    finally:
+        connection.close()
+
+
 def mark_delivery_started(delivery_data):
     for data in delivery_data:
         release_id = data['release']['id']
@@ -131,6 +174,7 @@ def deliver_batches(
     dryrun=False,
     job=None,
     user=None,
+    encode_workers=None,
 ):
     all_releases_list = list(releases)
     releases_count = len(all_releases_list)
@@ -179,6 +223,7 @@ def deliver_batches(
                 override_stores=override_stores,
                 only_fuga=only_fuga,
                 stores=stores or [],
+                encode_workers=encode_workers,
             )
         except Exception:
             # This is normally reached when there is an issue with a release within
@@ -207,6 +252,7 @@ def deliver_batches(
                         override_stores=override_stores,
                         only_fuga=only_fuga,
                         stores=stores or [],
+                        encode_workers=encode_workers,
                     )
                 except ValueError:
                     # ValueError is thrown for invalid checksum
@@ -271,16 +317,22 @@ def get_non_delivered_dd_stores(releases, stores=None):
         Retrieve DD stores that haven't been delivered to for a list of releases
     """
     store_releases = defaultdict(list)
+    releases = list(releases)
+    delivery_infos = ReleaseDeliveryInfo.for_releases(releases)
+    taken_down_release_ids = set(
+        ReleaseStoreDeliveryStatus.objects.filter(
+            status=ReleaseStoreDeliveryStatus.STATUS_TAKEDOWN,
+            release_id__in=delivery_infos.keys(),
+        ).values_list("release_id", flat=True)
+    )
 
     for release in releases:
-        delivery_info = ReleaseDeliveryInfo(release)
-
         # If partially taken-down skip release as we cannot tell if the non-delivered stores should be delivered to
-        if ReleaseStoreDeliveryStatus.objects.filter(
-            status=ReleaseStoreDeliveryStatus.STATUS_TAKEDOWN, release=release
-        ).exists():
+        if release.pk in taken_down_release_ids:
             continue
 
+        delivery_info = delivery_infos[release.pk]
+
         for store_info in delivery_info.store_delivery_info:
             if stores and store_info['channel_name'] not in stores:
                 continue
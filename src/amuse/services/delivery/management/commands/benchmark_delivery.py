@@ -0,0 +1,98 @@
+import json
+import sys
+from contextlib import redirect_stdout
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from amuse.services.delivery.benchmark import STAGES, run_benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the delivery pipeline against synthetic catalogs. All generated "
+        "data is rolled back and S3/SQS are stubbed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=[100, 1000],
+            help="Space-separated number of releases per catalog",
+        )
+        parser.add_argument("--songs", type=int, default=2, help="Songs per release")
+        parser.add_argument(
+            "--artists", type=int, default=2, help="Artists per release and song"
+        )
+        parser.add_argument(
+            "--history",
+            type=int,
+            default=2,
+            help="Delivered stores with delivery history per release",
+        )
+        parser.add_argument(
+            "--stages",
+            type=str,
+            nargs="+",
+            choices=STAGES,
+            default=STAGES,
+            help="Space-separated stages to run",
+        )
+        parser.add_argument(
+            "--output", type=str, default=None, help="Write the JSON results to file"
+        )
+        parser.add_argument(
+            "--max-queries-per-release",
+            type=float,
+            default=None,
+            help="Fail when any stage runs more queries per release than this",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            default=False,
+            help="Run even when DEBUG is off",
+        )
+
+    def handle(self, *args, **kwargs):
+        if not settings.DEBUG and not kwargs["force"]:
+            raise CommandError(
+                "Only run the benchmark against a local database, use --force to "
+                "run it with DEBUG off"
+            )
+
+        # Keep the progress output of the delivery helpers out of the results
+        with redirect_stdout(sys.stderr):
+            results = run_benchmark(
+                kwargs["sizes"],
+                songs_per_release=kwargs["songs"],
+                artists_per_release=kwargs["artists"],
+                history=kwargs["history"],
+                stages=kwargs["stages"],
+                seed=kwargs["seed"],
+            )
+        output = json.dumps(results, indent=2)
+
+        if kwargs["output"]:
+            with open(kwargs["output"], "w") as f:
+                f.write(output)
+        else:
+            self.stdout.write(output)
+
+        max_queries_per_release = kwargs["max_queries_per_release"]
+        if max_queries_per_release is not None:
+            exceeded = [
+                f"{stage} at {result['releases']} releases: "
+                f"{stage_result['queries_per_release']}"
+                for result in results["results"]
+                for stage, stage_result in result["stages"].items()
+                if stage_result["queries_per_release"] > max_queries_per_release
+            ]
+            if exceeded:
+                raise CommandError(
+                    "Queries per release above %s: %s"
+                    % (max_queries_per_release, ", ".join(exceeded))
+                )
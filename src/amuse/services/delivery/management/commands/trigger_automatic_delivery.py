@@ -104,6 +104,12 @@ class Command(BaseCommand):
             nargs="+",
             help="Only process releases approved by these space-separated user_ids.",
         )
+        parser.add_argument(
+            "--encode-workers",
+            type=int,
+            default=None,
+            help="Encode the releases of each batch concurrently with this many workers",
+        )
 
     def handle(self, *args, **kwargs):
         start_time = timezone.now()
@@ -119,6 +125,7 @@ class Command(BaseCommand):
         user_id = kwargs["user_id"]
         days = kwargs["days"]
         agent_ids = kwargs["agent_ids"]
+        encode_workers = kwargs["encode_workers"]
 
         job_id = "Automatic delivery job [%s] %s:" % (status, str(uuid4()))
 
@@ -157,7 +164,7 @@ class Command(BaseCommand):
 
         stores_releases = get_non_delivered_dd_stores(releases, stores)
         results = self.process_releases(
-            user_id, stores_releases, batchsize, delay, dryrun
+            user_id, stores_releases, batchsize, delay, dryrun, encode_workers
         )
 
         logger.info(
@@ -221,7 +228,9 @@ class Command(BaseCommand):
 
         return filter_kwargs
 
-    def process_releases(self, user_id, stores_releases, batchsize, delay, dryrun):
+    def process_releases(
+        self, user_id, stores_releases, batchsize, delay, dryrun, encode_workers=None
+    ):
         user = User.objects.get(id=user_id) if user_id else None
         results = []
 
@@ -245,6 +254,7 @@ class Command(BaseCommand):
                 delay=delay,
                 dryrun=dryrun,
                 user=user,
+                encode_workers=encode_workers,
             )
 
         return results
@@ -65,6 +65,12 @@ class Command(BaseCommand):
             default=None,
             help="Specify the ID of the user who is triggering this delivery",
         )
+        parser.add_argument(
+            "--encode-workers",
+            type=int,
+            default=None,
+            help="Encode the releases of each batch concurrently with this many workers",
+        )
 
     def handle(self, *args, **kwargs):
         start_time = datetime.now()
@@ -78,6 +84,7 @@ class Command(BaseCommand):
         delay = kwargs["delay"]
         dryrun = kwargs["dryrun"]
         user_id = kwargs["user_id"]
+        encode_workers = kwargs["encode_workers"]
 
         if not release_ids:
             self.stdout.write("You need to specify release_ids")
@@ -99,6 +106,7 @@ class Command(BaseCommand):
             delay=delay,
             dryrun=dryrun,
             user=user,
+            encode_workers=encode_workers,
         )
 
         self.stdout.write("Time to process: %s" % (datetime.now() - start_time))
@@ -56,6 +56,12 @@ class Command(BaseCommand):
             default=100,
             help="Specify number of releases to run for",
         )
+        parser.add_argument(
+            "--encode-workers",
+            type=int,
+            default=None,
+            help="Encode the releases of each batch concurrently with this many workers",
+        )
 
     def handle(self, *args, **kwargs):
         start_time = datetime.now()
@@ -67,6 +73,7 @@ class Command(BaseCommand):
         dryrun = kwargs["dryrun"]
         user_id = kwargs["user_id"]
         limit = kwargs['limit']
+        encode_workers = kwargs["encode_workers"]
 
         bdrs_by_channel_and_type = self.get_bdrs_by_channel_and_type(
             bdr_id_start, bdr_id_end, limit
@@ -98,6 +105,7 @@ class Command(BaseCommand):
             "delay": delay,
             "dryrun": dryrun,
             "user": user,
+            "encode_workers": encode_workers,
         }
         bdr_ids = []
 
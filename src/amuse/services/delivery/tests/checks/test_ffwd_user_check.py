@@ -41,3 +41,15 @@ class TestFFWDUserCheck(TestCase):
             release=self.release, store=self.spotify_store, operation='takedown'
         )
         self.assertFalse(check.passing())
+
+    def test_failing_release_ids(self):
+        RoyaltySplit.objects.filter(song=self.song, user=self.release.user).update(
+            is_locked=True
+        )
+        other_release = generate_releases(1, Release.STATUS_APPROVED)[0]
+
+        failing_release_ids = FFWDUserCheck.failing_release_ids(
+            [self.release, other_release], self.spotify_store, 'takedown'
+        )
+
+        self.assertEqual(failing_release_ids, {self.release.pk})
@@ -62,3 +62,24 @@ class TestIsLiveOnStoreCheck(TestCase):
             release=self.release, store=self.spotify_store, operation='update'
         )
         self.assertTrue(check.passing())
+
+    def test_failing_release_ids_for_takedown(self):
+        live_release = generate_releases(1, Release.STATUS_APPROVED)[0]
+        ReleaseStoreDeliveryStatusFactory(
+            release=live_release,
+            store=self.spotify_store,
+            status=ReleaseStoreDeliveryStatus.STATUS_DELIVERED,
+        )
+
+        failing_release_ids = IsLiveOnStoreCheck.failing_release_ids(
+            [self.release, live_release], self.spotify_store, 'takedown'
+        )
+
+        self.assertEqual(failing_release_ids, {self.release.pk})
+
+    def test_failing_release_ids_for_insert(self):
+        failing_release_ids = IsLiveOnStoreCheck.failing_release_ids(
+            [self.release], self.spotify_store, 'insert'
+        )
+
+        self.assertEqual(failing_release_ids, set())
@@ -0,0 +1,58 @@
+import json
+import tempfile
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from amuse.services.delivery.benchmark import run_benchmark
+from releases.models import Release
+
+
+class DeliveryBenchmarkTestCase(TestCase):
+    def test_run_benchmark_reports_stages_and_rolls_back(self):
+        results = run_benchmark([3], stages=['release_delivery_info', 'release_json'])
+
+        [result] = results['results']
+        assert result['releases'] == 3
+        assert set(result['stages']) == {'release_delivery_info', 'release_json'}
+        for stage_result in result['stages'].values():
+            assert stage_result['queries'] > 0
+            assert stage_result['queries_per_release'] == round(
+                stage_result['queries'] / 3, 3
+            )
+            assert stage_result['peak_memory_bytes'] > 0
+        assert not Release.objects.exists()
+
+    def test_command_writes_json_output(self):
+        with tempfile.NamedTemporaryFile(suffix='.json') as f:
+            call_command(
+                'benchmark_delivery',
+                '--sizes',
+                '2',
+                '--stages',
+                'release_delivery_info',
+                '--output',
+                f.name,
+                '--force',
+            )
+            results = json.load(f)
+
+        assert results['results'][0]['releases'] == 2
+
+    def test_command_fails_above_max_queries_per_release(self):
+        with self.assertRaises(CommandError):
+            call_command(
+                'benchmark_delivery',
+                '--sizes',
+                '2',
+                '--stages',
+                'release_json',
+                '--max-queries-per-release',
+                '0',
+                '--force',
+            )
+
+    def test_command_requires_debug_or_force(self):
+        with self.assertRaises(CommandError):
+            call_command('benchmark_delivery', '--sizes', '2')
@@ -21,7 +21,7 @@ from releases.tests.factories import (
     ReleaseArtistRoleFactory,
     SongFactory,
 )
-from users.tests.factories import Artistv2Factory
+from users.tests.factories import Artistv2Factory, UserFactory
 
 absolute_src_path = pathlib.Path(__file__).parent.resolve()
 
@@ -258,6 +258,46 @@ def test_execute_with_explicit_release_track_to_tencent():
     assert job.description == 'Job completed'
 
 
+@pytest.mark.django_db
+def test_perform_checks_prevents_failing_releases_with_one_update_per_reason():
+    tencent = StoreFactory(name="Tencent", internal_name="tencent", org_id=11)
+    job = BulkDeliveryJobFactory(type=BulkDeliveryJob.JOB_TYPE_INSERT)
+    job.store = tencent
+
+    releases = generate_releases(3, Release.STATUS_APPROVED)
+    explicit_releases = releases[:2]
+    Song.objects.filter(release__in=explicit_releases).update(
+        explicit=Song.EXPLICIT_TRUE
+    )
+    BulkDeliveryJobResult.objects.bulk_create(
+        [
+            BulkDeliveryJobResult(
+                job=job,
+                release=release,
+                status=BulkDeliveryJobResult.STATUS_UNPROCESSED,
+            )
+            for release in releases
+        ]
+    )
+
+    with mock.patch.object(
+        BulkDeliveryJobResult.objects,
+        'filter',
+        wraps=BulkDeliveryJobResult.objects.filter,
+    ) as mock_filter:
+        cleared_releases = job.perform_checks('tencent', releases)
+
+    assert cleared_releases == releases[2:]
+    assert mock_filter.call_count == 1
+    assert BulkDeliveryJobResult.objects.filter(
+        job=job,
+        release__in=explicit_releases,
+        status=BulkDeliveryJobResult.STATUS_PREVENTED,
+        description='Prevented because the release contains an explicit track',
+        store=tencent,
+    ).count() == len(explicit_releases)
+
+
 @pytest.mark.django_db
 def test_get_checks_after_override():
     youtube_cid = StoreFactory(
@@ -317,6 +357,60 @@ def test_get_release_and_song_ids_with_isrcs():
     assert releases == [release_1.id]
 
 
+@pytest.mark.django_db
+@mock.patch('amuse.tasks.zendesk_create_or_update_user', mock.Mock())
+def test_get_release_and_song_ids_with_user_emails():
+    store = StoreFactory(internal_name='spotify')
+    user_1 = UserFactory(email='First.User@example.com')
+    user_2 = UserFactory(email='second.user@example.com')
+    release_1 = ReleaseFactory(user=user_1)
+    release_2 = ReleaseFactory(user=user_2)
+    ReleaseFactory()
+
+    job = BulkDeliveryJob(
+        input_file=ContentFile(
+            content=(
+                "user_email\n"
+                "first.user@example.com\n"
+                "Second.user@example.com\n"
+                "\n"
+                "unknown@example.com\n"
+            ).encode('utf-8'),
+            name="simple.csv",
+        ),
+        type=BulkDeliveryJob.JOB_TYPE_INSERT,
+    )
+    job.store = store
+    job.save()
+
+    with mock.patch('amuse.models.bulk_delivery_job.logger.info') as mock_logger:
+        songs, releases = job.get_release_and_song_ids()
+
+    assert songs == []
+    assert releases == sorted([release_1.id, release_2.id])
+    mock_logger.assert_called_once()
+    assert 'unknown@example.com' in mock_logger.call_args[0][0]
+
+
+@pytest.mark.django_db
+def test_get_release_and_song_ids_resolves_in_chunks():
+    store = StoreFactory(internal_name='unlimited_dsp')
+    job = BulkDeliveryJob(
+        input_file=load_fixture("simple.csv"), type=BulkDeliveryJob.JOB_TYPE_INSERT
+    )
+    job.store = store
+    job.save()
+    job.INPUT_CHUNK_SIZE = 2
+
+    with mock.patch.object(
+        job, '_resolve_release_ids', wraps=job._resolve_release_ids
+    ) as mock_resolve:
+        songs, releases = job.get_release_and_song_ids()
+
+    assert mock_resolve.call_count == 5
+    assert len(releases) == 9
+
+
 @pytest.mark.django_db
 def test_execute_youtube_CID_change_for_isrc():
     store = StoreFactory(name='youtube_content_id', internal_name='youtube_content_id')
@@ -4,13 +4,16 @@ from unittest.mock import patch
 import responses
 from datetime import datetime, timezone
 
+from django.db import connection
 from django.test import TestCase
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from freezegun import freeze_time
 
 from amuse.deliveries import CHANNELS
 from amuse.models.deliveries import BatchDelivery, BatchDeliveryRelease
 from amuse.services.delivery.callback import (
+    _update_release_store_delivery_statuses,
     delivery_update_handler,
     get_taken_down_release_ids,
 )
@@ -24,6 +27,7 @@ from amuse.vendor.fuga.fuga_api import FugaAPIClient
 from releases.models import Release, ReleaseArtistRole
 from releases.models.fuga_metadata import FugaMetadata
 from releases.models.release_store_delivery_status import ReleaseStoreDeliveryStatus
+from releases.store_registry import store_registry
 from releases.tests.factories import (
     ReleaseArtistRoleFactory,
     ReleaseFactory,
@@ -692,6 +696,47 @@ class TestDeliveryCallback(TestCase):
             == 1
         )
 
+    def test_release_store_delivery_statuses_are_upserted_in_bulk(self):
+        batch_delivery = BatchDeliveryFactory(
+            channel=CHANNEL_MAP[self.twitch.internal_name]
+        )
+        releases = [self.release] + [ReleaseFactory() for _ in range(2)]
+        delivery_releases = [
+            BatchDeliveryReleaseFactory(
+                delivery=batch_delivery,
+                release=release,
+                type=BatchDeliveryRelease.DELIVERY_TYPE_INSERT,
+                status=BatchDeliveryRelease.STATUS_SUCCEEDED,
+            )
+            for release in releases
+        ]
+        ReleaseStoreDeliveryStatusFactory(
+            release=self.release,
+            store=self.amazon,
+            status=ReleaseStoreDeliveryStatus.STATUS_TAKEDOWN,
+        )
+
+        store_registry.all()
+        with CaptureQueriesContext(connection) as single_release_queries:
+            _update_release_store_delivery_statuses(
+                batch_delivery, delivery_releases[:1]
+            )
+        with CaptureQueriesContext(connection) as all_releases_queries:
+            _update_release_store_delivery_statuses(batch_delivery, delivery_releases)
+
+        assert len(all_releases_queries) == len(single_release_queries)
+        for release, delivery_release in zip(releases, delivery_releases):
+            for store in [self.twitch, self.amazon]:
+                assert (
+                    ReleaseStoreDeliveryStatus.objects.filter(
+                        release=release,
+                        store=store,
+                        latest_delivery_log=delivery_release,
+                        status=ReleaseStoreDeliveryStatus.STATUS_DELIVERED,
+                    ).count()
+                    == 1
+                )
+
     @mock.patch("amuse.vendor.segment.events.send_release_delivered")
     def test_delivery_update_handler_does_not_creates_release_store_delivery_status_for_fuga(
         self, _
@@ -0,0 +1,110 @@
+import hashlib
+from unittest import mock
+
+import responses
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+
+from amuse.services.delivery.checksum import (
+    _calculate_object_checksum,
+    get_bytes_skipped,
+    get_verified_file_checksum,
+)
+from amuse.tasks import _calculate_django_file_checksum
+from amuse.tests.helpers import (
+    ZENDESK_MOCK_API_URL_TOKEN,
+    add_zendesk_mock_post_response,
+)
+from releases.models import CoverArt
+from releases.tests.factories import CoverArtFactory
+
+
+@override_settings(**ZENDESK_MOCK_API_URL_TOKEN)
+@mock.patch("amuse.tasks.zendesk_create_or_update_user", mock.Mock())
+class TestVerifiedFileChecksum(TestCase):
+    @responses.activate
+    def setUp(self):
+        add_zendesk_mock_post_response()
+        cache.clear()
+        self.cover_art = CoverArtFactory()
+
+    def test_returns_checksum_and_size(self):
+        checksum, size = get_verified_file_checksum(self.cover_art.file)
+
+        assert checksum == _calculate_django_file_checksum(self.cover_art.file)
+        assert size == self.cover_art.file.size
+
+    @mock.patch(
+        "amuse.services.delivery.checksum._calculate_object_checksum",
+        return_value="checksum",
+    )
+    def test_unchanged_file_is_only_hashed_once(self, mock_calculate):
+        get_verified_file_checksum(self.cover_art.file)
+        checksum, size = get_verified_file_checksum(self.cover_art.file)
+
+        assert checksum == "checksum"
+        assert mock_calculate.call_count == 1
+        assert get_bytes_skipped() == size
+
+    @mock.patch("amuse.services.delivery.checksum._calculate_object_checksum")
+    def test_verified_object_is_stored_on_the_row(self, mock_calculate):
+        mock_calculate.side_effect = _calculate_object_checksum
+        get_verified_file_checksum(self.cover_art.file)
+        cache.clear()
+
+        cover_art = CoverArt.objects.get(pk=self.cover_art.pk)
+        checksum, size = get_verified_file_checksum(cover_art.file)
+
+        assert checksum == cover_art.checksum
+        assert cover_art.checksum_etag is not None
+        assert cover_art.checksum_size == size
+        assert mock_calculate.call_count == 1
+        assert get_bytes_skipped() == size
+
+    @mock.patch(
+        "amuse.services.delivery.checksum._calculate_object_checksum",
+        return_value="checksum",
+    )
+    def test_mismatching_checksum_is_not_stored_on_the_row(self, mock_calculate):
+        get_verified_file_checksum(self.cover_art.file)
+
+        self.cover_art.refresh_from_db()
+        assert self.cover_art.checksum_etag is None
+        assert self.cover_art.checksum_size is None
+
+    @mock.patch("amuse.services.delivery.checksum._calculate_object_checksum")
+    def test_changed_file_is_hashed_again(self, mock_calculate):
+        mock_calculate.side_effect = _calculate_object_checksum
+        first_checksum, _ = get_verified_file_checksum(self.cover_art.file)
+
+        self.cover_art.file.storage.save(
+            self.cover_art.file.name, ContentFile(b'new cover art')
+        )
+        second_checksum, _ = get_verified_file_checksum(self.cover_art.file)
+
+        assert mock_calculate.call_count == 2
+        assert first_checksum != second_checksum
+        assert get_bytes_skipped() == 0
+
+    def test_checksum_is_cached_under_the_downloaded_etag(self):
+        checksum = hashlib.md5(b"changed").hexdigest()
+        s3_object = mock.Mock(e_tag='"head"', content_length=3)
+        s3_object.get.return_value = {
+            "ETag": '"downloaded"',
+            "ContentLength": 7,
+            "Body": mock.Mock(iter_chunks=mock.Mock(return_value=[b"changed"])),
+        }
+        storage = self.cover_art.file.storage
+
+        with mock.patch.object(
+            type(storage), "bucket", new_callable=mock.PropertyMock
+        ) as mock_bucket:
+            mock_bucket.return_value.Object.return_value = s3_object
+            assert get_verified_file_checksum(self.cover_art.file) == (checksum, 7)
+
+            s3_object.e_tag = '"downloaded"'
+            s3_object.content_length = 7
+            assert get_verified_file_checksum(self.cover_art.file) == (checksum, 7)
+
+        s3_object.get.assert_called_once_with()
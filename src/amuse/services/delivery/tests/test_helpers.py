@@ -11,6 +11,7 @@ from django.test import override_settings
 from amuse.models.deliveries import Batch
 from amuse.services.delivery.helpers import (
     create_batch_delivery_releases_list,
+    encode_releases,
     get_non_delivered_dd_stores,
     trigger_batch_delivery,
 )
@@ -490,3 +491,39 @@ class TestHelpers(TestCase):
         )
 
         assert get_taken_down_release_ids([release.id]) == [release.id]
+
+    @mock.patch("amuse.services.delivery.helpers.release_json")
+    def test_encode_releases_with_workers_keeps_release_order(self, mock_release_json):
+        mock_release_json.side_effect = lambda release: {"id": release.pk}
+        releases = [self.release] + [ReleaseFactory() for _ in range(4)]
+
+        encoded_releases = encode_releases(releases, workers=3)
+
+        assert encoded_releases == [{"id": release.pk} for release in releases]
+
+    @mock.patch("amuse.services.delivery.helpers.release_json")
+    def test_encode_releases_with_workers_raises_encoding_errors(
+        self, mock_release_json
+    ):
+        def release_json(release):
+            if release == self.release:
+                raise ValueError("Invalid checksum")
+            return {"id": release.pk}
+
+        mock_release_json.side_effect = release_json
+        releases = [ReleaseFactory(), self.release, ReleaseFactory()]
+
+        with pytest.raises(ValueError):
+            encode_releases(releases, workers=2)
+
+    @mock.patch("amuse.services.delivery.helpers.connection")
+    @mock.patch("amuse.services.delivery.helpers.release_json")
+    def test_encode_releases_closes_connection_once_per_worker(
+        self, mock_release_json, mock_connection
+    ):
+        releases = [self.release] + [ReleaseFactory() for _ in range(4)]
+
+        encode_releases(releases, workers=2)
+
+        assert mock_release_json.call_count == 5
+        assert mock_connection.close.call_count == 2
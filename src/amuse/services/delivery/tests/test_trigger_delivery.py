@@ -90,6 +90,7 @@ class TriggerDeliveryTestCase(TestCase):
 
         mock_create_batch.assert_called_with(
             delivery_type="insert",
+            encode_workers=None,
             only_fuga=False,
             releases=[release],
             override_stores=False,
@@ -122,6 +123,7 @@ class TriggerDeliveryTestCase(TestCase):
 
         mock_create_batch.assert_called_with(
             delivery_type="insert",
+            encode_workers=None,
             only_fuga=False,
             releases=[release],
             override_stores=True,
@@ -153,6 +155,7 @@ class TriggerDeliveryTestCase(TestCase):
 
         mock_create_batch.assert_called_with(
             delivery_type="takedown",
+            encode_workers=None,
             only_fuga=False,
             releases=[release],
             override_stores=False,
@@ -324,6 +327,7 @@ class TriggerDeliveryTestCase(TestCase):
             [
                 mock.call(
                     delivery_type="update",
+                    encode_workers=None,
                     only_fuga=False,
                     override_stores=False,
                     releases=[bdr_1.release],
@@ -331,6 +335,7 @@ class TriggerDeliveryTestCase(TestCase):
                 ),
                 mock.call(
                     delivery_type="takedown",
+                    encode_workers=None,
                     only_fuga=False,
                     override_stores=False,
                     releases=[bdr_2.release],
@@ -635,6 +640,7 @@ class TriggerDeliveryTestCase(TestCase):
             batchsize=10,
             delay=0.0,
             delivery_type='insert',
+            encode_workers=None,
             dryrun=False,
             override_stores=False,
             releases=[release],
@@ -708,6 +714,7 @@ class TriggerDeliveryTestCase(TestCase):
             batchsize=10,
             delay=0.0,
             delivery_type='insert',
+            encode_workers=None,
             dryrun=False,
             override_stores=False,
             releases=[release_1],
@@ -744,6 +751,7 @@ class TriggerDeliveryTestCase(TestCase):
             batchsize=10,
             delay=0.0,
             delivery_type='insert',
+            encode_workers=None,
             dryrun=False,
             override_stores=False,
             releases=[release],
@@ -792,6 +800,7 @@ class TriggerDeliveryTestCase(TestCase):
             batchsize=10,
             delay=0.0,
             delivery_type='insert',
+            encode_workers=None,
             dryrun=False,
             override_stores=False,
             releases=[release_3],
@@ -799,7 +808,7 @@ class TriggerDeliveryTestCase(TestCase):
             user=user,
         )
 
-    @mock.patch("amuse.services.delivery.encoder._calculate_django_file_checksum")
+    @mock.patch("amuse.services.delivery.checksum._calculate_object_checksum")
     @mock.patch("amuse.services.delivery.helpers.trigger_batch_delivery")
     def test_approved_auto_delivery_amazon_twitch_bundle_only_triggers_twitch(
         self, mock_trigger, mock_calculate
@@ -922,6 +931,7 @@ class TriggerDeliveryTestCase(TestCase):
             batchsize=10,
             delay=0.0,
             delivery_type='insert',
+            encode_workers=None,
             dryrun=False,
             override_stores=False,
             releases=[releases[1], releases[2]],
@@ -973,6 +983,7 @@ class TriggerDeliveryTestCase(TestCase):
             batchsize=10,
             delay=0.0,
             delivery_type='insert',
+            encode_workers=None,
             dryrun=False,
             override_stores=False,
             releases=[releases[0], releases[1], releases[2]],
@@ -1023,6 +1034,7 @@ class TriggerDeliveryTestCase(TestCase):
             mock.call(
                 releases=[release],
                 delivery_type='insert',
+                encode_workers=None,
                 override_stores=False,
                 stores=['youtube_music'],
                 batchsize=10,
@@ -1035,6 +1047,7 @@ class TriggerDeliveryTestCase(TestCase):
             mock.call(
                 releases=[release],
                 delivery_type='insert',
+                encode_workers=None,
                 override_stores=False,
                 stores=['deezer'],
                 batchsize=10,
@@ -1047,6 +1060,7 @@ class TriggerDeliveryTestCase(TestCase):
             mock.call(
                 releases=[release],
                 delivery_type='insert',
+                encode_workers=None,
                 override_stores=False,
                 stores=['youtube_content_id'],
                 batchsize=10,
@@ -1110,6 +1124,7 @@ class TriggerDeliveryTestCase(TestCase):
                 batchsize=10,
                 delay=0.0,
                 delivery_type='insert',
+                encode_workers=None,
                 dryrun=False,
                 override_stores=False,
                 releases=[release],
@@ -1180,6 +1195,7 @@ class TriggerDeliveryTestCase(TestCase):
                 batchsize=10,
                 delay=0.0,
                 delivery_type='insert',
+                encode_workers=None,
                 dryrun=False,
                 override_stores=False,
                 releases=[release_2],
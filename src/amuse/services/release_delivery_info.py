@@ -1,10 +1,13 @@
 import logging
+from collections import defaultdict
+
+from django.db.models import Q
 
 from amuse.deliveries import CHANNELS
 from amuse.models.deliveries import BatchDeliveryRelease
-from releases.models import Store, FugaDeliveryHistory, FugaStores
+from releases.models import Release, Song, FugaDeliveryHistory, FugaStores
 from releases.models.release_store_delivery_status import ReleaseStoreDeliveryStatus
-from releases.utils import release_explicit
+from releases.store_registry import store_registry
 
 DISALLOW_EXPLICIT = ("tencent", "netease")
 CHANNEL_MAP = dict(map(reversed, CHANNELS.items()))
@@ -12,12 +15,96 @@ CHANNEL_MAP = dict(map(reversed, CHANNELS.items()))
 logger = logging.getLogger(__name__)
 
 
+class ReleaseDeliveryData:
+    """
+    Delivery related data for a list of releases, loaded in a fixed number of
+    queries regardless of how many releases or stores are involved.
+    """
+
+    def __init__(self, releases):
+        release_ids = [release.pk for release in releases]
+
+        # Registry stores are ordered by name, sorted() keeps that order within
+        # each show_on_top, active and is_pro group.
+        self.stores = sorted(
+            store_registry.admin_active(),
+            key=lambda store: (
+                not store.show_on_top,
+                not store.active,
+                not store.is_pro,
+            ),
+        )
+
+        self.release_store_ids = defaultdict(set)
+        self.release_internal_stores = defaultdict(set)
+        for release_id, store_id in Release.stores.through.objects.filter(
+            release_id__in=release_ids
+        ).values_list('release_id', 'store_id'):
+            self.release_store_ids[release_id].add(store_id)
+            self.release_internal_stores[release_id].add(
+                store_registry.get(store_id).internal_name
+            )
+
+        self.explicit_release_ids = set(
+            Song.objects.filter(
+                release_id__in=release_ids, explicit=Song.EXPLICIT_TRUE
+            ).values_list('release_id', flat=True)
+        )
+
+        self.store_statuses = {}
+        self.fuga_statuses = defaultdict(list)
+        statuses = (
+            ReleaseStoreDeliveryStatus.objects.filter(release_id__in=release_ids)
+            .filter(Q(store__isnull=False) | Q(fuga_store__isnull=False))
+            .select_related('fuga_store')
+            .order_by('pk')
+        )
+        for status in statuses:
+            if status.store_id is not None:
+                self.store_statuses.setdefault(
+                    (status.release_id, status.store_id), status
+                )
+            if status.fuga_store_id is not None:
+                self.fuga_statuses[status.release_id].append(status)
+
+        # Latest BatchDeliveryRelease per release and channel
+        self.last_deliveries = {
+            (bdr.release_id, bdr.delivery.channel): bdr
+            for bdr in BatchDeliveryRelease.objects.filter(
+                release_id__in=release_ids,
+                delivery__channel__in=[
+                    CHANNEL_MAP[store.internal_name]
+                    for store in self.stores
+                    if store.internal_name in CHANNEL_MAP
+                ]
+                + [CHANNEL_MAP['facebook']],
+            )
+            .select_related('delivery')
+            .order_by('release_id', 'delivery__channel', '-pk')
+            .distinct('release_id', 'delivery__channel')
+        }
+
+
 class ReleaseDeliveryInfo:
-    def __init__(self, release):
+    def __init__(self, release, delivery_data=None):
         self.release = release
+        self.delivery_data = delivery_data or ReleaseDeliveryData([release])
         self.fuga_delivery_info = self._get_fuga_delivery_info()
         self.store_delivery_info = self._get_store_delivery_info()
 
+    @classmethod
+    def for_releases(cls, releases):
+        """
+        Returns a dict of release.id -> ReleaseDeliveryInfo sharing the data
+        loaded for the whole list of releases.
+        """
+        releases = list(releases)
+        if not releases:
+            return {}
+
+        delivery_data = ReleaseDeliveryData(releases)
+        return {release.pk: cls(release, delivery_data) for release in releases}
+
     def get_direct_delivery_channels(self, method):
         delivery_channels = []
 
@@ -56,11 +143,8 @@ class ReleaseDeliveryInfo:
 
     def _get_store_delivery_info(self):
         store_delivery_info = []
-        all_stores = Store.objects.filter(admin_active=True).order_by(
-            '-show_on_top', '-active', '-is_pro', 'name'
-        )
 
-        for store in all_stores:
+        for store in self.delivery_data.stores:
             (
                 include_store_in_delivery,
                 excluded_reason,
@@ -82,12 +166,12 @@ class ReleaseDeliveryInfo:
                     'channel_name': CHANNELS[channel] if channel else None,
                     'deliver_to': include_store_in_delivery,
                     'excluded_reason': excluded_reason,
-                    'delivery_status': ReleaseStoreDeliveryStatus.objects.filter(
-                        release=self.release, store=store
-                    ).first(),
-                    'last_delivery': BatchDeliveryRelease.objects.filter(
-                        release=self.release, delivery__channel=channel
-                    ).last(),
+                    'delivery_status': self.delivery_data.store_statuses.get(
+                        (self.release.pk, store.id)
+                    ),
+                    'last_delivery': self.delivery_data.last_deliveries.get(
+                        (self.release.pk, channel)
+                    ),
                 }
             )
 
@@ -95,16 +179,14 @@ class ReleaseDeliveryInfo:
 
     def _get_fuga_delivery_info(self):
         fuga_delivery_info = []
-        fuga_release_store_delivery_statuses = (
-            ReleaseStoreDeliveryStatus.objects.filter(
-                release=self.release, fuga_store__isnull=False
-            )
-        )
+        fuga_release_store_delivery_statuses = self.delivery_data.fuga_statuses[
+            self.release.pk
+        ]
 
         for release_store_delivery_status in fuga_release_store_delivery_statuses:
-            store = Store.objects.filter(
-                fuga_store_id=release_store_delivery_status.fuga_store.id
-            ).first()
+            store = store_registry.get_by_fuga_store_id(
+                release_store_delivery_status.fuga_store_id
+            )
 
             fuga_delivery_info.append(
                 {
@@ -120,25 +202,27 @@ class ReleaseDeliveryInfo:
         return fuga_delivery_info
 
     def _include_store_in_delivery(self, store):
-        if store not in self.release.stores.all():
+        release_store_ids = self.delivery_data.release_store_ids[self.release.pk]
+        included_internal_stores = self.delivery_data.release_internal_stores[
+            self.release.pk
+        ]
+
+        if store.id not in release_store_ids:
             return False, "Store not in selected release stores"
 
         # Bundled stores handling
         if (
             store.internal_name == "instagram"
-            and "facebook" in self.release.included_internal_stores
+            and "facebook" in included_internal_stores
         ):
             return False, "Instagram is handled via Facebook"
 
-        if (
-            store.internal_name == "amazon"
-            and "twitch" in self.release.included_internal_stores
-        ):
+        if store.internal_name == "amazon" and "twitch" in included_internal_stores:
             return False, "Twitch deliveries always include Amazon"
 
         # Explicit stores check
         if (
-            release_explicit(self.release) == "explicit"
+            self.release.pk in self.delivery_data.explicit_release_ids
             and store.internal_name in DISALLOW_EXPLICIT
         ):
             return False, f"{store.name} excluded as release is marked as explicit"
@@ -0,0 +1,159 @@
+import json
+import time
+from datetime import timedelta
+from itertools import groupby
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from amuse.analytics import royalty_advance_notification
+from amuse.logging import logger
+from amuse.models import SnsNotification
+from amuse.services import audiorec, ffwd, lyrics, transcoding, smart_link
+from amuse.services.delivery import callback as delivery_callback
+from amuse.vendor.aws import cloudwatch
+
+
+def unlock_ffwd_splits(message):
+    logger.info('Recoup event with splits: %s', message['split_ids'])
+    ffwd.unlock_splits(message['split_ids'])
+    logger.info('Unlocked splits: %s', message['split_ids'])
+
+
+def notify_royalty_advance(message):
+    royalty_advance_notification(
+        message['user_id'], message['msg_type'], message['total_user_amount']
+    )
+
+
+def get_topic_handlers():
+    return (
+        (settings.LYRICS_SERVICE_RESPONSE_TOPIC, lyrics.callback),
+        (settings.AUDIO_RECOGNITION_SERVICE_RESPONSE_TOPIC, audiorec.callback),
+        (settings.AUDIO_TRANSCODER_SERVICE_RESPONSE_TOPIC, transcoding.callback),
+        (settings.FFWD_RECOUP_SNS_TOPIC, unlock_ffwd_splits),
+        (settings.FFWD_NOTIFICATION_SNS_TOPIC, notify_royalty_advance),
+        (
+            settings.SMART_LINK_CALLBACK_SNS_TOPIC,
+            smart_link.amuse_smart_link_callback,
+        ),
+        (settings.RELEASE_DELIVERY_SERVICE_RESPONSE_TOPIC, delivery_callback.handler),
+    )
+
+
+def get_topic_handler(topic_arn):
+    for topic, handler in get_topic_handlers():
+        if topic == topic_arn:
+            return handler
+    return None
+
+
+def enqueue(message_id, topic_arn, message):
+    """
+    Stores a raw SNS message in the inbox and schedules a drain of its topic.
+    Returns False when the message was already received.
+    """
+    from amuse.tasks import drain_sns_inbox
+
+    _, created = SnsNotification.objects.get_or_create(
+        message_id=message_id, defaults={'topic_arn': topic_arn, 'message': message}
+    )
+    if created:
+        transaction.on_commit(lambda: drain_sns_inbox.delay(topic_arn))
+    else:
+        logger.info('SNS message %s for %s already received', message_id, topic_arn)
+    return created
+
+
+def drain(topic_arn=None, batch_size=None):
+    """
+    Handles a batch of pending inbox messages, grouped by topic. The batch is
+    claimed in a short transaction: the rows are locked with SKIP LOCKED, so
+    concurrent workers never claim the same message, and marked in progress.
+    Every message is then handled and updated in its own transaction, so no
+    row lock is held while the handlers run. Messages of a worker that died
+    are claimed again after SNS_INBOX_CLAIM_TIMEOUT seconds. Returns the
+    number of messages handled.
+    """
+    notifications = _claim(topic_arn, batch_size or settings.SNS_INBOX_BATCH_SIZE)
+
+    latencies = {
+        topic: _handle_topic(topic, list(group))
+        for topic, group in groupby(notifications, key=lambda n: n.topic_arn)
+    }
+
+    for topic, topic_latencies in latencies.items():
+        cloudwatch.sns_inbox_handler_latency(topic, topic_latencies)
+
+    return len(notifications)
+
+
+def _claim(topic_arn, batch_size):
+    """Returns the claimed messages ordered by topic, with the attempt counted."""
+    now = timezone.now()
+    claimable = Q(status=SnsNotification.STATUS_PENDING) | Q(
+        status=SnsNotification.STATUS_IN_PROGRESS,
+        date_claimed__lt=now - timedelta(seconds=settings.SNS_INBOX_CLAIM_TIMEOUT),
+    )
+
+    with transaction.atomic():
+        notifications = SnsNotification.objects.select_for_update(
+            skip_locked=True
+        ).filter(claimable)
+        if topic_arn is not None:
+            notifications = notifications.filter(topic_arn=topic_arn)
+        notifications = list(notifications.order_by('topic_arn', 'pk')[:batch_size])
+
+        SnsNotification.objects.filter(
+            pk__in=[notification.pk for notification in notifications]
+        ).update(
+            status=SnsNotification.STATUS_IN_PROGRESS,
+            attempts=F('attempts') + 1,
+            date_claimed=now,
+        )
+
+    for notification in notifications:
+        notification.status = SnsNotification.STATUS_IN_PROGRESS
+        notification.attempts += 1
+        notification.date_claimed = now
+    return notifications
+
+
+def _handle_topic(topic_arn, notifications):
+    handler = get_topic_handler(topic_arn)
+    latencies = []
+
+    for notification in notifications:
+        started = time.monotonic()
+        try:
+            if handler is None:
+                raise ValueError(f'No handler for topic {topic_arn}')
+            with transaction.atomic():
+                handler(json.loads(notification.message))
+                notification.status = SnsNotification.STATUS_PROCESSED
+                notification.error = ''
+                notification.date_processed = timezone.now()
+                notification.save(update_fields=['status', 'error', 'date_processed'])
+        except Exception as e:
+            logger.exception(
+                'Failed to handle SNS message %s for %s',
+                notification.message_id,
+                topic_arn,
+            )
+            notification.error = repr(e)
+            if notification.attempts >= settings.SNS_INBOX_MAX_ATTEMPTS:
+                notification.status = SnsNotification.STATUS_FAILED
+            else:
+                notification.status = SnsNotification.STATUS_PENDING
+            notification.save(update_fields=['status', 'error'])
+        latencies.append((time.monotonic() - started) * 1000)
+
+    logger.info(
+        'Handled %s SNS messages for %s in %.0f ms',
+        len(notifications),
+        topic_arn,
+        sum(latencies),
+    )
+    return latencies
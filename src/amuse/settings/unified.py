@@ -82,6 +82,8 @@ AWS_BATCH_DELIVERY_FILE_BUCKET_NAME = env.get('AWS_BATCH_DELIVERY_FILE_BUCKET_NA
 AWS_SNS_USER = env.get('AWS_SNS_USER')
 AWS_SNS_PASSWORD = env.get('AWS_SNS_PASSWORD')
 AWS_SNS_SMART_LINK_TOPIC_ARN = env.get('AWS_SNS_SMART_LINK_TOPIC_ARN')
+AWS_CLIENT_MAX_POOL_CONNECTIONS = env.get_int('AWS_CLIENT_MAX_POOL_CONNECTIONS', 50)
+AWS_CLIENT_MAX_ATTEMPTS = env.get_int('AWS_CLIENT_MAX_ATTEMPTS', 3)
 
 AMUSE_S3_CONNECTION = env.get('AMUSE_S3_CONNECTION')
 
@@ -160,11 +162,28 @@ HYPERWALLET_ENDPOINT = env.get('HYPERWALLET_ENDPOINT')
 
 # Revenue System
 REVENUE_API_URL = env.get('REVENUE_API_URL', 'http://localhost')
+REVENUE_API_POOL_SIZE = env.get_int('REVENUE_API_POOL_SIZE', 20)
+REVENUE_API_CONNECT_TIMEOUT = env.get_int('REVENUE_API_CONNECT_TIMEOUT', 3)
+REVENUE_API_READ_TIMEOUT = env.get_int('REVENUE_API_READ_TIMEOUT', 10)
+# Wallet screens of the current month, closed months are cached much longer
+REVENUE_WALLET_CACHE_TIMEOUT = env.get_int('REVENUE_WALLET_CACHE_TIMEOUT', 60)
+REVENUE_WALLET_CLOSED_MONTH_CACHE_TIMEOUT = env.get_int(
+    'REVENUE_WALLET_CLOSED_MONTH_CACHE_TIMEOUT', 60 * 60 * 24 * 7
+)
 
 # Slayer
 SLAYER_GRPC_HOST = env.get('SLAYER_GRPC_HOST', '127.0.0.1')
 SLAYER_GRPC_PORT = env.get('SLAYER_GRPC_PORT', 9090)
 SLAYER_GRPC_SSL = env.get('SLAYER_GRPC_SSL', 'noverify')
+# UTC hour of the daily Slayer data refresh, cached responses expire then
+SLAYER_CACHE_REFRESH_HOUR = env.get_int('SLAYER_CACHE_REFRESH_HOUR', 6)
+SLAYER_CACHE_LOCK_TIMEOUT = env.get_int('SLAYER_CACHE_LOCK_TIMEOUT', 10)
+SLAYER_METRICS_INTERVAL = env.get_int('SLAYER_METRICS_INTERVAL', 60)
+SLAYER_FANOUT_WORKERS = env.get_int('SLAYER_FANOUT_WORKERS', 16)
+# Seconds an analytics request waits for all of its Slayer calls
+SLAYER_REQUEST_DEADLINE = env.get_int('SLAYER_REQUEST_DEADLINE', 5)
+SLAYER_METADATA_CACHE_SIZE = env.get_int('SLAYER_METADATA_CACHE_SIZE', 20000)
+SLAYER_METADATA_CACHE_TIMEOUT = env.get_int('SLAYER_METADATA_CACHE_TIMEOUT', 3600)
 
 # --------------------------------------------------
 # Spotify API
@@ -397,6 +416,9 @@ MINFRAUD_LICENCE_KEY = env.get('MINFRAUD_LICENCE_KEY')
 JWT_SECRET = env.get('JWT_SECRET')
 JWT_SIGN_VERIFY_KMS_ARN = env.get('JWT_SIGN_VERIFY_KMS_ARN')
 JWT_KMS_PUBKEY_CACHE_TTL_SECS = env.get('JWT_KMS_PUBKEY_CACHE_TTL_SECS', 5)
+JWT_KMS_PUBKEY_REFRESH_SECS = env.get_int('JWT_KMS_PUBKEY_REFRESH_SECS', 3600)
+JWT_KMS_PUBKEY_RELOAD_SECS = env.get_int('JWT_KMS_PUBKEY_RELOAD_SECS', 60)
+AUTH_PRINCIPAL_CACHE_TIMEOUT = env.get_int('AUTH_PRINCIPAL_CACHE_TIMEOUT', 300)
 
 # Adyen payments
 ADYEN_PLATFORM = env.get('ADYEN_PLATFORM')
@@ -413,6 +435,21 @@ APPLE_KEY = env.get('APPLE_KEY')
 APPLE_PLATFORM = env.get('APPLE_PLATFORM')
 APPLE_VALIDATION_URL = env.get('APPLE_VALIDATION_URL')
 
+# Subscription renewals, rate limits are provider calls per second over all
+# processes, split between the chunk tasks that run at once, i.e. the Celery
+# worker processes consuming the renewal tasks
+SUBSCRIPTION_RENEWAL_CHUNK_SIZE = env.get_int('SUBSCRIPTION_RENEWAL_CHUNK_SIZE', 500)
+SUBSCRIPTION_RENEWAL_WORKERS = env.get_int('SUBSCRIPTION_RENEWAL_WORKERS', 8)
+SUBSCRIPTION_RENEWAL_CONCURRENCY = env.get_int('SUBSCRIPTION_RENEWAL_CONCURRENCY', 4)
+SUBSCRIPTION_RENEWAL_CLAIM_TIMEOUT = env.get_int(
+    'SUBSCRIPTION_RENEWAL_CLAIM_TIMEOUT', 600
+)
+ADYEN_RENEWAL_RATE_LIMIT = env.get_int('ADYEN_RENEWAL_RATE_LIMIT', 20)
+APPLE_RENEWAL_RATE_LIMIT = env.get_int('APPLE_RENEWAL_RATE_LIMIT', 20)
+
+# Subscription expiry, rows updated per statement
+SUBSCRIPTION_EXPIRY_BATCH_SIZE = env.get_int('SUBSCRIPTION_EXPIRY_BATCH_SIZE', 1000)
+
 # Apple Social Login
 SOCIAL_AUTH_APPLE_KEY_ID = env.get('SOCIAL_AUTH_APPLE_KEY_ID')
 SOCIAL_AUTH_APPLE_TEAM_ID = env.get('SOCIAL_AUTH_APPLE_TEAM_ID')
@@ -456,6 +493,16 @@ RELEASE_DELIVERY_SERVICE_RESPONSE_TOPIC = env.get(
 
 SMART_LINK_MESSAGE_BATCH_SIZE = env.get_int('SMART_LINK_MESSAGE_BATCH_SIZE', 200)
 
+SNS_INBOX_BATCH_SIZE = env.get_int('SNS_INBOX_BATCH_SIZE', 100)
+SNS_INBOX_MAX_ATTEMPTS = env.get_int('SNS_INBOX_MAX_ATTEMPTS', 5)
+# Seconds after which a message claimed by a worker that died is claimed again
+SNS_INBOX_CLAIM_TIMEOUT = env.get_int('SNS_INBOX_CLAIM_TIMEOUT', 600)
+
+ENTITLEMENT_SHARED_CACHE_TIMEOUT = env.get_int('ENTITLEMENT_SHARED_CACHE_TIMEOUT', 30)
+
+# Seconds between reads of the shared version of every per-process index
+VERSIONED_INDEX_CHECK_INTERVAL = env.get_int('VERSIONED_INDEX_CHECK_INTERVAL', 5)
+
 FUGA_API_USER = env.get('FUGA_API_USER')
 FUGA_API_PASSWORD = env.get('FUGA_API_PASSWORD')
 FUGA_API_URL = env.get('FUGA_API_URL')
@@ -16,7 +16,7 @@ from waffle import switch_is_active
 
 from amuse import mails, slack, utils
 from amuse.vendor.zendesk import api as zendesk
-from amuse.analytics import signup_completed
+from amuse.analytics import signup_completed, update_is_pro_state
 from amuse.celery import app
 from amuse.models.bulk_delivery_job import BulkDeliveryJob
 from amuse.services import audiorec, lyrics, transcoding, smart_link
@@ -109,6 +109,30 @@ def zendesk_create_or_update_user(self, user_id):
         raise self.retry(exc=exc)
 
 
+@app.task(bind=True, ignore_result=True)
+def update_users_subscription_state(self, user_ids):
+    """
+    Syncs the is_pro state of users whose subscriptions were changed by
+    queryset updates, which bypass Subscription.save(), to Segment and Zendesk.
+    """
+    users = list(User.objects.filter(pk__in=user_ids))
+
+    if settings.SEGMENT_UPDATE_IS_PRO_STATE:
+        for user in users:
+            try:
+                update_is_pro_state(user)
+            except Exception:
+                logger.warning('Unable to update Segment user %s', user.pk)
+
+    zendesk_users = [user for user in users if user.zendesk_id]
+    if zendesk_users and settings.ZENDESK_API_TOKEN:
+        try:
+            zendesk.update_users(zendesk_users)
+        except Exception as exc:
+            logger.exception('Failed to update Zendesk users %s', user_ids)
+            raise self.retry(exc=exc)
+
+
 @app.task(bind=True)
 def send_password_reset_email(self, user):
     try:
@@ -480,7 +504,9 @@ def save_cover_art_checksum(cover_art_id):
             cover_art.checksum,
             checksum,
         )
-        CoverArt.objects.filter(id=cover_art.id).update(checksum=checksum)
+        CoverArt.objects.filter(id=cover_art.id).update(
+            checksum=checksum, checksum_etag=None, checksum_size=None
+        )
 
     return (cover_art_id, checksum)
 
@@ -684,3 +710,11 @@ def smart_links_takedown(self, takedown_release_ids):
             smart_link.send_smart_link_creation_data_to_link_service(message_batch)
     except Exception as ex:
         self.retry(exc=ex, countdown=300, max_retries=3)
+
+
+@app.task(ignore_result=True)
+def drain_sns_inbox(topic_arn=None):
+    from amuse.services import sns_inbox
+
+    if sns_inbox.drain(topic_arn) >= settings.SNS_INBOX_BATCH_SIZE:
+        drain_sns_inbox.delay(topic_arn)
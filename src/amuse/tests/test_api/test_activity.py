@@ -5,7 +5,7 @@ from rest_framework import status
 from rest_framework.test import APIClient
 
 from amuse.tests.test_api.base import AmuseAPITestCase, API_V2_ACCEPT_VALUE
-from users.tests.factories import UserFactory
+from users.tests.factories import UserArtistRoleFactory, UserFactory
 
 
 class ActivityTestCase(AmuseAPITestCase):
@@ -55,3 +55,18 @@ class ActivityTestCase(AmuseAPITestCase):
             cached_response = client.get(proper_url)
             self.assertEqual(mock_ua.call_count, 1)
             self.assertEqual(cached_response.content, successful_response.content)
+
+    def test_artist_endpoint_is_cached(self):
+        artist = UserArtistRoleFactory(user=self.test_user).artist
+        url = reverse('artist-activity', args=(artist.id, 'summary'))
+        self.client.force_authenticate(user=self.test_user)
+
+        with mock.patch('amuse.api.base.views.activity.artist_activity') as mock_aa:
+            mock_aa.return_value = {'test_key': 'test_value'}
+
+            response = self.client.get(url)
+            cached_response = self.client.get(url)
+
+        mock_aa.assert_called_once_with(artist.id, 'summary')
+        self.assertEqual(response.json(), {'test_key': 'test_value'})
+        self.assertEqual(cached_response.content, response.content)
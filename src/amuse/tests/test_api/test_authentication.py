@@ -1,4 +1,5 @@
 from unittest.mock import patch
+from django.core.cache import cache
 from django.test import TestCase
 from users.tests.factories import UserFactory
 from rest_framework.response import Response
@@ -15,6 +16,8 @@ from amuse.api.base.authentication import (
     authenticate_from_otp_cookie,
     JWTCookieAuthentication,
 )
+from users.gdpr import deactivate_user_newsletter_and_active
+from users.principal import CACHE_KEY, get_principal, invalidate_principals
 
 
 class TestJWTCookieAuthenticationTestCase(TestCase):
@@ -72,3 +75,49 @@ class TestJWTCookieAuthenticationTestCase(TestCase):
         request.cookies = generate_test_client_access_cookie(user_id=user.id)
         with self.assertRaises(AuthenticationFailed):
             JWTCookieAuthentication().authenticate(request.request())
+
+    def test_authenticate_loads_full_user_lazily(self):
+        request = RequestFactory()
+        request.cookies = generate_test_client_access_cookie(user_id=self.user.pk)
+        u, t = JWTCookieAuthentication().authenticate(request.request())
+
+        with self.assertNumQueries(0):
+            assert u
+            assert u.is_authenticated
+            assert u.is_active
+            assert u.id == self.user.id
+        with self.assertNumQueries(1):
+            assert u.email == self.user.email
+        assert u == self.user
+
+    @patch('amuse.tasks.zendesk_create_or_update_user')
+    def test_authenticate_after_deactivation(self, mock):
+        request = RequestFactory()
+        request.cookies = generate_test_client_access_cookie(user_id=self.user.pk)
+        JWTCookieAuthentication().authenticate(request.request())
+
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            JWTCookieAuthentication().authenticate(request.request())
+
+    def test_authenticate_after_gdpr_deactivation(self):
+        request = RequestFactory()
+        request.cookies = generate_test_client_access_cookie(user_id=self.user.pk)
+        JWTCookieAuthentication().authenticate(request.request())
+
+        deactivate_user_newsletter_and_active(self.user.pk)
+
+        with self.assertRaises(AuthenticationFailed):
+            JWTCookieAuthentication().authenticate(request.request())
+
+    def test_principal_is_invalidated_again_on_commit(self):
+        get_principal(self.user.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_principals([self.user.pk])
+            # Cached by another request before the commit
+            get_principal(self.user.pk)
+
+        assert cache.get(CACHE_KEY.format(user_id=self.user.pk)) is None
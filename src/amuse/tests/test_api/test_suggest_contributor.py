@@ -2,6 +2,7 @@ import responses
 from django.urls import reverse_lazy as reverse
 
 from releases.models import SongArtistRole
+from releases.utils import get_contributors_from_history
 from releases.tests.factories import SongArtistRoleFactory, SongFactory, ReleaseFactory
 from users.tests.factories import UserFactory, Artistv2Factory
 from .base import AmuseAPITestCase
@@ -59,3 +60,20 @@ class ReleaseAPITestCase(AmuseAPITestCase):
         self.assertTrue(any(d['name'] == 'MrProducer' for d in suggest_list))
         self.assertTrue(any(d['name'] == 'MrMixer' for d in suggest_list))
         self.assertTrue(any(d['name'] == 'MrREMixer' for d in suggest_list))
+
+    def test_contributors_are_fetched_in_one_query(self):
+        other_song = SongFactory(release=self.release)
+        for artist in SongArtistRole.objects.values_list('artist', flat=True):
+            SongArtistRoleFactory(song=other_song, artist_id=artist)
+        # A different artist with the same name is only suggested once
+        SongArtistRoleFactory(song=other_song, artist=Artistv2Factory(name="MrMixer"))
+
+        with self.assertNumQueries(1):
+            contributors = list(get_contributors_from_history(self.user))
+
+        names = [contributor['name'] for contributor in contributors]
+        self.assertEqual(len(names), len(set(names)))
+        self.assertEqual(
+            set(names),
+            {'FeaturedArtist', 'MrWriter', 'MrProducer', 'MrMixer', 'MrREMixer'},
+        )
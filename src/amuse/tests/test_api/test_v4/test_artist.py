@@ -3,6 +3,8 @@ import responses
 from rest_framework import status
 from unittest.mock import patch
 from dateutil.relativedelta import relativedelta
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from amuse.tests.test_api.base import (
@@ -1007,6 +1009,32 @@ class ArtistV2APITestCase(AmuseAPITestCase):
         self.assertNotIn('soundcloud_page', response.data[0])
         self.assertNotIn('youtube_channel', response.data[0])
 
+    def test_related_artists_query_count_does_not_grow_with_catalog(self):
+        url = reverse('related-artists')
+        artist = Artistv2Factory()
+        SongArtistRoleFactory(artist=artist, song=SongFactory())
+
+        def add_song_with_contributor():
+            song = SongFactory()
+            SongArtistRoleFactory(artist=artist, song=song)
+            SongArtistRoleFactory(
+                artist=Artistv2Factory(),
+                song=song,
+                role=SongArtistRole.ROLE_FEATURED_ARTIST,
+            )
+
+        add_song_with_contributor()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {'artist_id': artist.id})
+        self.assertEqual(len(response.data), 1)
+
+        for _ in range(5):
+            add_song_with_contributor()
+        with self.assertNumQueries(len(queries)):
+            response = self.client.get(url, {'artist_id': artist.id})
+        self.assertEqual(len(response.data), 6)
+        self.assertTrue(all(artist['has_owner'] for artist in response.data))
+
     def test_search_wrong_api_version_return_400(self):
         self.client.credentials(HTTP_ACCEPT=API_V2_ACCEPT_VALUE)
         url = reverse('artist-search')
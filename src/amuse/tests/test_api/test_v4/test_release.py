@@ -6,6 +6,9 @@ from uuid import uuid4
 
 import pytest
 from django.conf import settings
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse_lazy as reverse
 from django.utils import timezone
 import responses
@@ -27,7 +30,10 @@ from releases.models.release import ReleaseArtistRole
 from releases.tests.factories import (
     CoverArtFactory,
     GenreFactory,
+    ReleaseArtistRoleFactory,
     ReleaseFactory,
+    RoyaltySplitFactory,
+    SongArtistRoleFactory,
     SongFactory,
     StoreFactory,
 )
@@ -604,6 +610,69 @@ class ReleaseAPITestCase(AmuseAPITestCase):
         response = self.client.get(url)
         self.assertEqual(len(response.data), 1, response.data)
 
+    def _create_release_with_songs(self, user, artist):
+        release = ReleaseFactory(user=user)
+        release.excluded_countries.add(CountryFactory())
+        release.stores.set(Store.objects.all()[:1])
+        CoverArtFactory(release=release, user=user)
+        ReleaseArtistRoleFactory(release=release, artist=artist)
+        for _ in range(2):
+            song = SongFactory(release=release)
+            SongArtistRoleFactory(song=song, artist=artist)
+            SongArtistRoleFactory(
+                song=song,
+                artist=self.artist_4,
+                role=SongArtistRole.ROLE_PRODUCER,
+            )
+            RoyaltySplitFactory(song=song, user=user, status=RoyaltySplit.STATUS_ACTIVE)
+        return release
+
+    @override_settings(
+        CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+    )
+    def test_list_query_count_does_not_depend_on_release_count(self):
+        url = reverse('release-list')
+        self._create_release_with_songs(self.user, self.artist_1)
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as single_release_queries:
+            response = self.client.get(url)
+        self.assertEqual(len(response.data), 1)
+
+        for _ in range(3):
+            self._create_release_with_songs(self.user, self.artist_1)
+        # Visible through the user's artist on the songs
+        featured_release = self._create_release_with_songs(self.user_2, self.artist_2)
+        SongArtistRoleFactory(
+            song=featured_release.songs.first(),
+            artist=self.artist_1,
+            role=SongArtistRole.ROLE_FEATURED_ARTIST,
+        )
+        ReleaseFactory(user=self.user, status=Release.STATUS_DELETED)
+        ReleaseFactory(user=self.user_2)
+
+        with CaptureQueriesContext(connection) as all_releases_queries:
+            response = self.client.get(url)
+
+        self.assertEqual(len(response.data), 5)
+        self.assertEqual(len(all_releases_queries), len(single_release_queries))
+        featured_data = next(r for r in response.data if r['id'] == featured_release.id)
+        self.assertEqual(
+            featured_data['excluded_stores'],
+            list(
+                Store.objects.exclude(pk__in=featured_release.stores.all())
+                .order_by('pk')
+                .values_list('pk', flat=True)
+            ),
+        )
+        self.assertEqual(
+            {
+                role['artist_name']
+                for role in featured_data['songs'][0]['artists_roles']
+            },
+            {self.artist_1.name, self.artist_2.name, self.artist_4.name},
+        )
+
     @responses.activate
     @mock.patch('releases.utils.tasks')
     def test_several_track_release_version_not_same_as_song_version(self, mocked_tasks):
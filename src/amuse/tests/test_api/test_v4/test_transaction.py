@@ -63,7 +63,7 @@ class TransactionAPIV4TestCase(AmuseAPITestCase):
         assert response.data is None
 
     @responses.activate
-    @mock.patch("amuse.vendor.revenue.client.requests.get")
+    @mock.patch("amuse.vendor.revenue.client.session.get")
     def test_get_wallet_handles_exceptions(self, mocked_get):
         mocked_get.side_effect = ConnectionError
         response = self.client.get(self.url)
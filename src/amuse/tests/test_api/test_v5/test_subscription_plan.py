@@ -3,6 +3,8 @@ from decimal import Decimal
 from unittest import mock
 
 import responses
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
@@ -135,6 +137,17 @@ class SubscriptionPlanTestCase(AmuseAPITestCase):
         self.assertEqual(len(response_json), 1)
         self.assertEqual(response_json[0]['name'], self.plan.name)
 
+    def test_plans_with_only_introductory_cards_are_hidden(self):
+        plan = SubscriptionPlanFactory(create_card=False)
+        IntroductoryPriceCardFactory(plan=plan, countries=[self.default_country])
+
+        response = self.client.get(self.url)
+        response_json = response.json()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response_json), 1)
+        self.assertEqual(response_json[0]['name'], self.plan.name)
+
     def test_plans_with_multiple_cards_for_country_provided_throw_error(self):
         card = PriceCardFactory(plan=self.plan, countries=[self.default_country])
 
@@ -161,6 +174,19 @@ class SubscriptionPlanTestCase(AmuseAPITestCase):
         self.assertEqual(response_json[0]['currency'], 'USD')
         self.assertEqual(response_json[0]['country'], country.code)
 
+    def test_plans_are_listed_without_price_card_queries(self):
+        SubscriptionPlanFactory(countries=[self.default_country])
+        self.client.get(self.url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()), 2)
+        self.assertFalse(
+            [q for q in queries.captured_queries if 'pricecard' in q['sql']]
+        )
+
     def test_fetched_card_is_price_card_and_it_is_not_introductory_price_card(self):
         introductory_card = IntroductoryPriceCardFactory(
             plan=self.plan, countries=[self.default_country]
@@ -5,11 +5,11 @@ from django.test import override_settings
 from amuse.vendor.aws import sns
 
 
-@mock.patch('amuse.vendor.aws.sns.boto3')
-def test_sns_create_client(boto3_mock):
+@mock.patch('amuse.vendor.aws.clients.get_client')
+def test_sns_create_client(get_client_mock):
     with override_settings(AWS_REGION='us-east-1') as settings:
         sns.sns_create_client()
-        boto3_mock.client.assert_called_once_with('sns', region_name='us-east-1')
+        get_client_mock.assert_called_once_with('sns', region_name='us-east-1')
 
 
 @mock.patch('amuse.vendor.aws.sns.sns_create_client')
@@ -0,0 +1,33 @@
+from unittest import mock
+
+from amuse.vendor.aws import clients
+
+
+@mock.patch('amuse.vendor.aws.clients._create_client')
+def test_get_client_reuses_client_per_service_and_arguments(mock_create_client):
+    mock_create_client.side_effect = lambda *args, **kwargs: mock.Mock()
+    clients.clear_clients()
+
+    sqs_client = clients.get_client('sqs', region_name='eu-west-1')
+
+    assert clients.get_client('sqs', region_name='eu-west-1') is sqs_client
+    assert clients.get_client('sqs', region_name='us-east-1') is not sqs_client
+    assert clients.get_client('sns', region_name='eu-west-1') is not sqs_client
+    assert mock_create_client.call_count == 3
+
+
+@mock.patch('amuse.vendor.aws.clients._create_client')
+def test_get_client_creates_new_clients_after_fork(mock_create_client):
+    mock_create_client.side_effect = lambda *args, **kwargs: mock.Mock()
+    clients.clear_clients()
+    client = clients.get_client('sqs')
+
+    with mock.patch('amuse.vendor.aws.clients.os.getpid', return_value=-1):
+        assert clients.get_client('sqs') is not client
+
+
+def test_get_client_configures_connection_pool():
+    clients.clear_clients()
+    client = clients.get_client('sqs', region_name='us-east-1')
+
+    assert client.meta.config.max_pool_connections > 10
@@ -8,6 +8,7 @@ from django.urls import reverse_lazy as reverse
 from requests.exceptions import HTTPError
 from waffle.models import Switch
 
+from amuse.models import SnsNotification
 from amuse.models.deliveries import BatchDelivery
 from amuse.tests.factories import BatchDeliveryFactory, BatchDeliveryReleaseFactory
 from amuse.tests.helpers import build_auth_header
@@ -230,3 +231,50 @@ class SNSTestCase(TransactionTestCase):
         )
 
         self.assertEqual(response.status_code, 500)
+
+    @mock.patch('amuse.tasks.drain_sns_inbox.delay')
+    @mock.patch('amuse.services.lyrics.callback')
+    def test_notification_is_stored_in_inbox_if_switch_is_active(
+        self, mock_callback, mock_drain
+    ):
+        Switch.objects.create(name='sns:async-inbox', active=True)
+        notification = {
+            'Type': 'Notification',
+            'MessageId': 'message-1',
+            'TopicArn': settings.LYRICS_SERVICE_RESPONSE_TOPIC,
+            'Message': json.dumps({'id': 1, 'explicit': False, 'text': ''}),
+        }
+
+        for _ in range(2):
+            response = self.client.post(
+                self.url,
+                json.dumps(notification),
+                content_type='application/json',
+                **self.headers,
+            )
+            assert response.status_code == 200
+
+        inbox_message = SnsNotification.objects.get()
+        assert inbox_message.message_id == 'message-1'
+        assert inbox_message.topic_arn == settings.LYRICS_SERVICE_RESPONSE_TOPIC
+        assert inbox_message.status == SnsNotification.STATUS_PENDING
+        mock_callback.assert_not_called()
+        mock_drain.assert_called_once_with(settings.LYRICS_SERVICE_RESPONSE_TOPIC)
+
+    def test_notification_without_message_id_returns_400_if_switch_is_active(self):
+        Switch.objects.create(name='sns:async-inbox', active=True)
+        response = self.client.post(
+            self.url,
+            json.dumps(
+                {
+                    'Type': 'Notification',
+                    'TopicArn': settings.LYRICS_SERVICE_RESPONSE_TOPIC,
+                    'Message': json.dumps({'id': 1}),
+                }
+            ),
+            content_type='application/json',
+            **self.headers,
+        )
+
+        assert response.status_code == 400
+        assert not SnsNotification.objects.exists()
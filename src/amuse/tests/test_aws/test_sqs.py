@@ -1,13 +1,27 @@
 import json
 from unittest import mock
+
+import pytest
+
 from amuse.vendor.aws import sqs
 
 
+@pytest.fixture(autouse=True)
+def clear_queue_urls():
+    sqs.get_queue_url.cache_clear()
+    yield
+    sqs.get_queue_url.cache_clear()
+
+
 def test_create_client():
     client = sqs.create_client()
     assert client.__class__.__name__ == "SQS"
 
 
+def test_create_client_reuses_client():
+    assert sqs.create_client() is sqs.create_client()
+
+
 @mock.patch("amuse.vendor.aws.sqs.create_client", autospec=True)
 def test_send_message_with_queue_name(mock_client):
     queue_name = "foo-bar-baz"
@@ -15,6 +29,14 @@ def test_send_message_with_queue_name(mock_client):
     mock_client().create_queue.assert_called_once_with(QueueName=queue_name)
 
 
+@mock.patch("amuse.vendor.aws.sqs.create_client", autospec=True)
+def test_send_message_resolves_queue_url_once(mock_client):
+    sqs.send_message("foo", "first")
+    sqs.send_message("foo", "second")
+    mock_client().create_queue.assert_called_once_with(QueueName="foo")
+    assert mock_client().send_message.call_count == 2
+
+
 @mock.patch("amuse.vendor.aws.sqs.create_client", autospec=True)
 def test_send_message_with_dict(mock_client):
     message = {"foo": "bar"}
@@ -32,3 +54,32 @@ def test_send_message_with_string(mock_client):
     mock_client().send_message.assert_called_once_with(
         QueueUrl=mock_client().create_queue().get.return_value, MessageBody=message
     )
+
+
+@mock.patch("amuse.vendor.aws.sqs.create_client", autospec=True)
+def test_send_message_batch(mock_client):
+    mock_client().send_message_batch.side_effect = [
+        {"Failed": [{"Id": "3", "Code": "InternalError"}]},
+        {},
+    ]
+    messages = [{"id": i} for i in range(12)]
+
+    failed = sqs.send_message_batch("foo", messages)
+
+    queue_url = mock_client().create_queue().get.return_value
+    assert mock_client().send_message_batch.call_args_list == [
+        mock.call(
+            QueueUrl=queue_url,
+            Entries=[
+                {"Id": str(i), "MessageBody": json.dumps({"id": i})} for i in range(10)
+            ],
+        ),
+        mock.call(
+            QueueUrl=queue_url,
+            Entries=[
+                {"Id": str(i), "MessageBody": json.dumps({"id": i})}
+                for i in range(10, 12)
+            ],
+        ),
+    ]
+    assert failed == [(3, "InternalError")]
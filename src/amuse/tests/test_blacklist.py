@@ -0,0 +1,42 @@
+from django.test import TestCase, override_settings
+
+from amuse import blacklist
+from releases.models import BlacklistedArtistName
+
+
+class BlacklistIndexTestCase(TestCase):
+    def setUp(self):
+        self.tiesto = BlacklistedArtistName.objects.create(name='Tiesto')
+        BlacklistedArtistName.objects.create(name='Tiësto')
+        BlacklistedArtistName.objects.create(name='The Weeknd')
+
+    def test_find_matches_fuzzy_names(self):
+        assert blacklist.find('TIESTO!') == 'Tiesto'
+        assert blacklist.find('weeknd') == 'The Weeknd'
+        assert blacklist.find('Ed Sheeran') is None
+
+    @override_settings(VERSIONED_INDEX_CHECK_INTERVAL=60)
+    def test_find_many_uses_one_index(self):
+        blacklist.get_index()
+
+        with self.assertNumQueries(0):
+            matches = blacklist.find_many(['tiësto', 'Someone Else', 'The  Weeknd'])
+
+        assert matches == {'tiësto': 'Tiesto', 'The  Weeknd': 'The Weeknd'}
+
+    def test_search_returns_all_matching_names(self):
+        assert [name for _, name in blacklist.search('Tiesto')] == ['Tiesto', 'Tiësto']
+
+    def test_index_is_rebuilt_on_changes(self):
+        assert blacklist.find('Ed Sheeran') is None
+
+        BlacklistedArtistName.objects.create(name='Ed Sheeran')
+        assert blacklist.find('ed sheeran') == 'Ed Sheeran'
+
+        self.tiesto.delete()
+        assert blacklist.find('Tiesto') == 'Tiësto'
+
+    def test_find_similar_uses_ngrams(self):
+        assert blacklist.find_similar('The Weekend') == ['The Weeknd']
+        assert blacklist.find_similar('Tiestoo') == ['Tiesto']
+        assert blacklist.find_similar('Completely different') == []
@@ -1,4 +1,4 @@
-from unittest.mock import patch
+from unittest.mock import call, patch
 from django.test import TestCase, override_settings
 from amuse.cronjobs import tasks
 from releases.models import Release
@@ -96,15 +96,37 @@ class TestCronJobTasks(TestCase):
         tasks.expire_subscriptions_task()
         mock_fnc.assert_called_once()
 
-    @patch('subscriptions.helpers.renew_adyen_subscriptions')
-    def test_renew_adyen_subscriptions(self, mock_fnc):
+    @patch('amuse.cronjobs.tasks.renew_adyen_subscriptions_chunk.delay')
+    @patch('subscriptions.renewal.get_chunks', return_value=[[1, 2], [3]])
+    def test_renew_adyen_subscriptions(self, mock_chunks, mock_delay):
         tasks.renew_adyen_subscriptios()
-        mock_fnc.assert_called_once_with(is_dry_run=False)
+        mock_delay.assert_has_calls([call([1, 2]), call([3])])
 
-    @patch('subscriptions.helpers.renew_apple_subscriptions')
-    def test_renew_apple_subscriptions(self, mock_fnc):
+    @override_settings(SUBSCRIPTION_RENEWAL_WORKERS=4)
+    @patch('amuse.vendor.aws.cloudwatch.subscription_renewal_metrics')
+    @patch('subscriptions.helpers.renew_adyen_subscriptions')
+    def test_renew_adyen_subscriptions_chunk(self, mock_fnc, mock_metrics):
+        tasks.renew_adyen_subscriptions_chunk([1, 2])
+        mock_fnc.assert_called_once_with(
+            is_dry_run=False, subscription_ids=[1, 2], workers=4
+        )
+        mock_metrics.assert_called_once_with(mock_fnc.return_value)
+
+    @patch('amuse.cronjobs.tasks.renew_apple_subscriptions_chunk.delay')
+    @patch('subscriptions.renewal.get_chunks', return_value=[[1, 2], [3]])
+    def test_renew_apple_subscriptions(self, mock_chunks, mock_delay):
         tasks.renew_apple_subscriptios()
-        mock_fnc.assert_called_once_with(is_dry_run=False)
+        mock_delay.assert_has_calls([call([1, 2]), call([3])])
+
+    @override_settings(SUBSCRIPTION_RENEWAL_WORKERS=4)
+    @patch('amuse.vendor.aws.cloudwatch.subscription_renewal_metrics')
+    @patch('subscriptions.helpers.renew_apple_subscriptions')
+    def test_renew_apple_subscriptions_chunk(self, mock_fnc, mock_metrics):
+        tasks.renew_apple_subscriptions_chunk([1, 2])
+        mock_fnc.assert_called_once_with(
+            is_dry_run=False, subscription_ids=[1, 2], workers=4
+        )
+        mock_metrics.assert_called_once_with(mock_fnc.return_value)
 
     @patch('amuse.cronjobs.tasks.call_command')
     def test_update_expired_team_invites(self, mock_fnc):
@@ -1,6 +1,10 @@
+import time
+from unittest import mock
+
 import pytest
 
-from amuse.jwtkms import KmsManager
+from amuse.jwtkms import KmsManager, LocalVerifier, Token, TokenHeader, TokenPayload
+from amuse.jwtkms.benchmark import LocalKmsClient, run_benchmark
 from amuse.tokens import KmsJwtManager
 
 # Verify via KMS (get_public_key not available with `moto`)
@@ -43,3 +47,112 @@ def test_verify_cached(token, kms):
 
 def test_verify_invalid_signature(token, kms):
     assert not KmsManager(*kms).verify(token.unsigned + ".asdf")
+
+
+def _make_token(kms, exp=None):
+    return Token(
+        kms=kms,
+        header=TokenHeader(alg="RS256", typ="JWT"),
+        payload=TokenPayload(exp=exp or int(time.time() + 300), sub="user123"),
+    ).signed
+
+
+def test_local_verifier_verifies_without_kms():
+    client = LocalKmsClient()
+    kms = KmsManager(client, "arn")
+    token = _make_token(kms)
+    verifier = LocalVerifier(kms, refresh_interval=3600)
+
+    assert verifier.verify(token)
+    client.calls = 0
+    assert verifier.verify(token)
+    assert client.calls == 0
+
+
+def test_local_verifier_rejects_tampered_token():
+    kms = KmsManager(LocalKmsClient(), "arn")
+    header, payload, signature = _make_token(kms).split(".")
+    other_payload = _make_token(kms).split(".")[1]
+    verifier = LocalVerifier(kms, refresh_interval=3600)
+
+    assert not verifier.verify(f"{header}.{other_payload}x.{signature}")
+    assert not verifier.verify("not-a-token")
+
+
+def test_local_verifier_reloads_public_key_on_key_rotation():
+    client = LocalKmsClient()
+    kms = KmsManager(client, "arn")
+    verifier = LocalVerifier(kms, refresh_interval=3600)
+    assert verifier.verify(_make_token(kms))
+
+    client.private_key = LocalKmsClient().private_key
+    token = _make_token(kms)
+    client.calls = 0
+    assert verifier.verify(token)
+    # Only the public key reload
+    assert client.calls == 1
+
+    client.calls = 0
+    assert verifier.verify(token)
+    assert client.calls == 0
+
+
+def test_local_verifier_reloads_public_key_once_per_interval():
+    client = LocalKmsClient()
+    kms = KmsManager(client, "arn")
+    verifier = LocalVerifier(kms, refresh_interval=3600, reload_interval=60)
+    assert verifier.verify(_make_token(kms))
+
+    forged = _make_token(KmsManager(LocalKmsClient(), "arn"))
+    client.calls = 0
+    for _ in range(5):
+        assert not verifier.verify(forged)
+    assert client.calls == 1
+
+
+def test_local_verifier_rejects_other_algorithms_without_kms():
+    client = LocalKmsClient()
+    kms = KmsManager(client, "arn")
+    verifier = LocalVerifier(kms, refresh_interval=3600)
+    header, payload, signature = _make_token(kms).split(".")
+    other_header = Token.serialize({"alg": "none", "typ": "JWT"})
+
+    client.calls = 0
+    assert not verifier.verify(f"{other_header}.{payload}.{signature}")
+    assert client.calls == 0
+
+
+def test_local_verifier_falls_back_to_kms_without_public_key(token, kms):
+    verifier = LocalVerifier(KmsManager(*kms), refresh_interval=3600)
+    assert verifier.verify(token.signed)
+
+
+@mock.patch("amuse.jwtkms.verifier.threading.Thread")
+def test_local_verifier_refreshes_public_key_in_background(mocked_thread):
+    kms = KmsManager(LocalKmsClient(), "arn")
+    token = _make_token(kms)
+    verifier = LocalVerifier(kms, refresh_interval=0)
+
+    assert verifier.verify(token)
+    assert verifier.verify(token)
+    assert verifier.verify(token)
+
+    mocked_thread.assert_called_once_with(target=verifier._refresh, daemon=True)
+
+
+def test_decode_with_local_verification():
+    kms = KmsManager(LocalKmsClient(), "arn")
+    manager = type(
+        "LocalKmsJwtManager",
+        (KmsJwtManager,),
+        {"_kms": kms, "_verifier": None, "kms_verify": False},
+    )
+
+    assert manager.get_user_id(manager.make_access_token(user_id=1)) == 1
+    assert manager._decode_token(_make_token(kms, exp=int(time.time() - 1))) == {}
+
+
+def test_benchmark_only_calls_kms_in_kms_mode():
+    results = run_benchmark(iterations=5)["results"]
+
+    assert {r["mode"]: r["kms_calls"] for r in results} == {"kms": 5, "local": 0}
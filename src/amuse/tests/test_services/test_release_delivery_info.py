@@ -2,8 +2,10 @@ from unittest import mock
 
 import responses
 
+from django.db import connection
 from django.test import TestCase
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 from amuse.services.release_delivery_info import ReleaseDeliveryInfo
 from amuse.tests.helpers import (
@@ -11,6 +13,7 @@ from amuse.tests.helpers import (
     add_zendesk_mock_post_response,
 )
 from releases.models import Song, Store
+from releases.store_registry import store_registry
 from releases.tests.factories import (
     ReleaseFactory,
     SongFactory,
@@ -305,6 +308,56 @@ class TestReleaseDeliveryInfo(TestCase):
 
         assert delivery_channels == ['fuga_spotify', 'fuga_soundcloud']
 
+    def test_for_releases_matches_single_release_info(self):
+        self.release.stores.set([self.amazon, self.twitch, self.spotify])
+        self.explicit_release.stores.set([self.tencent, self.instagram, self.apple])
+        ReleaseStoreDeliveryStatusFactory(release=self.release, store=self.twitch)
+        ReleaseStoreDeliveryStatusFactory(
+            release=self.explicit_release, fuga_store=self.fuga_spotify
+        )
+        releases = [self.release, self.explicit_release]
+
+        delivery_infos = ReleaseDeliveryInfo.for_releases(releases)
+
+        for release in releases:
+            expected = ReleaseDeliveryInfo(release)
+            actual = delivery_infos[release.pk]
+            for method in ['insert', 'update', 'full_update', 'takedown']:
+                assert set(actual.get_direct_delivery_channels(method)) == set(
+                    expected.get_direct_delivery_channels(method)
+                )
+                assert actual.get_fuga_delivery_channels(
+                    method
+                ) == expected.get_fuga_delivery_channels(method)
+            assert [
+                (info['store'], info['deliver_to'], info['delivery_status'])
+                for info in actual.store_delivery_info
+            ] == [
+                (info['store'], info['deliver_to'], info['delivery_status'])
+                for info in expected.store_delivery_info
+            ]
+
+    def test_for_releases_runs_fixed_number_of_queries(self):
+        releases = [ReleaseFactory() for _ in range(5)]
+        for release in releases:
+            release.stores.set([self.spotify, self.apple, self.facebook])
+            ReleaseStoreDeliveryStatusFactory(release=release, store=self.apple)
+            ReleaseStoreDeliveryStatusFactory(
+                release=release, fuga_store=self.fuga_soundcloud
+            )
+
+        store_registry.all()
+        with CaptureQueriesContext(connection) as single_release_queries:
+            ReleaseDeliveryInfo.for_releases(releases[:1])
+
+        with CaptureQueriesContext(connection) as all_releases_queries:
+            ReleaseDeliveryInfo.for_releases(releases)
+
+        assert len(all_releases_queries) == len(single_release_queries)
+
+    def test_for_releases_without_releases_returns_empty_dict(self):
+        assert ReleaseDeliveryInfo.for_releases([]) == {}
+
     def test_has_been_live_on_fuga_store(self):
         self.assertFalse(
             ReleaseDeliveryInfo.has_been_live_on_fuga_store(
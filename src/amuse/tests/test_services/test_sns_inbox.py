@@ -0,0 +1,118 @@
+import json
+from datetime import timedelta
+from unittest import mock
+
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from amuse.models import SnsNotification
+from amuse.services import sns_inbox
+
+
+@mock.patch('amuse.vendor.aws.cloudwatch.sns_inbox_handler_latency')
+class SnsInboxDrainTestCase(TestCase):
+    def _create_notification(self, message_id, topic_arn, message):
+        return SnsNotification.objects.create(
+            message_id=message_id, topic_arn=topic_arn, message=json.dumps(message)
+        )
+
+    @mock.patch('amuse.services.lyrics.callback')
+    @mock.patch('amuse.services.audiorec.callback')
+    def test_drain_handles_pending_messages_grouped_by_topic(
+        self, mock_audiorec, mock_lyrics, mock_latency
+    ):
+        self._create_notification('1', settings.LYRICS_SERVICE_RESPONSE_TOPIC, {'a': 1})
+        self._create_notification(
+            '2', settings.AUDIO_RECOGNITION_SERVICE_RESPONSE_TOPIC, {'b': 2}
+        )
+        self._create_notification('3', settings.LYRICS_SERVICE_RESPONSE_TOPIC, {'a': 3})
+
+        assert sns_inbox.drain() == 3
+
+        assert mock_lyrics.call_args_list == [mock.call({'a': 1}), mock.call({'a': 3})]
+        mock_audiorec.assert_called_once_with({'b': 2})
+        assert mock_latency.call_count == 2
+        assert not SnsNotification.objects.exclude(
+            status=SnsNotification.STATUS_PROCESSED
+        ).exists()
+
+    @mock.patch('amuse.services.lyrics.callback')
+    def test_processed_messages_are_not_handled_again(self, mock_lyrics, mock_latency):
+        self._create_notification('1', settings.LYRICS_SERVICE_RESPONSE_TOPIC, {})
+
+        sns_inbox.drain()
+        assert sns_inbox.drain() == 0
+
+        mock_lyrics.assert_called_once_with({})
+
+    @override_settings(SNS_INBOX_MAX_ATTEMPTS=2)
+    @mock.patch('amuse.services.lyrics.callback', side_effect=KeyError('id'))
+    def test_failing_message_is_retried_until_max_attempts(
+        self, mock_lyrics, mock_latency
+    ):
+        notification = self._create_notification(
+            '1', settings.LYRICS_SERVICE_RESPONSE_TOPIC, {}
+        )
+
+        sns_inbox.drain()
+        notification.refresh_from_db()
+        assert notification.status == SnsNotification.STATUS_PENDING
+        assert notification.attempts == 1
+        assert 'KeyError' in notification.error
+
+        sns_inbox.drain()
+        notification.refresh_from_db()
+        assert notification.status == SnsNotification.STATUS_FAILED
+        assert notification.attempts == 2
+
+    @mock.patch('amuse.services.lyrics.callback')
+    def test_drain_is_limited_to_topic_and_batch_size(self, mock_lyrics, mock_latency):
+        for i in range(3):
+            self._create_notification(
+                str(i), settings.LYRICS_SERVICE_RESPONSE_TOPIC, {}
+            )
+        self._create_notification(
+            'other', settings.AUDIO_RECOGNITION_SERVICE_RESPONSE_TOPIC, {}
+        )
+
+        assert (
+            sns_inbox.drain(settings.LYRICS_SERVICE_RESPONSE_TOPIC, batch_size=2) == 2
+        )
+        assert (
+            SnsNotification.objects.filter(
+                status=SnsNotification.STATUS_PENDING
+            ).count()
+            == 2
+        )
+
+    @override_settings(SNS_INBOX_CLAIM_TIMEOUT=600)
+    @mock.patch('amuse.services.lyrics.callback')
+    def test_claimed_messages_are_only_claimed_again_after_timeout(
+        self, mock_lyrics, mock_latency
+    ):
+        claimed = self._create_notification(
+            'claimed', settings.LYRICS_SERVICE_RESPONSE_TOPIC, {'a': 1}
+        )
+        stale = self._create_notification(
+            'stale', settings.LYRICS_SERVICE_RESPONSE_TOPIC, {'a': 2}
+        )
+        SnsNotification.objects.filter(pk=claimed.pk).update(
+            status=SnsNotification.STATUS_IN_PROGRESS,
+            attempts=1,
+            date_claimed=timezone.now(),
+        )
+        SnsNotification.objects.filter(pk=stale.pk).update(
+            status=SnsNotification.STATUS_IN_PROGRESS,
+            attempts=1,
+            date_claimed=timezone.now() - timedelta(seconds=601),
+        )
+
+        assert sns_inbox.drain() == 1
+
+        mock_lyrics.assert_called_once_with({'a': 2})
+        stale.refresh_from_db()
+        assert stale.status == SnsNotification.STATUS_PROCESSED
+        assert stale.attempts == 2
+        claimed.refresh_from_db()
+        assert claimed.status == SnsNotification.STATUS_IN_PROGRESS
@@ -0,0 +1,104 @@
+import threading
+from datetime import datetime
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from amuse.vendor.aws import cloudwatch
+from slayer import cache as slayer_cache
+
+LOCMEM_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+}
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHES,
+    SLAYER_CACHE_REFRESH_HOUR=6,
+    SLAYER_CACHE_LOCK_TIMEOUT=5,
+    SLAYER_METRICS_INTERVAL=3600,
+)
+class SlayerCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        slayer_cache.metrics = slayer_cache.Metrics()
+
+    def test_timeout_expires_at_daily_refresh(self):
+        before = datetime(2021, 3, 1, 5, 30, tzinfo=timezone.utc)
+        after = datetime(2021, 3, 1, 7, 0, tzinfo=timezone.utc)
+
+        assert slayer_cache.get_timeout(before) == 30 * 60
+        assert slayer_cache.get_timeout(after) == 23 * 60 * 60
+
+    def test_responses_are_cached_per_arguments(self):
+        fn = mock.Mock(side_effect=lambda **kwargs: dict(kwargs))
+
+        for _ in range(2):
+            slayer_cache.get_or_call('daily', fn, artist_id=1, response_length=10)
+        response = slayer_cache.get_or_call(
+            'daily', fn, artist_id=1, response_length=20
+        )
+
+        assert fn.call_count == 2
+        assert response == {'artist_id': 1, 'response_length': 20}
+        assert slayer_cache.metrics.snapshot()['daily']['hits'] == 1
+        assert slayer_cache.metrics.snapshot()['daily']['misses'] == 2
+
+    def test_errors_are_not_cached(self):
+        fn = mock.Mock(side_effect=[ValueError, {'streams': 1}])
+
+        with self.assertRaises(ValueError):
+            slayer_cache.get_or_call('summary', fn, artist_id=1)
+
+        assert slayer_cache.get_or_call('summary', fn, artist_id=1) == {'streams': 1}
+        assert fn.call_count == 2
+
+    def test_concurrent_calls_share_one_upstream_call(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        responses = []
+
+        def fn(artist_id):
+            calls.append(artist_id)
+            started.set()
+            release.wait(5)
+            return {'artist_id': artist_id}
+
+        def call():
+            responses.append(slayer_cache.get_or_call('summary', fn, artist_id=1))
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait(5)
+        followers = [threading.Thread(target=call) for _ in range(3)]
+        for follower in followers:
+            follower.start()
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join(5)
+
+        assert calls == [1]
+        assert responses == [{'artist_id': 1}] * 4
+        stats = slayer_cache.metrics.snapshot()['summary']
+        assert stats['misses'] == 1
+        assert stats['hits'] == 3
+        assert len(stats['latencies']) == 1
+
+    @mock.patch('amuse.vendor.aws.cloudwatch.get_client')
+    def test_metrics_are_published_per_method(self, mock_get_client):
+        slayer_cache.get_or_call('summary', lambda artist_id: {}, artist_id=1)
+        slayer_cache.get_or_call('summary', lambda artist_id: {}, artist_id=1)
+
+        cloudwatch.slayer_response_metrics(slayer_cache.metrics.snapshot())
+
+        metric_data = mock_get_client().put_metric_data.call_args[1]['MetricData']
+        metrics = {metric['MetricName']: metric for metric in metric_data}
+        assert metrics['SlayerCacheHits']['Value'] == 1
+        assert metrics['SlayerCacheMisses']['Value'] == 1
+        assert metrics['SlayerUpstreamLatency']['StatisticValues']['SampleCount'] == 1
+        assert metrics['SlayerCacheHits']['Dimensions'] == [
+            {'Name': 'Method', 'Value': 'summary'}
+        ]
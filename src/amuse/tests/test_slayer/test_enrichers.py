@@ -0,0 +1,58 @@
+from django.test import TestCase
+
+from releases.tests.factories import CoverArtFactory, ReleaseFactory, SongFactory
+from slayer.analytics import metadata as metadata_cache
+from slayer.analytics.serializers.enrichers.base import BaseEnricher
+
+
+class EnricherMetadataTestCase(TestCase):
+    def setUp(self):
+        metadata_cache.releases.clear()
+        metadata_cache.tracks.clear()
+
+    def test_releases_are_enriched_by_upc_with_one_query(self):
+        releases = [ReleaseFactory() for _ in range(3)]
+        CoverArtFactory(release=releases[0], user=releases[0].user)
+        summaries = [{"upc": r.upc.code} for r in releases + releases[:1]]
+        summaries.append({"upc": "unknown"})
+
+        with self.assertNumQueries(1):
+            BaseEnricher().enrich_releasedata(summaries)
+
+        releases[0].refresh_from_db()
+        assert summaries[0]["release_metadata"] == {
+            "name": releases[0].name,
+            "version": releases[0].release_version,
+            "release_date": releases[0].release_date.strftime("%Y-%m-%d"),
+            "cover_art": releases[0].cover_art.thumbnail_url_400,
+        }
+        assert summaries[3]["release_metadata"] == summaries[0]["release_metadata"]
+        assert summaries[1]["release_metadata"]["name"] == releases[1].name
+        assert "release_metadata" not in summaries[4]
+
+    def test_tracks_are_enriched_by_isrc(self):
+        songs = [SongFactory() for _ in range(2)]
+        tracks = [{"isrc": s.isrc.code} for s in songs + songs]
+        tracks.append({"isrc": "unknown"})
+
+        BaseEnricher().enrich_tracks(tracks)
+
+        assert tracks[0]["track_metadata"]["name"] == songs[0].name
+        assert tracks[2]["track_metadata"] == tracks[0]["track_metadata"]
+        assert tracks[1]["track_metadata"]["version"] == songs[1].version
+        assert tracks[4] == {"isrc": "unknown", "track_metadata": {}}
+
+    def test_metadata_is_cached_in_process(self):
+        song = SongFactory()
+        enricher = BaseEnricher()
+
+        track_metadata = enricher.get_enriched_track(song.isrc.code)
+        with self.assertNumQueries(0):
+            assert enricher.get_enriched_track(song.isrc.code) == track_metadata
+
+        assert metadata_cache.tracks.stats() == {
+            "hits": 1,
+            "misses": 1,
+            "size": 1,
+            "hit_rate": 0.5,
+        }
@@ -0,0 +1,74 @@
+import time
+from concurrent.futures import TimeoutError
+from unittest import mock
+
+import pytest
+from django.test import SimpleTestCase
+
+from slayer.analytics.fanout import Fanout
+
+
+def slow_call(value, delay=0.2):
+    time.sleep(delay)
+    return value
+
+
+class FanoutTestCase(SimpleTestCase):
+    def test_calls_run_concurrently(self):
+        fanout = Fanout(deadline=5)
+        started = time.monotonic()
+
+        futures = [fanout.submit(slow_call, i) for i in range(3)]
+        results = [fanout.result(future) for future in futures]
+
+        assert results == [0, 1, 2]
+        assert time.monotonic() - started < 0.5
+
+    def test_deadline_is_shared_by_all_calls(self):
+        fanout = Fanout(deadline=0.1)
+        future = fanout.submit(slow_call, 'late', delay=0.5)
+
+        with pytest.raises(TimeoutError):
+            fanout.result(future)
+        assert fanout.result(future, default={}) == {}
+
+    def test_resolve_returns_partial_results(self):
+        fanout = Fanout(deadline=0.1)
+
+        fields = fanout.resolve(
+            {
+                'artist_metadata': {'name': 'Artist'},
+                'latest_release': fanout.submit(slow_call, {'upc': '1'}, delay=0),
+                'late': fanout.submit(slow_call, {'upc': '2'}, delay=0.5),
+            }
+        )
+
+        assert fields == {
+            'artist_metadata': {'name': 'Artist'},
+            'latest_release': {'upc': '1'},
+            'late': {},
+        }
+
+    def test_cached_response_is_not_submitted(self):
+        fanout = Fanout(deadline=5)
+        method = mock.Mock()
+        method.get_cached.return_value = {'streams': 1}
+
+        future = fanout.submit_cached(method, artist_id=1)
+
+        assert future.done()
+        assert fanout.result(future) == {'streams': 1}
+        method.get_cached.assert_called_once_with(artist_id=1)
+        method.assert_not_called()
+
+    @mock.patch('slayer.analytics.fanout.connection')
+    def test_cache_miss_closes_worker_connection(self, mock_connection):
+        fanout = Fanout(deadline=5)
+        method = mock.Mock(return_value={'streams': 1})
+        method.get_cached.return_value = None
+
+        future = fanout.submit_cached(method, artist_id=1)
+
+        assert fanout.result(future) == {'streams': 1}
+        method.assert_called_once_with(artist_id=1)
+        mock_connection.close.assert_called_once_with()
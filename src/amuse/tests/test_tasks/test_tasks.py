@@ -688,6 +688,21 @@ class TaskTestCase(TestCase):
 
         mock_task.assert_called_once_with(data)
 
+    @override_settings(SEGMENT_UPDATE_IS_PRO_STATE=True)
+    @mock.patch('amuse.tasks.zendesk.update_users')
+    @mock.patch('amuse.tasks.update_is_pro_state')
+    def test_update_users_subscription_state(
+        self, mock_update_is_pro_state, mock_update_zendesk_users
+    ):
+        add_zendesk_mock_post_response()
+        zendesk_user = UserFactory(zendesk_id=123)
+        user = UserFactory(zendesk_id=None)
+
+        tasks.update_users_subscription_state([zendesk_user.pk, user.pk])
+
+        assert mock_update_is_pro_state.call_count == 2
+        mock_update_zendesk_users.assert_called_once_with([zendesk_user])
+
 
 @pytest.mark.django_db
 @mock.patch("amuse.tasks.sleep")
@@ -924,7 +924,10 @@ class HyperwalletHelpersTestCase(TransactionTestCase):
         post_process_standard_withdrawal(payload)
 
         mock_update_withdrawal.assert_called_once_with(
-            payload["transaction_id"], "is_complete", description=payload["description"]
+            payload["transaction_id"],
+            "is_complete",
+            description=payload["description"],
+            user_id=payload["user_id"],
         )
         mock_logger.assert_called_once()
 
@@ -942,7 +945,10 @@ class HyperwalletHelpersTestCase(TransactionTestCase):
         post_process_standard_withdrawal(payload)
 
         mock_update_withdrawal.assert_called_once_with(
-            payload["transaction_id"], "is_complete", description=payload["description"]
+            payload["transaction_id"],
+            "is_complete",
+            description=payload["description"],
+            user_id=payload["user_id"],
         )
         mock_logger.assert_called_once()
 
@@ -960,7 +966,7 @@ class HyperwalletHelpersTestCase(TransactionTestCase):
         cancel_standard_withdrawal(payload)
 
         mock_update_withdrawal.assert_called_once_with(
-            payload["transaction_id"], "is_cancelled"
+            payload["transaction_id"], "is_cancelled", user_id=payload["user_id"]
         )
         mock_logger.assert_called_once()
 
@@ -976,7 +982,7 @@ class HyperwalletHelpersTestCase(TransactionTestCase):
         cancel_standard_withdrawal(payload)
 
         mock_update_withdrawal.assert_called_once_with(
-            payload["transaction_id"], "is_cancelled"
+            payload["transaction_id"], "is_cancelled", user_id=payload["user_id"]
         )
         mock_logger.assert_called_once()
 
@@ -1,17 +1,23 @@
 import json
 
+import pytest
 import responses
+from freezegun import freeze_time
 
 from amuse.tests.test_vendor.test_revenue.helpers import mock_transaction_summary
 from amuse.vendor.revenue.client import (
     get_balance,
     get_transactions,
+    get_wallet,
     record_withdrawal,
+    refund,
     update_withdrawal,
+    URL_RECORD_HYPERWALLET_REFUND,
     URL_RECORD_HYPERWALLET_WITHDRAWAL,
     URL_SUMMARY_BALANCE,
     URL_SUMMARY_TRANSACTIONS,
     URL_UPDATE_HYPERWALLET_WITHDRAWAL,
+    URL_WALLET,
 )
 from amuse.vendor.revenue.helpers import transform_data
 
@@ -76,6 +82,7 @@ def test_get_summary_transactions_handles_revenue_system_zero_balance_response()
     assert get_transactions(user_id=111) == mock_response
 
 
+@pytest.mark.django_db
 @responses.activate
 def test_record_hyperwallet_withdrawal_success():
     payload = {"user_id": 111, "total": "10.00", "currency": "USD", "description": {}}
@@ -148,3 +155,61 @@ def test_update_pending_hyperwallet_withdrawal_returns_none_when_call_fails():
         )
         is None
     )
+
+
+@pytest.mark.django_db
+@responses.activate
+@freeze_time("2020-03-15")
+def test_get_wallet_caches_closed_and_current_months(settings):
+    settings.REVENUE_WALLET_CACHE_TIMEOUT = 60
+    settings.REVENUE_WALLET_CLOSED_MONTH_CACHE_TIMEOUT = 3600
+    responses.add(responses.GET, URL_WALLET % 111, json.dumps({"total": 1}))
+
+    for year_month in [None, None, "2020-02", "2020-02"]:
+        assert get_wallet(111, year_month=year_month) == {"total": 1}
+
+    assert len(responses.calls) == 2
+
+    with freeze_time("2020-03-15 00:02:00"):
+        get_wallet(111)
+        get_wallet(111, year_month="2020-02")
+
+    assert len(responses.calls) == 3
+
+
+@pytest.mark.django_db
+@responses.activate
+def test_get_wallet_does_not_cache_failures():
+    responses.add(responses.GET, URL_WALLET % 111, status=500)
+    responses.add(responses.GET, URL_WALLET % 111, json.dumps({"total": 1}))
+
+    assert get_wallet(111) is None
+    assert get_wallet(111) == {"total": 1}
+
+
+@pytest.mark.django_db
+@responses.activate
+def test_wallet_is_invalidated_by_successful_withdrawals_and_refunds():
+    response = json.dumps({"transaction_id": "xxx"})
+    responses.add(responses.GET, URL_WALLET % 111, json.dumps({"total": 1}))
+    responses.add(responses.PUT, URL_UPDATE_HYPERWALLET_WITHDRAWAL, response)
+    responses.add(responses.POST, URL_RECORD_HYPERWALLET_REFUND, response, status=201)
+
+    get_wallet(111, year_month="2020-01")
+    update_withdrawal("xxx", "is_complete", user_id=222)
+    get_wallet(111, year_month="2020-01")
+    assert len(responses.calls) == 2
+
+    update_withdrawal("xxx", "is_complete", user_id=111)
+    get_wallet(111, year_month="2020-01")
+    refund(111, "xxx", "payment", "10.00")
+    get_wallet(111, year_month="2020-01")
+
+    assert [call.request.method for call in responses.calls] == [
+        "GET",
+        "PUT",
+        "PUT",
+        "GET",
+        "POST",
+        "GET",
+    ]
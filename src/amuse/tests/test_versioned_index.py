@@ -0,0 +1,48 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from amuse.versioned_index import VersionedIndex
+
+VERSION_CACHE_KEY = 'tests:versioned_index:version'
+
+
+@override_settings(VERSIONED_INDEX_CHECK_INTERVAL=60)
+@mock.patch('amuse.versioned_index.time.monotonic', return_value=1000)
+class VersionedIndexTestCase(TestCase):
+    def setUp(self):
+        cache.delete(VERSION_CACHE_KEY)
+        self.build = mock.Mock(side_effect=lambda: object())
+        self.index = VersionedIndex(VERSION_CACHE_KEY, self.build)
+
+    def test_version_is_checked_once_per_interval(self, mock_monotonic):
+        index = self.index.get()
+
+        with self.assertNumQueries(0):
+            assert self.index.get() is index
+
+        mock_monotonic.return_value = 1060
+        assert self.index.get() is index
+        self.build.assert_called_once_with()
+
+    def test_change_in_other_process_is_picked_up_after_interval(self, mock_monotonic):
+        index = self.index.get()
+        cache.set(VERSION_CACHE_KEY, 'changed-by-other-process')
+
+        assert self.index.get() is index
+
+        mock_monotonic.return_value = 1060
+        assert self.index.get() is not index
+        assert self.build.call_count == 2
+
+    @mock.patch('amuse.versioned_index.transaction.on_commit')
+    def test_invalidate_rebuilds_in_this_process(self, mock_on_commit, mock_monotonic):
+        index = self.index.get()
+        version = cache.get(VERSION_CACHE_KEY)
+
+        self.index.invalidate()
+
+        assert cache.get(VERSION_CACHE_KEY) != version
+        assert self.index.get() is not index
+        mock_on_commit.assert_called_once_with(self.index._replace_version)
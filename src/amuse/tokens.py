@@ -14,7 +14,7 @@ from jwt.exceptions import (
     DecodeError,
 )
 
-from amuse.jwtkms import Token, TokenHeader, TokenPayload, KmsManager
+from amuse.jwtkms import Token, TokenHeader, TokenPayload, KmsManager, LocalVerifier
 
 
 class EmailVerificationTokenGenerator:
@@ -173,12 +173,13 @@ class AuthTokenGenerator:
 class KmsJwtManager(AuthTokenGenerator):
     signing_key = None  # Uses KMS SK
     verifying_key = None  # Uses KMS PK
-    kms_verify = False  # Whether to verify via KMS
+    kms_verify = False  # Whether to verify every token via KMS
 
     _kms = KmsManager(
         client=boto3.client("kms", region_name=settings.AWS_REGION),
         arn=settings.JWT_SIGN_VERIFY_KMS_ARN,
     )
+    _verifier = None
 
     @classmethod
     def make_token(cls, payload: dict) -> str:
@@ -190,14 +191,27 @@ class KmsJwtManager(AuthTokenGenerator):
             ),
         ).signed
 
+    @classmethod
+    def _get_verifier(cls):
+        if cls._verifier is None or cls._verifier.kms is not cls._kms:
+            cls._verifier = LocalVerifier(
+                kms=cls._kms,
+                refresh_interval=settings.JWT_KMS_PUBKEY_REFRESH_SECS,
+                reload_interval=settings.JWT_KMS_PUBKEY_RELOAD_SECS,
+            )
+        return cls._verifier
+
     @classmethod
     def _decode_token(cls, token):
         try:
+            # Expired and malformed tokens are rejected before the signature
+            # is verified, which can call KMS
+            payload = jwt.decode(token, options={"verify_signature": False})
             if cls.kms_verify:
-                cls._kms.verify(token)
-                return jwt.decode(token, verify=False)
+                valid = cls._kms.verify(token)
             else:
-                return jwt.decode(token, key=cls._kms.public_key, verify=True)
+                valid = cls._get_verifier().verify(token)
+            return payload if valid else {}
         except Exception as e:
             # @TODO: Add logging
             return {}
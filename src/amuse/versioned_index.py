@@ -0,0 +1,55 @@
+"""
+Per-process indexes of rarely changing rows, rebuilt when their version in the
+shared cache changes.
+"""
+import threading
+import time
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+
+class VersionedIndex:
+    def __init__(self, version_cache_key, build):
+        self.version_cache_key = version_cache_key
+        # Returns the index, called with the lock held
+        self.build = build
+        self._lock = threading.Lock()
+        self._index = None
+        self._version = None
+        self._checked_at = None
+
+    def _get_version(self):
+        version = cache.get(self.version_cache_key)
+        if version is None:
+            cache.add(self.version_cache_key, uuid4().hex, timeout=None)
+            version = cache.get(self.version_cache_key)
+        return version
+
+    def get(self):
+        """Returns the index, rebuilding it when its version changed."""
+        with self._lock:
+            if (
+                self._index is not None
+                and time.monotonic() - self._checked_at
+                < settings.VERSIONED_INDEX_CHECK_INTERVAL
+            ):
+                return self._index
+
+            version = self._get_version()
+            if self._index is None or self._version != version:
+                self._index = self.build()
+                self._version = version
+            self._checked_at = time.monotonic()
+            return self._index
+
+    def _replace_version(self):
+        cache.set(self.version_cache_key, uuid4().hex, timeout=None)
+        with self._lock:
+            self._index = None
+
+    def invalidate(self):
+        self._replace_version()
+        transaction.on_commit(self._replace_version)
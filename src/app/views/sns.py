@@ -9,9 +9,7 @@ from django.views.decorators.csrf import csrf_exempt
 from rest_framework import status
 from waffle import switch_is_active
 
-from amuse.analytics import royalty_advance_notification
-from amuse.services import audiorec, ffwd, lyrics, transcoding, smart_link
-from amuse.services.delivery import callback as delivery_callback
+from amuse.services import sns_inbox, transcoding
 from amuse.utils import is_authenticated_http
 
 logger = logging.getLogger(__name__)
@@ -62,6 +60,20 @@ def response():
     return HttpResponse('OK')
 
 
+def unauthorized_response():
+    auth_response = HttpResponse(status=status.HTTP_401_UNAUTHORIZED)
+    auth_response['WWW-Authenticate'] = 'Basic'
+    return auth_response
+
+
+def requires_authentication(topic):
+    if topic == settings.SMART_LINK_CALLBACK_SNS_TOPIC:
+        return True
+    return topic == settings.FFWD_RECOUP_SNS_TOPIC and switch_is_active(
+        'sns:require_ffwd_recoup_auth'
+    )
+
+
 @csrf_exempt
 def song_file_transcoder_state_change(request):
     data = read_json(request)
@@ -92,48 +104,27 @@ def notification(request):
         try:
             topic = read_topic_arn(data)
             message = read_message_json(data)
-            if topic == settings.LYRICS_SERVICE_RESPONSE_TOPIC:
-                lyrics.callback(message)
-            elif topic == settings.AUDIO_RECOGNITION_SERVICE_RESPONSE_TOPIC:
-                audiorec.callback(message)
-            elif topic == settings.AUDIO_TRANSCODER_SERVICE_RESPONSE_TOPIC:
-                transcoding.callback(message)
-            elif topic == settings.FFWD_RECOUP_SNS_TOPIC:
-                logger.info('Recoup event with splits: %s', message['split_ids'])
-                if switch_is_active(
-                    'sns:require_ffwd_recoup_auth'
-                ) and not is_authenticated_http(
-                    request, settings.AWS_SNS_USER, settings.AWS_SNS_PASSWORD
-                ):
-                    auth_response = HttpResponse(status=status.HTTP_401_UNAUTHORIZED)
-                    auth_response['WWW-Authenticate'] = 'Basic'
-                    return auth_response
-
-                ffwd.unlock_splits(message['split_ids'])
-                logger.info('Unlocked splits: %s', message['split_ids'])
-            elif topic == settings.FFWD_NOTIFICATION_SNS_TOPIC:
-                royalty_advance_notification(
-                    message['user_id'],
-                    message['msg_type'],
-                    message['total_user_amount'],
-                )
-            elif topic == settings.SMART_LINK_CALLBACK_SNS_TOPIC:
-                if not is_authenticated_http(
-                    request, settings.AWS_SNS_USER, settings.AWS_SNS_PASSWORD
-                ):
-                    auth_response = HttpResponse(status=status.HTTP_401_UNAUTHORIZED)
-                    auth_response['WWW-Authenticate'] = 'Basic'
-                    return auth_response
-
-                smart_link.amuse_smart_link_callback(message)
-            elif topic == settings.RELEASE_DELIVERY_SERVICE_RESPONSE_TOPIC:
-                try:
-                    delivery_callback.handler(message)
-                except exceptions.ObjectDoesNotExist:
-                    return HttpResponse(status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-            else:
+            handler = sns_inbox.get_topic_handler(topic)
+            if handler is None:
                 logger.warning('Unknown SNS topic %s received %s', topic, message)
                 return invalid_topic_response(topic)
+            if requires_authentication(topic) and not is_authenticated_http(
+                request, settings.AWS_SNS_USER, settings.AWS_SNS_PASSWORD
+            ):
+                return unauthorized_response()
+
+            if switch_is_active('sns:async-inbox'):
+                if not data.get('MessageId'):
+                    raise ValueError('Missing MessageId')
+                sns_inbox.enqueue(data['MessageId'], topic, data['Message'])
+                return response()
+
+            try:
+                handler(message)
+            except exceptions.ObjectDoesNotExist:
+                if topic != settings.RELEASE_DELIVERY_SERVICE_RESPONSE_TOPIC:
+                    raise
+                return HttpResponse(status=status.HTTP_500_INTERNAL_SERVER_ERROR)
         except ValueError:
             logger.warning('Invalid SNS message: %s', data)
             return bad_json_request_response()
@@ -0,0 +1,106 @@
+"""
+Concurrency benchmark of ISRC/UPC allocation.
+
+For every worker count, creates unused codes with a unique benchmark prefix
+and lets that many threads allocate them with use(None), optionally taking
+preallocated blocks, and reports allocations per second and allocation
+latencies. Every worker thread uses its own database connection, so the
+benchmark codes have to be committed. Only the benchmark codes are allocated
+and they are deleted afterwards, still only run it against a local database.
+With a single worker the codes are allocated in the calling thread. Use the
+benchmark_codes command.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from uuid import uuid4
+
+from django.db import connection
+
+from codes.models import ISRC, UPC
+
+BENCHMARK_PREFIX = 'BENCH'
+CODE_MODELS = {'isrc': ISRC, 'upc': UPC}
+
+
+def create_codes(model, prefix, count, batch_size=5000):
+    model.objects.bulk_create(
+        [model(code='%s%07d' % (prefix, i)) for i in range(count)],
+        batch_size=batch_size,
+    )
+
+
+def _allocate(queryset, allocations, block_size):
+    """Allocates codes and returns their IDs and latencies in milliseconds."""
+    code_ids = []
+    latencies = []
+    while len(code_ids) < allocations:
+        count = min(block_size or 1, allocations - len(code_ids))
+        started = time.perf_counter()
+        if block_size:
+            with queryset.preallocated(count):
+                for _ in range(count):
+                    code_ids.append(queryset.use(None).pk)
+        else:
+            code_ids.append(queryset.use(None).pk)
+        latencies.append((time.perf_counter() - started) * 1000 / count)
+    return code_ids, latencies
+
+
+def _allocate_in_thread(queryset, allocations, block_size):
+    try:
+        return _allocate(queryset, allocations, block_size)
+    finally:
+        connection.close()
+
+
+def _percentile(values, percent):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+def run_workers(queryset, workers, allocations, block_size=None):
+    """Returns the results of `workers` threads allocating codes each."""
+    started = time.perf_counter()
+    if workers <= 1:
+        worker_results = [_allocate(queryset, allocations, block_size)]
+    else:
+        allocate = partial(
+            _allocate_in_thread, allocations=allocations, block_size=block_size
+        )
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            worker_results = list(pool.map(allocate, [queryset] * workers))
+    wall_time = time.perf_counter() - started
+
+    code_ids = [code_id for ids, _ in worker_results for code_id in ids]
+    latencies = [latency for _, values in worker_results for latency in values]
+    return {
+        'workers': workers,
+        'block_size': block_size,
+        'allocations': len(code_ids),
+        'duplicates': len(code_ids) - len(set(code_ids)),
+        'wall_time_s': round(wall_time, 4),
+        'allocations_per_s': round(len(code_ids) / wall_time, 1),
+        'latency_p50_ms': round(_percentile(latencies, 50), 3),
+        'latency_p99_ms': round(_percentile(latencies, 99), 3),
+    }
+
+
+def run_benchmark(workers, allocations=200, block_size=None, code_type='upc'):
+    """
+    Returns a dict with the results for every worker count, every worker
+    allocating `allocations` codes. The benchmark codes are deleted.
+    """
+    model = CODE_MODELS[code_type]
+    results = []
+
+    for worker_count in workers:
+        prefix = f'{BENCHMARK_PREFIX}{uuid4().hex[:8].upper()}'
+        create_codes(model, prefix, worker_count * allocations)
+        try:
+            queryset = model.objects.filter(code__startswith=prefix)
+            results.append(run_workers(queryset, worker_count, allocations, block_size))
+        finally:
+            model.objects.filter(code__startswith=prefix).delete()
+
+    return {'code_type': code_type, 'results': results}
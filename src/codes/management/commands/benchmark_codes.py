@@ -0,0 +1,64 @@
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from codes.benchmark import CODE_MODELS, run_benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark concurrent ISRC/UPC allocation. Benchmark codes are committed "
+        "for the worker threads and deleted afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            nargs="+",
+            default=[1, 4, 8],
+            help="Space-separated numbers of parallel workers",
+        )
+        parser.add_argument(
+            "--allocations", type=int, default=200, help="Allocations per worker"
+        )
+        parser.add_argument(
+            "--block-size",
+            type=int,
+            default=None,
+            help="Codes preallocated per block, allocates one at a time if unset",
+        )
+        parser.add_argument(
+            "--code-type", type=str, choices=list(CODE_MODELS), default="upc"
+        )
+        parser.add_argument(
+            "--output", type=str, default=None, help="Write the JSON results to file"
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            default=False,
+            help="Run even when DEBUG is off",
+        )
+
+    def handle(self, *args, **kwargs):
+        if not settings.DEBUG and not kwargs["force"]:
+            raise CommandError(
+                "Only run the benchmark against a local database, use --force to "
+                "run it with DEBUG off"
+            )
+
+        results = run_benchmark(
+            kwargs["workers"],
+            allocations=kwargs["allocations"],
+            block_size=kwargs["block_size"],
+            code_type=kwargs["code_type"],
+        )
+        output = json.dumps(results, indent=2)
+
+        if kwargs["output"]:
+            with open(kwargs["output"], "w") as f:
+                f.write(output)
+        else:
+            self.stdout.write(output)
@@ -5,6 +5,9 @@ from codes.models import ISRC, UPC
 
 class Command(BaseCommand):
     def handle(self, *args, **options):
-        for i in range(0, 1000):
-            ISRC.objects.create(code='XX%03d%07d' % (i, i))
-            UPC.objects.create(code='TEST%s' % str(uuid4().hex)[:8].upper())
+        ISRC.objects.bulk_create(
+            [ISRC(code='XX%03d%07d' % (i, i)) for i in range(0, 1000)]
+        )
+        UPC.objects.bulk_create(
+            [UPC(code='TEST%s' % str(uuid4().hex)[:8].upper()) for i in range(0, 1000)]
+        )
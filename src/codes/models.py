@@ -1,3 +1,6 @@
+import threading
+from contextlib import contextmanager
+
 from django.db import models, transaction
 
 FAKE_UPC = '0000000000000'
@@ -20,12 +23,26 @@ MANAGED_ISRC_STEMS = [
 ]
 
 
-class CodeManager(models.Manager):
+# Model label => codes preallocated by the current thread
+_preallocated = threading.local()
+
+
+def _get_preallocated(model):
+    if not hasattr(_preallocated, 'codes'):
+        _preallocated.codes = {}
+    return _preallocated.codes.setdefault(model._meta.label, [])
+
+
+class CodeQuerySet(models.QuerySet):
     def first_unused(self):
+        """
+        Locks and returns the first unused code. Codes locked by concurrent
+        allocations are skipped instead of waited for.
+        """
         return (
-            self.get_queryset()
-            .select_for_update()
-            .filter(status=Code.STATUS_UNUSED)[:1][0]
+            self.select_for_update(skip_locked=True)
+            .filter(status=Code.STATUS_UNUSED)
+            .order_by('pk')[:1][0]
         )
 
     def use(self, code):
@@ -35,15 +52,51 @@ class CodeManager(models.Manager):
         :return: Code
         """
         if code:
-            return self.get_queryset().get_or_create(
-                code=code, status=Code.STATUS_USED
-            )[0]
+            return self.get_or_create(code=code, status=Code.STATUS_USED)[0]
+        preallocated = _get_preallocated(self.model)
+        if preallocated:
+            return preallocated.pop()
         with transaction.atomic():
             code = self.first_unused()
             code.status = Code.STATUS_USED
-            code.save()
+            code.save(update_fields=['status'])
             return code
 
+    @contextmanager
+    def preallocated(self, count):
+        """
+        Allocates a block of up to `count` unused codes with one lock and one
+        update, which use(None) calls for this model in the current thread
+        take from before allocating more. Codes left in the block are unused
+        again on exit, while taken codes stay used even if the transaction
+        saving them is rolled back.
+        """
+        with transaction.atomic():
+            codes = list(
+                self.select_for_update(skip_locked=True)
+                .filter(status=Code.STATUS_UNUSED)
+                .order_by('pk')[:count]
+            )
+            self.model.objects.filter(pk__in=[code.pk for code in codes]).update(
+                status=Code.STATUS_USED
+            )
+        for code in codes:
+            code.status = Code.STATUS_USED
+
+        preallocated = _get_preallocated(self.model)
+        block = list(reversed(codes))
+        preallocated.extend(block)
+        try:
+            yield codes
+        finally:
+            unused = [code.pk for code in block if code in preallocated]
+            preallocated[:] = [code for code in preallocated if code not in block]
+            self.model.objects.filter(pk__in=unused).update(status=Code.STATUS_UNUSED)
+
+
+class CodeManager(models.Manager.from_queryset(CodeQuerySet)):
+    pass
+
 
 class Code(models.Model):
     STATUS_UNUSED = 0
@@ -0,0 +1,55 @@
+import json
+import tempfile
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from codes.benchmark import BENCHMARK_PREFIX, run_benchmark
+from codes.models import ISRC, UPC
+from codes.tests.factories import UPCFactory
+
+
+class CodesBenchmarkTestCase(TestCase):
+    def setUp(self):
+        self.unused_upc = UPCFactory(status=UPC.STATUS_UNUSED)
+
+    def test_run_benchmark_allocates_only_benchmark_codes(self):
+        results = run_benchmark([1], allocations=5)
+
+        [result] = results['results']
+        assert result['workers'] == 1
+        assert result['allocations'] == 5
+        assert result['duplicates'] == 0
+        assert result['allocations_per_s'] > 0
+        assert not UPC.objects.filter(code__startswith=BENCHMARK_PREFIX).exists()
+        self.unused_upc.refresh_from_db()
+        assert self.unused_upc.status == UPC.STATUS_UNUSED
+
+    def test_run_benchmark_with_preallocated_blocks(self):
+        results = run_benchmark([1], allocations=5, block_size=2, code_type='isrc')
+
+        [result] = results['results']
+        assert result['allocations'] == 5
+        assert result['block_size'] == 2
+        assert not ISRC.objects.filter(code__startswith=BENCHMARK_PREFIX).exists()
+
+    def test_command_writes_json_output(self):
+        with tempfile.NamedTemporaryFile(suffix='.json') as f:
+            call_command(
+                'benchmark_codes',
+                '--workers',
+                '1',
+                '--allocations',
+                '2',
+                '--output',
+                f.name,
+                '--force',
+            )
+            results = json.load(f)
+
+        assert results['results'][0]['allocations'] == 2
+
+    def test_command_requires_debug_or_force(self):
+        with self.assertRaises(CommandError):
+            call_command('benchmark_codes', '--workers', '1')
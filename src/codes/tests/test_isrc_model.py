@@ -1,6 +1,7 @@
 from django.test import TestCase
 from codes.tests.factories import ISRCFactory
 from codes.models import ISRC
+from codes.utils import generate_isrc
 
 
 class ISRCTestCase(TestCase):
@@ -53,3 +54,12 @@ class ISRCTestCase(TestCase):
         self.assertEqual(ISRC.objects.count(), 3)
         # The newly created ISRC should have used as status.
         self.assertEqual(new_isrc.status, ISRC.STATUS_USED)
+
+    def test_generate_isrc(self):
+        """Test that generate_isrc creates unused ISRC with the prefix."""
+        generate_isrc(prefix='SE5BU99', count=10, batch_size=3)
+
+        codes = ISRC.objects.filter(code__startswith='SE5BU99')
+        self.assertEqual(codes.count(), 10)
+        self.assertFalse(codes.exclude(status=ISRC.STATUS_UNUSED).exists())
+        self.assertTrue(codes.filter(code='SE5BU9900009').exists())
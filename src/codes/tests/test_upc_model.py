@@ -53,3 +53,29 @@ class UPCTestCase(TestCase):
         self.assertEqual(UPC.objects.count(), 3)
         # The newly created UPC should have used as status.
         self.assertEqual(new_upc.status, UPC.STATUS_USED)
+
+    def test_use_method_takes_codes_from_preallocated_block(self):
+        """
+        Test that use picks codes from the preallocated block and that codes
+        left in the block are unused again afterwards.
+        """
+        second_unused_upc = UPCFactory(status=UPC.STATUS_UNUSED)
+        third_unused_upc = UPCFactory(status=UPC.STATUS_UNUSED)
+
+        with UPC.objects.preallocated(2) as block:
+            self.assertEqual(block, [self.unused_upc, second_unused_upc])
+            self.assertEqual(
+                UPC.objects.get(pk=second_unused_upc.pk).status, UPC.STATUS_USED
+            )
+            with self.assertNumQueries(0):
+                self.assertEqual(UPC.objects.use(None), self.unused_upc)
+
+        self.assertEqual(
+            UPC.objects.get(pk=second_unused_upc.pk).status, UPC.STATUS_UNUSED
+        )
+        self.assertEqual(UPC.objects.get(pk=self.unused_upc.pk).status, UPC.STATUS_USED)
+        # Without a block the next code is allocated from the table
+        self.assertEqual(UPC.objects.use(None), second_unused_upc)
+        self.assertEqual(
+            UPC.objects.get(pk=third_unused_upc.pk).status, UPC.STATUS_UNUSED
+        )
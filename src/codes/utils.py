@@ -2,8 +2,9 @@ from random import shuffle
 from codes.models import ISRC
 
 
-def generate_isrc():
-    n = list(range(0, 99999))
+def generate_isrc(prefix='SE5BU17', count=99999, batch_size=5000):
+    n = list(range(0, count))
     shuffle(n)
-    for i in n:
-        ISRC.objects.create(code='SE5BU17%05d' % i)
+    ISRC.objects.bulk_create(
+        [ISRC(code='%s%05d' % (prefix, i)) for i in n], batch_size=batch_size
+    )
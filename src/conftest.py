@@ -80,6 +80,12 @@ def celery_configuration():
     settings.CELERY_ALWAYS_EAGER = True
 
 
+@pytest.fixture(scope='session', autouse=True)
+def versioned_index_configuration():
+    # The cache is rolled back with the database after every test
+    settings.VERSIONED_INDEX_CHECK_INTERVAL = 0
+
+
 @pytest.fixture(scope='session', autouse=True)
 def fast_password_hashing():
     settings.PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
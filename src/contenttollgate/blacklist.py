@@ -16,26 +16,22 @@ def find_offending_words(release):
     for artist in release.artists.all():
         potential_matches.add(artist.name)
 
-    for song in release.songs.all():
-        subjects = song.songartistrole_set.filter(role__in=ROLES.values()).distinct()
-        for subject in subjects:
-            potential_matches.add(subject.artist.name)
+    potential_matches.update(
+        SongArtistRole.objects.filter(
+            song__release=release, role__in=ROLES.values()
+        ).values_list('artist__name', flat=True)
+    )
 
-    matches = []
-    for potential in potential_matches:
-        match = blacklist.find(potential)
-        if match:
-            matches.append((potential, match))
-    return matches
+    return find_offending_artist_names(potential_matches)
 
 
 def find_offending_artist_names(artist_names):
-    matches = []
-    for artist_name in artist_names:
-        match = blacklist.find(artist_name)
-        if match:
-            matches.append((artist_name, match))
-    return matches
+    matches = blacklist.find_many(artist_names)
+    return [
+        (artist_name, matches[artist_name])
+        for artist_name in artist_names
+        if artist_name in matches
+    ]
 
 
 def find_offending_artists(artists):
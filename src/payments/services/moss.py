@@ -3,6 +3,8 @@ import math
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
 
+from django.db.models import F, Sum
+
 from countries.models import ExchangeRate, Country
 from payments.models import PaymentTransaction
 from subscriptions.models import Subscription
@@ -60,7 +62,7 @@ class MossReport(object):
             status=PaymentTransaction.STATUS_APPROVED,
             subscription__provider=Subscription.PROVIDER_ADYEN,
             type=PaymentTransaction.TYPE_PAYMENT,
-        ).select_related('currency')
+        )
 
         vat_per_country = self._get_vatless_amount_per_country(
             self.countries, transactions
@@ -123,29 +125,36 @@ class MossReport(object):
             year=self.year, quarter=self.quarter
         ).select_related('currency')
         rate_per_currency = {r.currency.code: r.rate for r in rates}
+        country_per_code = Country.objects.in_bulk(countries)
         vatless_amount_per_country = {}
         for country_code in countries:
-            country = Country.objects.get(code=country_code)
+            country = country_per_code.get(country_code)
+            if country is None:
+                raise Country.DoesNotExist(f'Country {country_code} does not exist')
             vatless_amount_per_country[country_code] = {
                 'rate': country.vat_percentage_api(),
                 'amount': Decimal(0),
             }
 
-        for transaction in transactions:
-            amount = transaction.amount
-            vat = transaction.vat_amount
-            currency_code = transaction.currency.code
-            if currency_code == 'EUR':
-                amount = amount - vat
-            else:
+        # The sums are exact, so converting the sum per currency gives the same
+        # amount as converting every transaction
+        vatless_amounts = (
+            transactions.values('country_id', 'currency__code')
+            .annotate(amount=Sum(F('amount') - F('vat_amount')))
+            .order_by('country_id', 'currency__code')
+        )
+        for row in vatless_amounts:
+            amount = row['amount']
+            currency_code = row['currency__code']
+            if currency_code != 'EUR':
                 fx_rate = rate_per_currency.get(currency_code)
                 if fx_rate is None:
                     raise MossReportException(
                         f'No FX rate available for {currency_code} {self.year} Q{self.quarter}'
                     )
-                amount = (amount - vat) * fx_rate
+                amount = amount * fx_rate
 
-            vatless_amount_per_country[transaction.country_id]['amount'] += amount
+            vatless_amount_per_country[row['country_id']]['amount'] += amount
 
         return vatless_amount_per_country
 
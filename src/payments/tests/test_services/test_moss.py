@@ -1,7 +1,18 @@
 from datetime import datetime, timezone
+from decimal import Decimal
+from io import StringIO
+from random import Random
 from unittest import TestCase
+from unittest.mock import patch
 
+from django.test import TestCase as DjangoTestCase
+
+from countries.models import Country, ExchangeRate
+from countries.tests.factories import CountryFactory, CurrencyFactory
+from payments.models import PaymentTransaction
 from payments.services.moss import MossReport
+from payments.tests.factories import PaymentTransactionFactory
+from subscriptions.models import Subscription
 
 
 class MossReportTest(TestCase):
@@ -60,3 +71,91 @@ class MossReportTest(TestCase):
         self.assertEqual(report_3.quarter, 4)
         self.assertEqual(report_3.month, 11)
         self.assertGreater(len(report_3.countries), 1)
+
+
+class MossReportParityTestCase(DjangoTestCase):
+    def setUp(self):
+        self.year = 2022
+        self.quarter = 1
+        self.countries = [
+            CountryFactory(code=code, vat_percentage=vat_percentage)
+            for code, vat_percentage in (
+                ('AT', Decimal('0.2')),
+                ('DE', Decimal('0.19')),
+                ('GR', Decimal('0.24')),
+                ('LU', Decimal('0.17')),
+            )
+        ]
+        currencies = [
+            CurrencyFactory(code='EUR'),
+            CurrencyFactory(code='SEK'),
+            CurrencyFactory(code='USD'),
+        ]
+        ExchangeRate.objects.create(
+            currency=currencies[1], rate=Decimal('0.0953472113'), year=2022, quarter=1
+        )
+        ExchangeRate.objects.create(
+            currency=currencies[2], rate=Decimal('0.8923465123'), year=2022, quarter=1
+        )
+
+        random = Random(1)
+        with patch("amuse.tasks.zendesk_create_or_update_user"):
+            for i in range(60):
+                amount = Decimal(random.randint(100, 99999)) / 100
+                transaction = PaymentTransactionFactory(
+                    amount=amount,
+                    vat_amount=(amount * Decimal('0.2')).quantize(Decimal('0.01')),
+                    country=self.countries[i % 3],
+                    currency=currencies[i % len(currencies)],
+                    status=PaymentTransaction.STATUS_APPROVED,
+                    type=PaymentTransaction.TYPE_PAYMENT,
+                )
+                # Every fifth transaction is in the previous quarter
+                if i % 5:
+                    transaction.created = datetime(2022, 1, 15, tzinfo=timezone.utc)
+                else:
+                    transaction.created = datetime(2021, 12, 15, tzinfo=timezone.utc)
+                transaction.save()
+
+    def _get_expected_amounts(self, report, transactions):
+        """The report as computed in Python for every transaction."""
+        rates = ExchangeRate.objects.filter(year=report.year, quarter=report.quarter)
+        rate_per_currency = {r.currency.code: r.rate for r in rates}
+        amounts = {}
+        for country_code in report.countries:
+            country = Country.objects.get(code=country_code)
+            amounts[country_code] = {
+                'rate': country.vat_percentage_api(),
+                'amount': Decimal(0),
+            }
+        for transaction in transactions.select_related('currency'):
+            amount = transaction.amount - transaction.vat_amount
+            if transaction.currency.code != 'EUR':
+                amount *= rate_per_currency[transaction.currency.code]
+            amounts[transaction.country_id]['amount'] += amount
+        return amounts
+
+    def test_report_matches_per_transaction_computation(self):
+        report = MossReport(year=self.year, month=None, quarter=self.quarter)
+        report.countries = [country.code for country in self.countries]
+        period_start, period_end = report._get_period()
+        transactions = PaymentTransaction.objects.filter(
+            country__in=report.countries,
+            created__gte=period_start,
+            created__lt=period_end,
+            status=PaymentTransaction.STATUS_APPROVED,
+            subscription__provider=Subscription.PROVIDER_ADYEN,
+            type=PaymentTransaction.TYPE_PAYMENT,
+        )
+        expected = StringIO()
+        report._print_moss_file(
+            self._get_expected_amounts(report, transactions), expected
+        )
+
+        output = StringIO()
+        with self.assertNumQueries(3):
+            report.generate_report(output)
+
+        self.assertEqual(output.getvalue(), expected.getvalue())
+        self.assertIn('SE;EL;24,00;', output.getvalue())
+        self.assertNotIn('SE;LU;', output.getvalue())
@@ -154,12 +154,16 @@ class HWPaymentNotificationHandler(object):
 
         internal_status = self.internal_statuses[self.status]
         if internal_status in ["CANCELLED", "EXPIRED", "FAILED"]:
-            update_withdrawal(revenue_system_transaction_id, "is_cancelled")
+            update_withdrawal(
+                revenue_system_transaction_id, "is_cancelled", user_id=payment.payee_id
+            )
             logger.info(
                 f"txid={self.id} Updated revenue system with status {self.status} payload: {self.payload}"
             )
         if internal_status == "COMPLETED":
-            update_withdrawal(revenue_system_transaction_id, "is_complete")
+            update_withdrawal(
+                revenue_system_transaction_id, "is_complete", user_id=payment.payee_id
+            )
             logger.info(
                 f"txid={self.id} Updated revenue system with status {self.status} payload: {self.payload}"
             )
@@ -1,6 +1,7 @@
 from django.core.management.base import BaseCommand
 
 from releases.models import Store
+from releases.store_registry import store_registry
 
 
 STORES = (
@@ -31,3 +32,4 @@ class Command(BaseCommand):
     def handle(self, *args, **kwargs):
         for name, internal_name in STORES:
             Store.objects.filter(name=name).update(internal_name=internal_name)
+        store_registry.invalidate()
@@ -0,0 +1,34 @@
+# Generated by Django 3.2.15 on 2026-10-17 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [('releases', '0161_add_fuga_migration_stores')]
+
+    operations = [
+        migrations.AddField(
+            model_name='coverart',
+            name='checksum_etag',
+            field=models.CharField(
+                blank=True, editable=False, max_length=128, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name='coverart',
+            name='checksum_size',
+            field=models.BigIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='historicalcoverart',
+            name='checksum_etag',
+            field=models.CharField(
+                blank=True, editable=False, max_length=128, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name='historicalcoverart',
+            name='checksum_size',
+            field=models.BigIntegerField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from amuse.vendor.spotify.artist_blacklist.blacklist import fuzzify
 
@@ -16,3 +18,11 @@ class BlacklistedArtistName(models.Model):
     def save(self, *args, **kwargs):
         self.fuzzy_name = fuzzify(self.name)
         super().save(*args, **kwargs)
+
+
+@receiver(post_save, sender=BlacklistedArtistName)
+@receiver(post_delete, sender=BlacklistedArtistName)
+def invalidate_blacklist_index(sender, instance, **kwargs):
+    from amuse import blacklist
+
+    blacklist.invalidate()
@@ -56,6 +56,11 @@ class CoverArt(models.Model):
     width = models.PositiveSmallIntegerField(blank=True, null=True, default=None)
     height = models.PositiveSmallIntegerField(blank=True, null=True, default=None)
     checksum = models.TextField(null=True, blank=True, editable=False)
+    # ETag and size of the S3 object the checksum was last verified against
+    checksum_etag = models.CharField(
+        max_length=128, null=True, blank=True, editable=False
+    )
+    checksum_size = models.BigIntegerField(null=True, blank=True, editable=False)
 
     @property
     def thumbnail_url_400(self):
@@ -10,6 +10,7 @@ from amuse.db.decorators import observable_fields, with_history
 from codes.models import UPC
 from countries.models import Country
 from releases.managers import ReleaseManager
+from releases.store_registry import store_registry
 from users.models import User
 from . import Genre, MetadataLanguage, Store
 
@@ -262,6 +263,8 @@ class Release(models.Model):
 
     @property
     def excluded_country_codes(self):
+        if 'excluded_countries' in getattr(self, '_prefetched_objects_cache', {}):
+            return [country.code for country in self.excluded_countries.all()]
         return self.excluded_countries.values_list('code', flat=True)
 
     @property
@@ -270,6 +273,9 @@ class Release(models.Model):
 
     @property
     def excluded_store_ids(self):
+        if 'stores' in getattr(self, '_prefetched_objects_cache', {}):
+            included_store_ids = {store.pk for store in self.stores.all()}
+            return sorted(store_registry.get_ids() - included_store_ids)
         return list(self.get_excluded_stores().values_list('pk', flat=True))
 
     @property
@@ -2,6 +2,7 @@ from django.db import models
 from django.db.models import JSONField
 
 from releases.models.fuga_metadata import FugaStores
+from releases.store_registry import store_registry
 
 
 class StoreQuerySet(models.QuerySet):
@@ -100,10 +101,7 @@ class Store(models.Model):
 
     @staticmethod
     def from_internal_name(internal_name):
-        store = Store.objects.filter(internal_name=internal_name)
-        if store:
-            return store.first()
-        return None
+        return store_registry.get_by_internal_name(internal_name)
 
     @staticmethod
     def get_pro_stores():
@@ -8,15 +8,19 @@ from amuse.services.notifications import (
 from amuse.services import audiorec
 from django.conf import settings
 from django.dispatch import Signal, receiver
-from django.db.models.signals import post_save, m2m_changed
+from django.db.models.signals import post_delete, post_save, m2m_changed
 from os.path import splitext
 from releases.models import (
     Release,
     ReleaseStoresHistory,
     SongFile,
     SongFileUpload,
+    Store,
+    StoreCategory,
     release_completed,
 )
+from releases.models.fuga_metadata import FugaStores
+from releases.store_registry import invalidate_store_registry
 from transcoder import Transcoder
 from transcoder.signals import (
     transcoder_progress,
@@ -148,3 +152,13 @@ def release_stores_changed(sender, action, instance, pk_set, **kwargs):
     if action in pre_actions:
         history = ReleaseStoresHistory.objects.create(release=instance)
         history.stores.set(instance.stores.all())
+
+
+@receiver(post_save, sender=Store)
+@receiver(post_delete, sender=Store)
+@receiver(post_save, sender=StoreCategory)
+@receiver(post_delete, sender=StoreCategory)
+@receiver(post_save, sender=FugaStores)
+@receiver(post_delete, sender=FugaStores)
+def store_metadata_changed(sender, **kwargs):
+    invalidate_store_registry()
@@ -0,0 +1,81 @@
+from amuse.deliveries import CHANNELS
+from amuse.versioned_index import VersionedIndex
+
+VERSION_CACHE_KEY = 'releases:store_registry:version'
+
+
+class _StoreSnapshot:
+    def __init__(self, stores):
+        self.stores = stores
+        self.by_id = {store.pk: store for store in stores}
+        self.by_internal_name = {
+            store.internal_name: store for store in stores if store.internal_name
+        }
+        self.by_fuga_store_id = {}
+        for store in sorted(stores, key=lambda store: store.pk):
+            if store.fuga_store_id is not None:
+                self.by_fuga_store_id.setdefault(store.fuga_store_id, store)
+
+
+class StoreRegistry:
+    """
+    Per-process registry of all Store rows, loaded with one query and kept as a
+    VersionedIndex.
+
+    The version is replaced whenever a Store, StoreCategory or FugaStores row is
+    saved or deleted (see releases.signals), so every process reloads. Queryset
+    updates bypass the signals and have to call invalidate() themselves.
+
+    The returned Store instances are shared between callers and must not be
+    modified.
+    """
+
+    def __init__(self):
+        self._index = VersionedIndex(VERSION_CACHE_KEY, self._load)
+
+    @staticmethod
+    def _load():
+        from releases.models import Store
+
+        stores = list(
+            Store.objects.select_related('category', 'fuga_store').order_by(
+                'name', 'pk'
+            )
+        )
+        return _StoreSnapshot(stores)
+
+    def _get_snapshot(self):
+        return self._index.get()
+
+    def invalidate(self):
+        self._index.invalidate()
+
+    def all(self):
+        """Returns all stores ordered by name."""
+        return list(self._get_snapshot().stores)
+
+    def admin_active(self):
+        return [store for store in self._get_snapshot().stores if store.admin_active]
+
+    def get(self, store_id):
+        return self._get_snapshot().by_id.get(store_id)
+
+    def get_by_internal_name(self, internal_name):
+        return self._get_snapshot().by_internal_name.get(internal_name)
+
+    def get_by_fuga_store_id(self, fuga_store_id):
+        """Returns the store with the lowest id for the Fuga store."""
+        return self._get_snapshot().by_fuga_store_id.get(fuga_store_id)
+
+    def get_by_channel(self, channel):
+        return self.get_by_internal_name(CHANNELS.get(channel))
+
+    def get_ids(self):
+        return set(self._get_snapshot().by_id)
+
+
+store_registry = StoreRegistry()
+
+
+def invalidate_store_registry():
+    store_registry.invalidate()
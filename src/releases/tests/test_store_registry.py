@@ -0,0 +1,50 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from amuse.deliveries import SPOTIFY
+from releases.models import Store
+from releases.store_registry import VERSION_CACHE_KEY, store_registry
+from releases.tests.factories import FugaStoreFactory, StoreFactory
+
+
+class StoreRegistryTestCase(TestCase):
+    def setUp(self):
+        self.spotify = StoreFactory(name='Spotify', internal_name='spotify')
+        self.deezer = StoreFactory(
+            name='Deezer', internal_name='deezer', admin_active=False
+        )
+
+    def test_lookups(self):
+        assert store_registry.get(self.spotify.pk) == self.spotify
+        assert store_registry.get_by_internal_name('deezer') == self.deezer
+        assert store_registry.get_by_channel(SPOTIFY) == self.spotify
+        assert store_registry.get_by_internal_name('store-not-exists') is None
+        assert store_registry.get_ids() == {self.spotify.pk, self.deezer.pk}
+        assert store_registry.admin_active() == [self.spotify]
+
+    def test_get_by_fuga_store_id_returns_lowest_store_id(self):
+        fuga_store = FugaStoreFactory()
+        store = StoreFactory(fuga_store=fuga_store)
+        StoreFactory(fuga_store=fuga_store)
+
+        assert store_registry.get_by_fuga_store_id(fuga_store.pk) == store
+
+    @override_settings(VERSIONED_INDEX_CHECK_INTERVAL=60)
+    def test_stores_are_not_queried_again_until_changed(self):
+        store_registry.all()
+
+        with self.assertNumQueries(0):
+            store_registry.get_by_internal_name('spotify')
+
+        self.spotify.name = 'Spotify Music'
+        self.spotify.save()
+
+        assert store_registry.get(self.spotify.pk).name == 'Spotify Music'
+
+    def test_change_in_other_process_is_picked_up(self):
+        store_registry.all()
+
+        Store.objects.filter(pk=self.deezer.pk).update(admin_active=True)
+        cache.set(VERSION_CACHE_KEY, 'changed-by-other-process')
+
+        assert store_registry.admin_active() == [self.deezer, self.spotify]
@@ -6,7 +6,8 @@ from django.conf import settings
 from django.db.models import Q
 
 from amuse import tasks
-from releases.models import Song, SongArtistRole, SongFile, Release, Store
+from releases.models import Song, SongFile, Release, Store
+from users.models import ArtistV2
 
 
 logger = logging.getLogger(__name__)
@@ -56,18 +57,21 @@ def filter_song_file_mp3(song):
 
 
 def get_contributors_from_history(user):
-    all_releases_contributos = []
-    sar = SongArtistRole.objects.filter(song__release__user=user).distinct()
-    for row in sar:
-        all_releases_contributos.append(
-            {
-                'id': row.artist.id,
-                'name': row.artist.name,
-                'spotify_id': row.artist.spotify_id,
-            }
-        )
-
-    return dict((v['name'], v) for v in all_releases_contributos).values()
+    """
+    Returns the artists of all songs of the user's releases, one per name.
+
+    The artists are de-duplicated in the database and only the serialized
+    fields are fetched, so this is a single query however many songs the
+    user has released.
+    """
+    contributors = (
+        ArtistV2.objects.filter(songartistrole__song__release__user=user)
+        .order_by('id')
+        .values('id', 'name', 'spotify_id')
+        .distinct()
+    )
+    # The last artist with a name wins
+    return {contributor['name']: contributor for contributor in contributors}.values()
 
 
 def queue_celery_tasks(
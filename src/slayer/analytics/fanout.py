@@ -0,0 +1,72 @@
+"""Runs the Slayer calls of an analytics request concurrently within a deadline."""
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError
+
+from django.conf import settings
+from django.db import connection
+
+from amuse.logging import logger
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.SLAYER_FANOUT_WORKERS,
+                thread_name_prefix='slayer-fanout',
+            )
+    return _executor
+
+
+def _call(fn, args, kwargs):
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        connection.close()
+
+
+class Fanout:
+    def __init__(self, deadline):
+        self.deadline = time.monotonic() + deadline
+
+    def submit(self, fn, *args, **kwargs):
+        """Starts a Slayer call in a worker thread."""
+        return get_executor().submit(_call, fn, args, kwargs)
+
+    def submit_cached(self, method, **kwargs):
+        """
+        Starts a call of a cached_slayer method unless its response is cached,
+        which is returned as a done future.
+        """
+        response = method.get_cached(**kwargs)
+        if response is None:
+            return self.submit(method, **kwargs)
+        future = Future()
+        future.set_result(response)
+        return future
+
+    def result(self, future, default=None):
+        """
+        Returns the result of the future once it is done or `default` if the
+        deadline passes first. Raises TimeoutError without a default.
+        """
+        try:
+            return future.result(timeout=max(0, self.deadline - time.monotonic()))
+        except TimeoutError:
+            if default is None:
+                raise
+            future.cancel()
+            logger.warning('Slayer call did not finish before the request deadline')
+            return default
+
+    def resolve(self, fields):
+        """Waits for the futures among the field values, late fields are empty."""
+        return {
+            name: self.result(value, default={}) if isinstance(value, Future) else value
+            for name, value in fields.items()
+        }
@@ -0,0 +1,62 @@
+"""Per-process LRU of the release and track metadata used to enrich analytics."""
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+from slayer import cache as slayer_cache
+
+
+class MetadataCache:
+    def __init__(self, name):
+        self.name = name
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, keys):
+        """Returns the cached metadata of the keys that are cached."""
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None or entry[0] < now:
+                    continue
+                self._entries.move_to_end(key)
+                found[key] = entry[1]
+            hits, misses = len(found), len(keys) - len(found)
+            self.hits += hits
+            self.misses += misses
+        slayer_cache.metrics.lookup(self.name, hits, misses)
+        return found
+
+    def set_many(self, metadata):
+        expires = time.monotonic() + settings.SLAYER_METADATA_CACHE_TIMEOUT
+        with self._lock:
+            for key, value in metadata.items():
+                self._entries[key] = (expires, value)
+                self._entries.move_to_end(key)
+            while len(self._entries) > settings.SLAYER_METADATA_CACHE_SIZE:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+
+releases = MetadataCache('release_metadata')
+tracks = MetadataCache('track_metadata')
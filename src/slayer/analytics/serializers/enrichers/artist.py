@@ -20,14 +20,15 @@ class ReleaseSummaryEnricher(BaseEnricher):
 class ArtistMetaEnricher(BaseEnricher):
     artist_metadata = ArtistMetadataSerializer(required=False)
 
-    def enrich(self, context):
-        super().enrich(context)
+    def prefetch(self, context, fanout):
+        fields = super().prefetch(context, fanout)
         artist_id = context["artist_id"]
         try:
-            self.initial_data["artist_metadata"] = self.get_artist_metadata(artist_id)
+            fields["artist_metadata"] = self.get_artist_metadata(artist_id)
         except ArtistV2.DoesNotExist:
             logger.warning(f"Error getting artist by id: {artist_id}")
             raise
+        return fields
 
 
 class ArtistTrackSummaryEnricher(BaseEnricher):
@@ -44,8 +45,7 @@ class PlaylistCollectionEnricher(BaseEnricher):
 
 
 class LatestReleaseEnricher(BaseEnricher):
-    def enrich(self, context):
-        super().enrich(context)
-        self.initial_data["latest_release"] = self.get_latest_release(
-            context["artist_id"]
-        )
+    def prefetch(self, context, fanout):
+        fields = super().prefetch(context, fanout)
+        fields["latest_release"] = self.get_latest_release(context["artist_id"], fanout)
+        return fields
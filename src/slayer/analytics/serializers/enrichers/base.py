@@ -1,18 +1,38 @@
-from collections import deque
+from collections import defaultdict
 
 from django.db.models import Q
 
-from slayer.clientwrapper import slayer
+from slayer.cache import cached_slayer
 from amuse.logging import logger
 from users.models import ArtistV2
-from releases.models import ReleaseArtistRole, SongArtistRole, Release, Song
+from releases.models import CoverArt, ReleaseArtistRole, SongArtistRole, Release, Song
+from slayer.analytics import metadata as metadata_cache
 from pyslayer.services.analytics import ReleaseSummaryRequest
 from pyslayer.utils import to_dict
 from rest_framework.serializers import Serializer
 from codes.models import FAKE_UPC
 
 
+COVER_ART_FIELDS = ("cover_art__file", "cover_art__width", "cover_art__height")
+
+
+def format_date(date):
+    return date.strftime("%Y-%m-%d") if date else None
+
+
+def get_cover_art_url(file, width, height):
+    # The dimensions are passed so the image is not opened to read them
+    return CoverArt(file=file, width=width, height=height).thumbnail_url_400
+
+
 class BaseEnricher(Serializer):
+    def prefetch(self, context, fanout):
+        """
+        Returns the fields that do not depend on the Slayer response. Runs while
+        the Slayer call is in flight, values can be futures of `fanout`.
+        """
+        return {}
+
     def enrich(self, context):
         pass
 
@@ -20,7 +40,11 @@ class BaseEnricher(Serializer):
         artist = ArtistV2.objects.get(id=artist_id)
         return {"name": artist.name, "image": artist.image}
 
-    def get_latest_release(self, artist_id):
+    def get_latest_release(self, artist_id, fanout=None):
+        """
+        Returns the summary of the latest release of the artist, as a future of
+        `fanout` when given
+        """
         try:
             query = Q(status__in=[Release.STATUS_RELEASED, Release.STATUS_TAKEDOWN])
 
@@ -43,17 +67,18 @@ class BaseEnricher(Serializer):
             )
 
             # Execute query
-            latest_release = Release.objects.filter(query).order_by("-id").first()
+            latest_release = (
+                Release.objects.filter(query)
+                .select_related("upc", "cover_art")
+                .order_by("-id")
+                .first()
+            )
 
             if not latest_release:
                 return {}
 
             # Build latest_release object
-            response = slayer.analytics_release_summary(
-                artist_id=artist_id, upc=latest_release.upc.code
-            )
-
-            response["release_metadata"] = {
+            release_metadata = {
                 "name": latest_release.name,
                 "version": latest_release.release_version,
                 "release_date": latest_release.release_date.strftime("%Y-%m-%d")
@@ -61,137 +86,140 @@ class BaseEnricher(Serializer):
                 else None,
                 "cover_art": latest_release.cover_art.thumbnail_url_400,
             }
+        except Exception as e:
+            logger.exception(e)
+            return {}
 
-            return response
-
+        args = (artist_id, latest_release.upc.code, release_metadata)
+        if fanout:
+            # A cached summary is read here, only a miss is submitted
+            response = cached_slayer.analytics_release_summary.get_cached(
+                artist_id=artist_id, upc=latest_release.upc.code
+            )
+            if response is None:
+                return fanout.submit(self._get_release_summary, *args)
+            return self._add_release_metadata(response, release_metadata)
+        return self._get_release_summary(*args)
+
+    @staticmethod
+    def _add_release_metadata(response, release_metadata):
+        response["release_metadata"] = release_metadata
+        return response
+
+    @classmethod
+    def _get_release_summary(cls, artist_id, upc, release_metadata):
+        try:
+            response = cached_slayer.analytics_release_summary(
+                artist_id=artist_id, upc=upc
+            )
         except Exception as e:
             logger.exception(e)
             return {}
 
-    def enrich_release(self, upc):
-        """Returns a release metadata object for given UPC (not to be used in loops for
-        efficiency reasons, (gets really slow compared to the collection version)"""
-
-        release = (
-            Release.objects.select_related("upc")
-            .select_related("cover_art")
-            .filter(upc__code=upc)
-            .order_by("-id")
-            .first()
-        )
-
-        return (
-            dict(
-                name=release.name,
-                version=release.release_version,
-                release_date=release.release_date.strftime("%Y-%m-%d")
-                if release.release_date
-                else None,
-                cover_art=release.cover_art.thumbnail_url_400,
+        return cls._add_release_metadata(response, release_metadata)
+
+    def get_releases_metadata(self, upcs):
+        """Returns release metadata by UPC for the given UPCs that exist"""
+
+        upcs = set(upcs)
+        metadata = metadata_cache.releases.get_many(upcs)
+        if missing := upcs - metadata.keys():
+            fetched = {}
+            rows = (
+                Release.objects.filter(upc__code__in=missing)
+                .order_by("-id")
+                .values_list(
+                    "upc__code",
+                    "name",
+                    "release_version",
+                    "release_date",
+                    *COVER_ART_FIELDS,
+                )
+            )
+            for upc, name, version, release_date, *cover_art in rows:
+                # Only the latest release of a UPC is used
+                fetched.setdefault(
+                    upc,
+                    dict(
+                        name=name,
+                        version=version,
+                        release_date=format_date(release_date),
+                        cover_art=get_cover_art_url(*cover_art),
+                    ),
+                )
+            metadata_cache.releases.set_many(fetched)
+            metadata.update(fetched)
+        return metadata
+
+    def get_tracks_metadata(self, isrcs):
+        """Returns track metadata by ISRC for the given ISRCs that exist"""
+
+        isrcs = set(isrcs)
+        metadata = metadata_cache.tracks.get_many(isrcs)
+        if missing := isrcs - metadata.keys():
+            fetched = {}
+            rows = (
+                Song.objects.filter(isrc__code__in=missing)
+                .order_by("-id")
+                .values_list(
+                    "isrc__code",
+                    "name",
+                    "version",
+                    "release__release_date",
+                    *(f"release__{field}" for field in COVER_ART_FIELDS),
+                )
             )
-            if release
-            else {}
-        )
+            for isrc, name, version, release_date, *cover_art in rows:
+                # Only the latest track of an ISRC is used
+                fetched.setdefault(
+                    isrc,
+                    dict(
+                        name=name,
+                        version=version,
+                        release_date=format_date(release_date),
+                        cover_art=get_cover_art_url(*cover_art),
+                    ),
+                )
+            metadata_cache.tracks.set_many(fetched)
+            metadata.update(fetched)
+        return metadata
+
+    def enrich_release(self, upc):
+        """Returns a release metadata object for given UPC"""
+
+        return dict(self.get_releases_metadata([upc]).get(upc, {}))
 
     def get_enriched_releases(self, releases_upcs):
-        """Yields enriched release metadata for the given upcs"""
-
-        r_upc_map = dict(releases_upcs)
-        q_releases = deque(r_upc_map.keys())
-
-        releases = (
-            Release.objects.select_related("upc")
-            .select_related("cover_art")
-            .filter(upc__code__in=set(r_upc_map.values()))
-        )
-
-        # Iterate over release metadata obtained from database
-        for r in releases.all():
-            # Iterate over the track indices queue
-            for idx in list(q_releases):
-                if r.upc.code != r_upc_map[idx]:
-                    continue
-
-                # Pop enrichment-eligible index from queue to make things efficient
-                q_releases.remove(idx)
-
-                # Yield the enriched object with reference to the release
-                yield idx, dict(
-                    name=r.name,
-                    version=r.release_version,
-                    release_date=r.release_date.strftime("%Y-%m-%d")
-                    if r.release_date
-                    else None,
-                    cover_art=r.cover_art.thumbnail_url_400,
-                )
+        """Yields enriched release metadata for the given index-upc pairs"""
+
+        indices = defaultdict(list)
+        for idx, upc in releases_upcs:
+            indices[upc].append(idx)
+
+        metadata = self.get_releases_metadata(indices)
+        for upc, upc_indices in indices.items():
+            if upc not in metadata:
+                continue
+            for idx in upc_indices:
+                yield idx, dict(metadata[upc])
 
     def get_enriched_track(self, isrc):
-        """Returns a track metadata object for given ISRC (not to be used in loops for
-        efficiency reasons, (gets really slow compared to the collection version)"""
-
-        track = (
-            Song.objects.select_related("isrc")
-            .select_related("release")
-            .select_related("release__cover_art")
-            .filter(isrc__code=isrc)
-            .order_by("-id")
-            .first()
-        )
-
-        return (
-            dict(
-                name=track.name,
-                version=track.version,
-                release_date=track.release.release_date.strftime("%Y-%m-%d")
-                if track.release.release_date
-                else None,
-                cover_art=track.release.cover_art.thumbnail_url_400,
-            )
-            if track
-            else {}
-        )
+        """Returns a track metadata object for given ISRC"""
+
+        return dict(self.get_tracks_metadata([isrc]).get(isrc, {}))
 
     def get_enriched_tracks(self, isrcs):
-        """Returns a generator yielding track metadata for the given track-isrc pairs"""
-
-        t_isrc_map = dict(isrcs)
-        q_tracks = deque(t_isrc_map.keys())
-
-        tracks = (
-            Song.objects.select_related("isrc")
-            .select_related("release")
-            .select_related("release__cover_art")
-            .filter(isrc__code__in=set(t_isrc_map.values()))
-        )
-
-        # Iterate over track metadata obtained from database
-        for t in tracks.all():
-            # Iterate over the track indices queue
-            for idx in list(q_tracks):
-                if t.isrc.code != t_isrc_map[idx]:
-                    continue
-
-                # Pop enrichment-eligible index from queue to make things efficient
-                q_tracks.remove(idx)
-
-                # Yield the enriched object with reference to the track
-                yield idx, dict(
-                    isrc=t.isrc.code,
-                    track_metadata=dict(
-                        name=t.name,
-                        version=t.version,
-                        release_date=t.release.release_date.strftime("%Y-%m-%d")
-                        if t.release.release_date
-                        else None,
-                        cover_art=t.release.cover_art.thumbnail_url_400,
-                    ),
-                )
+        """Yields track metadata for the given index-isrc pairs, tracks that
+        couldn't be resolved get empty metadata"""
+
+        indices = defaultdict(list)
+        for idx, isrc in isrcs:
+            indices[isrc].append(idx)
 
-        if len(q_tracks) != 0:
-            # There are items remaining in queue that couldn't be resolved.
-            # Yield with default structure.
-            for idx in q_tracks:
-                yield idx, dict(isrc=t_isrc_map[idx], track_metadata={})
+        metadata = self.get_tracks_metadata(indices)
+        for isrc, isrc_indices in indices.items():
+            for idx in isrc_indices:
+                yield idx, dict(isrc=isrc, track_metadata=dict(metadata.get(isrc, {})))
 
     def enrich_releasedata(self, releases):
         upc_pairs = [
@@ -2,9 +2,10 @@ from .base import BaseEnricher
 
 
 class ReleaseMetaEnricher(BaseEnricher):
-    def enrich(self, context):
-        super().enrich(context)
-        self.initial_data["release_metadata"] = self.enrich_release(context["upc"])
+    def prefetch(self, context, fanout):
+        fields = super().prefetch(context, fanout)
+        fields["release_metadata"] = self.enrich_release(context["upc"])
+        return fields
 
 
 class ReleaseSummaryEnricher(BaseEnricher):
@@ -15,11 +16,10 @@ class ReleaseSummaryEnricher(BaseEnricher):
 
 
 class ReleaseartistMetaEnricher(BaseEnricher):
-    def enrich(self, context):
-        super().enrich(context)
-        self.initial_data["releaseartist_metadata"] = self.enrich_release(
-            context["upc"]
-        )
+    def prefetch(self, context, fanout):
+        fields = super().prefetch(context, fanout)
+        fields["releaseartist_metadata"] = self.enrich_release(context["upc"])
+        return fields
 
 
 class ReleasePlaylistTrackEnricher(BaseEnricher):
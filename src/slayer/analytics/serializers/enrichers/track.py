@@ -2,9 +2,10 @@ from .base import BaseEnricher
 
 
 class TrackMetaEnricher(BaseEnricher):
-    def enrich(self, context):
-        super(TrackMetaEnricher, self).enrich(context)
-        self.initial_data["track_metadata"] = self.get_enriched_track(context["isrc"])
+    def prefetch(self, context, fanout):
+        fields = super().prefetch(context, fanout)
+        fields["track_metadata"] = self.get_enriched_track(context["isrc"])
+        return fields
 
 
 class TrackPlaylistTrackEnricher(BaseEnricher):
@@ -7,12 +7,14 @@ from rest_framework.response import Response
 from rest_framework import status, serializers as drf_serializers
 from drf_spectacular.views import extend_schema
 from drf_spectacular.utils import extend_schema_serializer
+from django.conf import settings
 from django.views.decorators.cache import cache_control
 from waffle import switch_is_active
 
 from amuse.api.base.views.exceptions import WrongAPIversionError
 from amuse.mixins import LogMixin
 from amuse.logging import logger
+from slayer.analytics.fanout import Fanout
 
 
 # @TODO: Move response related stuff into nested response class
@@ -83,11 +85,6 @@ class AnalyticsBaseView(LogMixin, GenericAPIView):
             logger.warning(f"Slayer request validation failed: {serializer.errors}")
             raise self.resp_500()
 
-    def slayer_invoke(self, **kwargs_override):
-        kwargs = self.slayer_args.copy()
-        kwargs.update(kwargs_override)
-        return self.slayer_fn(**kwargs)
-
     @property
     def resp_limit(self):
         return int(self.request.query_params.get('limit', 0))
@@ -112,8 +109,13 @@ class AnalyticsBaseView(LogMixin, GenericAPIView):
         if not switch_is_active("streaminganalytics:enabled"):
             self.resp_err(status.HTTP_503_SERVICE_UNAVAILABLE, "Disabled")
 
+        fanout = Fanout(settings.SLAYER_REQUEST_DEADLINE)
         try:
-            response = self.slayer_invoke()
+            context = self.slayer_args
+            future = fanout.submit_cached(self.slayer_fn, **context)
+            # Database lookups for the metadata overlap with the Slayer call
+            fields = self.serializer_class().prefetch(context, fanout)
+            response = fanout.result(future)
         except Exception as e:
             # Something went wrong when communicating with Slayer
             # Log the exception and return HTTP 500.
@@ -121,7 +123,8 @@ class AnalyticsBaseView(LogMixin, GenericAPIView):
             return self.resp_err(status.HTTP_500_INTERNAL_SERVER_ERROR)
 
         serializer = self.serializer_class(data=response)
-        serializer.enrich(context=self.slayer_args)
+        serializer.initial_data.update(fanout.resolve(fields))
+        serializer.enrich(context=context)
 
         # @TODO: Implement following when metaclasses for populating enrichment
         #        schemas are in place
@@ -0,0 +1,164 @@
+"""Shared cache of Slayer responses that coalesces identical concurrent calls."""
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from amuse.vendor.aws import cloudwatch
+from slayer.clientwrapper import slayer
+
+CACHE_KEY = 'slayer:{method}:{params}'
+LOCK_KEY = '{cache_key}:lock'
+# Seconds between cache reads while waiting for another caller
+POLL_INTERVAL = 0.05
+
+
+def get_timeout(now=None):
+    """Returns the number of seconds until the next daily Slayer refresh."""
+    now = now or timezone.now()
+    refresh = now.replace(
+        hour=settings.SLAYER_CACHE_REFRESH_HOUR, minute=0, second=0, microsecond=0
+    )
+    if refresh <= now:
+        refresh += timedelta(days=1)
+    return int((refresh - now).total_seconds())
+
+
+def _get_cache_key(method, args, kwargs):
+    params = [str(arg) for arg in args]
+    params += [f'{key}={kwargs[key]}' for key in sorted(kwargs)]
+    return CACHE_KEY.format(method=method, params=':'.join(params))
+
+
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._published_at = time.monotonic()
+        self._stats = {}
+
+    def _get(self, method):
+        return self._stats.setdefault(method, {'hits': 0, 'misses': 0, 'latencies': []})
+
+    def hit(self, method):
+        with self._lock:
+            self._get(method)['hits'] += 1
+        self._maybe_publish()
+
+    def miss(self, method, latency):
+        """Counts a miss with the upstream latency in milliseconds."""
+        with self._lock:
+            stats = self._get(method)
+            stats['misses'] += 1
+            stats['latencies'].append(latency)
+        self._maybe_publish()
+
+    def lookup(self, method, hits, misses):
+        """Counts a batch lookup in a per-process cache without upstream call."""
+        with self._lock:
+            stats = self._get(method)
+            stats['hits'] += hits
+            stats['misses'] += misses
+        self._maybe_publish()
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                method: {**stats, 'latencies': list(stats['latencies'])}
+                for method, stats in self._stats.items()
+            }
+
+    def _maybe_publish(self):
+        with self._lock:
+            now = time.monotonic()
+            if now - self._published_at < settings.SLAYER_METRICS_INTERVAL:
+                return
+            stats, self._stats, self._published_at = self._stats, {}, now
+        threading.Thread(
+            target=cloudwatch.slayer_response_metrics, args=(stats,), daemon=True
+        ).start()
+
+
+metrics = Metrics()
+
+
+def _call(method, fn, args, kwargs):
+    started = time.perf_counter()
+    response = fn(*args, **kwargs)
+    metrics.miss(method, (time.perf_counter() - started) * 1000)
+    return response
+
+
+def _wait_for(cache_key, lock_key):
+    deadline = time.monotonic() + settings.SLAYER_CACHE_LOCK_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(POLL_INTERVAL)
+        response = cache.get(cache_key)
+        if response is not None or cache.get(lock_key) is None:
+            return response
+    return None
+
+
+def get_cached(method, *args, **kwargs):
+    """Returns the cached response of `method` for the arguments or None."""
+    response = cache.get(_get_cache_key(method, args, kwargs))
+    if response is not None:
+        metrics.hit(method)
+    return response
+
+
+def get_or_call(method, fn, *args, **kwargs):
+    """
+    Returns the cached response of `method` for the arguments, calling `fn`
+    once for all concurrent callers on a miss. Errors are never cached.
+    """
+    response = get_cached(method, *args, **kwargs)
+    if response is not None:
+        return response
+
+    cache_key = _get_cache_key(method, args, kwargs)
+    lock_key = LOCK_KEY.format(cache_key=cache_key)
+    if not cache.add(lock_key, 1, settings.SLAYER_CACHE_LOCK_TIMEOUT):
+        response = _wait_for(cache_key, lock_key)
+        if response is not None:
+            metrics.hit(method)
+            return response
+        # The other caller failed or timed out, do not wait any longer
+        return _call(method, fn, args, kwargs)
+
+    try:
+        response = _call(method, fn, args, kwargs)
+        if response is not None:
+            cache.set(cache_key, response, get_timeout())
+    finally:
+        cache.delete(lock_key)
+    return response
+
+
+class CachedMethod:
+    # Not a function so it is not bound when assigned to a view class
+    def __init__(self, method, fn):
+        self.method = method
+        self.fn = fn
+
+    def __call__(self, *args, **kwargs):
+        return get_or_call(self.method, self.fn, *args, **kwargs)
+
+    def get_cached(self, *args, **kwargs):
+        """Returns the cached response without calling Slayer on a miss."""
+        return get_cached(self.method, *args, **kwargs)
+
+
+class CachedClient:
+    """Slayer client whose methods return cached responses."""
+
+    def __init__(self, client):
+        self._client = client
+
+    def __getattr__(self, method):
+        return CachedMethod(method, getattr(self._client, method))
+
+
+cached_slayer = CachedClient(slayer)
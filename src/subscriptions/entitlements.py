@@ -0,0 +1,111 @@
+"""
+Entitlement snapshots of users, i.e. their active subscription, its plan and
+the resulting tier.
+
+Within a request (see EntitlementCacheMiddleware) the snapshot is loaded once
+per user and shared by User.tier, User.is_pro, current_subscription() and the
+permission classes using them. Views decorated with shared_entitlements also
+read and write the snapshot to the shared cache for a few seconds. Outside of
+a request every lookup goes to the database.
+
+Saving a Subscription invalidates the snapshot of its user. Queryset updates
+bypass Subscription.save() and have to call invalidate_entitlement() or
+invalidate_entitlements() themselves.
+"""
+import collections
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+Entitlement = collections.namedtuple("Entitlement", ["subscription", "plan", "tier"])
+
+CACHE_KEY = 'subscriptions:entitlement:{user_id}'
+
+_request_entitlements = ContextVar('request_entitlements', default=None)
+_use_shared_cache = ContextVar('use_shared_entitlement_cache', default=False)
+
+
+@contextmanager
+def entitlement_scope():
+    """Shares entitlement snapshots between all lookups in the block."""
+    token = _request_entitlements.set({})
+    try:
+        yield
+    finally:
+        _request_entitlements.reset(token)
+
+
+def shared_entitlements(view_method):
+    """
+    Lets a hot read endpoint reuse entitlement snapshots from the shared cache,
+    they can be up to ENTITLEMENT_SHARED_CACHE_TIMEOUT seconds old.
+    """
+
+    @functools.wraps(view_method)
+    def wrapper(*args, **kwargs):
+        token = _use_shared_cache.set(True)
+        try:
+            return view_method(*args, **kwargs)
+        finally:
+            _use_shared_cache.reset(token)
+
+    return wrapper
+
+
+def _get_cache_key(user_id):
+    return CACHE_KEY.format(user_id=user_id)
+
+
+def _load_entitlement(user):
+    subscription = user.subscriptions.active().select_related('plan').last()
+    if subscription is None:
+        return Entitlement(subscription=None, plan=None, tier=user.TIER_FREE)
+    return Entitlement(
+        subscription=subscription, plan=subscription.plan, tier=subscription.plan.tier
+    )
+
+
+def get_entitlement(user):
+    entitlements = _request_entitlements.get()
+    if entitlements is not None and user.pk in entitlements:
+        return entitlements[user.pk]
+
+    timeout = settings.ENTITLEMENT_SHARED_CACHE_TIMEOUT
+    use_shared_cache = _use_shared_cache.get() and timeout > 0 and user.pk
+    entitlement = cache.get(_get_cache_key(user.pk)) if use_shared_cache else None
+    if entitlement is None:
+        entitlement = _load_entitlement(user)
+        if use_shared_cache:
+            cache.set(_get_cache_key(user.pk), entitlement, timeout=timeout)
+
+    if entitlements is not None and user.pk:
+        entitlements[user.pk] = entitlement
+    return entitlement
+
+
+def invalidate_entitlement(user_id):
+    entitlements = _request_entitlements.get()
+    if entitlements is not None:
+        entitlements.pop(user_id, None)
+
+    cache_key = _get_cache_key(user_id)
+    cache.delete(cache_key)
+    # Delete again once the change is visible to other processes, they could
+    # otherwise cache the old subscription in between.
+    transaction.on_commit(lambda: cache.delete(cache_key))
+
+
+def invalidate_entitlements(user_ids):
+    """Invalidates the snapshots of many users with one cache call."""
+    entitlements = _request_entitlements.get()
+    if entitlements is not None:
+        for user_id in user_ids:
+            entitlements.pop(user_id, None)
+
+    cache_keys = [_get_cache_key(user_id) for user_id in user_ids]
+    cache.delete_many(cache_keys)
+    transaction.on_commit(lambda: cache.delete_many(cache_keys))
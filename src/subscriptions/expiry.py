@@ -0,0 +1,229 @@
+"""Expires subscriptions in batches of set-based updates for the nightly job."""
+import collections
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from amuse.utils import chunks
+from payments.models import PaymentTransaction
+from subscriptions.entitlements import invalidate_entitlements
+from subscriptions.models import PriceCard, Subscription, SubscriptionPlan
+from subscriptions.rules import ChangeReason
+
+# Users per Zendesk update_many request
+USER_BATCH_SIZE = 100
+
+Transition = collections.namedtuple(
+    'Transition', ['reason', 'assignments', 'condition', 'joins', 'columns']
+)
+
+TABLES = {
+    'subscription': Subscription._meta.db_table,
+    'plan': SubscriptionPlan._meta.db_table,
+    'price_card': PriceCard._meta.db_table,
+    'payment': PaymentTransaction._meta.db_table,
+}
+
+UPDATE_SQL = """
+UPDATE {subscription} SET {assignments}, updated = %(now)s
+FROM (
+    SELECT s.id{columns}
+    FROM {subscription} s
+    JOIN {plan} plan ON plan.id = s.plan_id
+    {joins}
+    WHERE {condition}
+    ORDER BY s.id
+    LIMIT %(batch_size)s
+    FOR UPDATE OF s SKIP LOCKED
+) batch
+WHERE {subscription}.id = batch.id
+RETURNING {subscription}.id, {subscription}.user_id
+"""
+
+# Plans with a free price card never expire
+PAID_PLAN = """
+NOT EXISTS (
+    SELECT 1 FROM {price_card} pc WHERE pc.plan_id = s.plan_id AND pc.price = 0
+)
+"""
+
+# Subscription.paid_until
+PAID_UNTIL_JOIN = """
+CROSS JOIN LATERAL (
+    SELECT COALESCE(
+        (
+            SELECT (p.paid_until AT TIME ZONE 'UTC')::date
+            FROM {payment} p
+            WHERE p.subscription_id = s.id
+            AND p.status = %(approved)s
+            AND p.type IN %(payment_types)s
+            ORDER BY p.created DESC
+            LIMIT 1
+        ),
+        s.valid_until,
+        (s.valid_from + plan.period * INTERVAL '1 month')::date
+    ) AS paid_until
+) paid
+"""
+
+APPLE_CONDITION = """
+s.provider = %(apple)s
+AND s.status IN (%(active)s, %(grace_period)s)
+AND (s.valid_until IS NULL OR s.valid_until < %(today)s)
+AND (s.valid_until < %(today)s OR paid.paid_until < %(today)s)
+AND {paid_plan}
+"""
+
+APPLE_COLUMNS = """,
+    paid.paid_until,
+    paid.paid_until + plan.grace_period_days AS grace_period_until
+"""
+
+APPLE_ASSIGNMENTS = """
+    status = %({status})s,
+    valid_until = batch.paid_until,
+    grace_period_until = batch.grace_period_until
+"""
+
+ADYEN_GRACE_PERIOD_EXPIRED = Transition(
+    reason=ChangeReason.ADYEN_GRACE_PERIOD_EXPIRED,
+    assignments='status = %(expired)s',
+    condition="""
+        s.provider = %(adyen)s
+        AND s.status = %(grace_period)s
+        AND s.grace_period_until < %(today)s
+        AND {paid_plan}
+    """,
+    joins='',
+    columns='',
+)
+
+ADYEN_EXPIRED = Transition(
+    reason=ChangeReason.ADYEN_EXPIRED,
+    assignments='status = %(expired)s',
+    condition="""
+        s.provider = %(adyen)s
+        AND s.status IN (%(active)s, %(grace_period)s)
+        AND s.valid_until < %(today)s
+        AND {paid_plan}
+    """,
+    joins='',
+    columns='',
+)
+
+APPLE_EXPIRED = Transition(
+    reason=ChangeReason.APPLE_EXPIRED,
+    assignments=APPLE_ASSIGNMENTS.format(status='expired'),
+    condition=APPLE_CONDITION
+    + 'AND paid.paid_until + plan.grace_period_days < %(today)s',
+    joins=PAID_UNTIL_JOIN,
+    columns=APPLE_COLUMNS,
+)
+
+# Subscriptions already in their grace period are only updated when their
+# paid_until changed, so the batches run out.
+APPLE_GRACE_PERIOD = Transition(
+    reason=ChangeReason.APPLE_GRACE_PERIOD,
+    assignments=APPLE_ASSIGNMENTS.format(status='grace_period'),
+    condition=APPLE_CONDITION
+    + """
+        AND paid.paid_until + plan.grace_period_days >= %(today)s
+        AND NOT (
+            s.status = %(grace_period)s
+            AND s.valid_until IS NOT DISTINCT FROM paid.paid_until
+            AND s.grace_period_until IS NOT DISTINCT FROM
+                paid.paid_until + plan.grace_period_days
+        )
+    """,
+    joins=PAID_UNTIL_JOIN,
+    columns=APPLE_COLUMNS,
+)
+
+VIP_EXPIRED = Transition(
+    reason=ChangeReason.VIP_EXPIRED,
+    assignments='status = %(expired)s',
+    condition="""
+        s.provider = %(vip)s
+        AND s.status = %(active)s
+        AND s.valid_until < %(today)s
+    """,
+    joins='',
+    columns='',
+)
+
+
+def get_sql(transition):
+    return UPDATE_SQL.format(
+        assignments=transition.assignments,
+        columns=transition.columns,
+        joins=transition.joins.format(**TABLES),
+        condition=transition.condition.format(paid_plan=PAID_PLAN.format(**TABLES)),
+        **TABLES,
+    )
+
+
+def _get_params(today, batch_size):
+    return {
+        'today': today,
+        'now': timezone.now(),
+        'batch_size': batch_size,
+        'active': Subscription.STATUS_ACTIVE,
+        'expired': Subscription.STATUS_EXPIRED,
+        'grace_period': Subscription.STATUS_GRACE_PERIOD,
+        'adyen': Subscription.PROVIDER_ADYEN,
+        'apple': Subscription.PROVIDER_IOS,
+        'vip': Subscription.PROVIDER_VIP,
+        'approved': PaymentTransaction.STATUS_APPROVED,
+        'payment_types': (
+            PaymentTransaction.TYPE_PAYMENT,
+            PaymentTransaction.TYPE_FREE_TRIAL,
+            PaymentTransaction.TYPE_INTRODUCTORY_PAYMENT,
+            PaymentTransaction.TYPE_AUTHORISATION,
+        ),
+    }
+
+
+def _write_history(subscription_ids, reason):
+    subscriptions = list(Subscription.objects.filter(pk__in=subscription_ids))
+    Subscription.history.bulk_history_create(
+        subscriptions, update=True, default_change_reason=str(reason)
+    )
+
+
+def _update_users(user_ids):
+    from amuse.tasks import update_users_subscription_state
+
+    for user_ids_chunk in chunks(sorted(set(user_ids)), USER_BATCH_SIZE):
+        update_users_subscription_state.delay(user_ids_chunk)
+
+
+def expire(transition, today):
+    """
+    Applies the transition to every subscription due on the date and returns
+    the (subscription ID, user ID) of the updated subscriptions.
+    """
+    batch_size = settings.SUBSCRIPTION_EXPIRY_BATCH_SIZE
+    sql = get_sql(transition)
+    params = _get_params(today, batch_size)
+    updated = []
+
+    while True:
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(sql, params)
+                rows = cursor.fetchall()
+            if rows:
+                _write_history(
+                    [subscription_id for subscription_id, _ in rows],
+                    transition.reason,
+                )
+                invalidate_entitlements([user_id for _, user_id in rows])
+
+        # Dispatched once committed so the tasks see the new statuses
+        if rows:
+            _update_users([user_id for _, user_id in rows])
+        updated += rows
+
+        if len(rows) < batch_size:
+            return updated
@@ -1,11 +1,9 @@
 import logging
 import math
-from datetime import timedelta
 from decimal import Decimal
+from functools import partial
 
-from django.conf import settings
 from django.core.cache import cache
-from django.db.models import Q
 from django.utils import timezone
 
 from amuse.analytics import subscription_successful_renewal
@@ -16,56 +14,29 @@ from amuse.vendor.apple.exceptions import (
     UnknownAppleError,
 )
 from amuse.vendor.apple.subscriptions import AppleReceiptValidationAPIClient
-from amuse.vendor.zendesk.api import update_users as update_zendesk_users
 from payments.helpers import create_apple_payment
 from payments.models import PaymentTransaction
+from subscriptions import expiry, renewal
 from subscriptions.models import Subscription, SubscriptionPlan
 
 logger = logging.getLogger(__name__)
 
 
-def renew_adyen_subscriptions(is_dry_run):
-    today = timezone.now().date()
-    renew_count = 0
-    error_count = 0
+def renew_adyen_subscriptions(is_dry_run, subscription_ids=None, workers=None):
     active_subscriptions = Subscription.objects.active_adyen()
-
-    for subscription in active_subscriptions:
-        successful_payment = subscription.latest_payment()
-
-        if not successful_payment:
-            logger.info(
-                "Skipping and setting to ERROR subscription with id %s because it has no Adyen payments"
-                % subscription.pk
-            )
-            subscription.status = Subscription.STATUS_ERROR
-            subscription.save()
-            continue
-
-        subscribed_until = successful_payment.paid_until.date()
-        previous_payment = subscription.latest_payment(allow_failed=True)
-        currency_code = previous_payment.currency.code
-        if subscribed_until <= today:
-            if is_dry_run:
-                print("Would renew subscription with id %s" % subscription.pk)
-                renew_count += 1
-            else:
-                renew_status = renew_subscription(subscription, currency_code)
-                new_payment = subscription.latest_payment(allow_failed=True)
-                _set_payment_category(previous_payment, new_payment)
-
-                if renew_status['is_success']:
-                    logger.info("Renewing subscription with id %s" % subscription.pk)
-                    subscription_successful_renewal(
-                        subscription, new_payment.amount, currency_code
-                    )
-                    renew_count += 1
-                else:
-                    logger.info(
-                        "Error renewing subscription with id %s: %s"
-                        % (subscription.pk, renew_status['error_message'])
-                    )
-                    error_count += 1
+    if subscription_ids is not None:
+        active_subscriptions = active_subscriptions.filter(pk__in=subscription_ids)
+
+    report = renewal.renew(
+        renewal.PROVIDER_ADYEN,
+        active_subscriptions,
+        partial(_renew_adyen_subscription, is_dry_run=is_dry_run),
+        workers=workers,
+    )
+    renew_count = report.outcomes[renewal.RENEWED]
+    error_count = (
+        report.outcomes[renewal.PROVIDER_ERROR] + report.outcomes[renewal.ERROR]
+    )
 
     if is_dry_run:
         print("Would renew %s subscriptions" % renew_count)
@@ -74,21 +45,66 @@ def renew_adyen_subscriptions(is_dry_run):
         if error_count > 0:
             error_message = '. Error renewing %s subscriptions' % error_count
         logger.info("Renewed %s subscriptions%s" % (renew_count, error_message))
+    return report
 
 
-def renew_apple_subscriptions(is_dry_run):
-    error_count = 0
-    renew_count = 0
-    active_subscriptions = Subscription.objects.active_apple()
+def _renew_adyen_subscription(subscription, report, is_dry_run):
+    today = timezone.now().date()
+    successful_payment = subscription.latest_payment()
 
-    for subscription in active_subscriptions:
-        is_success = renew_apple_subscription(
-            subscription, is_dry_run, platform=PaymentTransaction.PLATFORM_CRON
+    if not successful_payment:
+        logger.info(
+            "Skipping and setting to ERROR subscription with id %s because it has no Adyen payments"
+            % subscription.pk
         )
-        if is_success:
-            renew_count += 1
-        else:
-            error_count += 1
+        subscription.status = Subscription.STATUS_ERROR
+        subscription.save()
+        return renewal.NO_PAYMENT
+
+    subscribed_until = successful_payment.paid_until.date()
+    if subscribed_until > today:
+        return renewal.NOT_DUE
+
+    if is_dry_run:
+        print("Would renew subscription with id %s" % subscription.pk)
+        return renewal.RENEWED
+
+    previous_payment = subscription.latest_payment(allow_failed=True)
+    currency_code = previous_payment.currency.code
+    with renewal.provider_call(renewal.PROVIDER_ADYEN, report):
+        renew_status = renew_subscription(subscription, currency_code)
+    new_payment = subscription.latest_payment(allow_failed=True)
+    _set_payment_category(previous_payment, new_payment)
+
+    if not renew_status['is_success']:
+        logger.info(
+            "Error renewing subscription with id %s: %s"
+            % (subscription.pk, renew_status['error_message'])
+        )
+        return renewal.PROVIDER_ERROR
+
+    logger.info("Renewing subscription with id %s" % subscription.pk)
+    subscription_successful_renewal(subscription, new_payment.amount, currency_code)
+    return renewal.RENEWED
+
+
+def renew_apple_subscriptions(is_dry_run, subscription_ids=None, workers=None):
+    active_subscriptions = Subscription.objects.active_apple()
+    if subscription_ids is not None:
+        active_subscriptions = active_subscriptions.filter(pk__in=subscription_ids)
+
+    report = renewal.renew(
+        renewal.PROVIDER_APPLE,
+        active_subscriptions,
+        partial(
+            _renew_apple_subscription,
+            is_dry_run=is_dry_run,
+            platform=PaymentTransaction.PLATFORM_CRON,
+        ),
+        workers=workers,
+    )
+    renew_count = report.outcomes[renewal.RENEWED]
+    error_count = sum(report.outcomes.values()) - renew_count
 
     if is_dry_run:
         print("Would renew %s Apple subscriptions" % renew_count)
@@ -98,9 +114,15 @@ def renew_apple_subscriptions(is_dry_run):
         if error_count > 0:
             error_message = '. Error renewing %s subscriptions' % error_count
         logger.info("Renewed %s Apple subscriptions%s" % (renew_count, error_message))
+    return report
 
 
 def renew_apple_subscription(subscription, is_dry_run, platform):
+    outcome = _renew_apple_subscription(subscription, None, is_dry_run, platform)
+    return outcome == renewal.RENEWED
+
+
+def _renew_apple_subscription(subscription, report, is_dry_run, platform):
     today = timezone.now().date()
     latest_payment = subscription.latest_payment()
 
@@ -109,147 +131,87 @@ def renew_apple_subscription(subscription, is_dry_run, platform):
             "Skipping subscription with id %s because it has no Apple payments"
             % subscription.pk
         )
-        return False
+        return renewal.NO_PAYMENT
 
     subscribed_until = latest_payment.paid_until.date()
-    if subscribed_until <= today:
-        if is_dry_run:
-            print("Would renew Apple subscription with id %s" % subscription.pk)
-            return True
-
-        receipt = subscription.apple_receipt()
-        if not receipt:
-            return False
-        client = AppleReceiptValidationAPIClient(receipt, max_retries=1)
-        try:
+    if subscribed_until > today:
+        return renewal.NOT_DUE
+
+    if is_dry_run:
+        print("Would renew Apple subscription with id %s" % subscription.pk)
+        return renewal.RENEWED
+
+    receipt = subscription.apple_receipt()
+    if not receipt:
+        return renewal.NO_RECEIPT
+    client = AppleReceiptValidationAPIClient(receipt, max_retries=1)
+    try:
+        with renewal.provider_call(renewal.PROVIDER_APPLE, report):
             client.validate_receipt()
-        except (UnknownAppleError, MaxRetriesExceededError) as e:
-            return False
-
-        plan = SubscriptionPlan.objects.get_by_product_id(client.get_product_id())
-        country = latest_payment.country
-        transaction_id = None
-        try:
-            transaction_id = client.get_transaction_id()
-        except DuplicateAppleTransactionIDError:
-            # If the latest transaction is a dupe this subscription has not been renewed,
-            # leave it in grace period until expires job catches it or user renews
-            return False
-
-        amount = plan.get_price_card(country.code).price
-        currency = plan.get_price_card(country.code).currency
-
-        is_renewed = create_apple_payment(
-            amount=amount,
-            category=PaymentTransaction.CATEGORY_RENEWAL,
-            country=country,
-            external_transaction_id=transaction_id,
-            paid_until=client.get_expires_date(),
-            payment_method=latest_payment.payment_method,
-            plan=plan,
-            status=PaymentTransaction.STATUS_APPROVED,
-            subscription=subscription,
-            type=PaymentTransaction.TYPE_PAYMENT,
-            user=subscription.user,
-            vat_amount=country.vat_amount(plan.get_price_card(country.code).price),
-            vat_percentage=country.vat_percentage,
-            currency=currency,
-            platform=platform,
-        )
-        if is_renewed:
-            subscription_successful_renewal(subscription, amount, currency.code)
-            if subscription.paid_until > today:
-                subscription.status = Subscription.STATUS_ACTIVE
-                subscription.valid_until = None
-                subscription.grace_period_until = None
-                subscription.plan = plan
-                subscription.save()
-                logger.info("Renewing Apple subscription with id %s" % subscription.pk)
-                return True
+    except (UnknownAppleError, MaxRetriesExceededError) as e:
+        return renewal.PROVIDER_ERROR
+
+    plan = SubscriptionPlan.objects.get_by_product_id(client.get_product_id())
+    country = latest_payment.country
+    transaction_id = None
+    try:
+        transaction_id = client.get_transaction_id()
+    except DuplicateAppleTransactionIDError:
+        # If the latest transaction is a dupe this subscription has not been renewed,
+        # leave it in grace period until expires job catches it or user renews
+        return renewal.DUPLICATE_TRANSACTION
+
+    price_card = plan.get_price_card(country.code)
+    amount = price_card.price
+    currency = price_card.currency
+
+    is_renewed = create_apple_payment(
+        amount=amount,
+        category=PaymentTransaction.CATEGORY_RENEWAL,
+        country=country,
+        external_transaction_id=transaction_id,
+        paid_until=client.get_expires_date(),
+        payment_method=latest_payment.payment_method,
+        plan=plan,
+        status=PaymentTransaction.STATUS_APPROVED,
+        subscription=subscription,
+        type=PaymentTransaction.TYPE_PAYMENT,
+        user=subscription.user,
+        vat_amount=country.vat_amount(amount),
+        vat_percentage=country.vat_percentage,
+        currency=currency,
+        platform=platform,
+    )
+    if is_renewed:
+        subscription_successful_renewal(subscription, amount, currency.code)
+        if subscription.paid_until > today:
+            subscription.status = Subscription.STATUS_ACTIVE
+            subscription.valid_until = None
+            subscription.grace_period_until = None
+            subscription.plan = plan
+            subscription.save()
+            logger.info("Renewing Apple subscription with id %s" % subscription.pk)
+            return renewal.RENEWED
 
-    return False
+    return renewal.NOT_RENEWED
 
 
 def expire_subscriptions():
     today = timezone.now().date()
-    users = []
-    adyen_expired_count = 0
-
-    expired_grace_period_subscriptions = (
-        Subscription.objects.filter(provider=Subscription.PROVIDER_ADYEN)
-        .filter(status=Subscription.STATUS_GRACE_PERIOD, grace_period_until__lt=today)
-        .exclude(plan__pricecard__price=0)
-        .select_related('user')
-    )
-    expired_grace_period_subscriptions.update(status=Subscription.STATUS_EXPIRED)
-    adyen_expired_count += expired_grace_period_subscriptions.count()
-    users += [subscription.user for subscription in expired_grace_period_subscriptions]
-
-    expired_active_subscriptions = (
-        Subscription.objects.filter(provider=Subscription.PROVIDER_ADYEN)
-        .filter(
-            status__in=[Subscription.STATUS_ACTIVE, Subscription.STATUS_GRACE_PERIOD],
-            valid_until__lt=today,
-        )
-        .exclude(plan__pricecard__price=0)
-        .select_related('user', 'plan')
-    )
-    for subscription in expired_active_subscriptions:
-        subscription.status = Subscription.STATUS_EXPIRED
-        adyen_expired_count += 1
-        users.append(subscription.user)
-        subscription.save()
 
-    logger.info('Expired %s Adyen subscriptions' % adyen_expired_count)
+    adyen_expired = expiry.expire(expiry.ADYEN_GRACE_PERIOD_EXPIRED, today)
+    adyen_expired += expiry.expire(expiry.ADYEN_EXPIRED, today)
+    logger.info('Expired %s Adyen subscriptions' % len(adyen_expired))
 
-    apple_expired_count = 0
-    apple_subscriptions = (
-        Subscription.objects.active()
-        .prefetch_related('paymenttransaction_set')
-        .select_related('user', 'plan')
-        .filter(provider=Subscription.PROVIDER_IOS)
-        .filter(Q(valid_until=None) | Q(valid_until__lt=today))
-        .exclude(plan__pricecard__price=0)
-    )
-    for subscription in apple_subscriptions:
-        valid_until_passed = (
-            subscription.valid_until and subscription.valid_until < today
-        )
-        paid_until = subscription.paid_until
-        if not valid_until_passed and paid_until is None:
-            logger.info('Apple subscription %s has no paid_until' % subscription.pk)
-            continue
-        if valid_until_passed or paid_until < today:
-            subscription.valid_until = paid_until
-            subscription.grace_period_until = paid_until + timedelta(
-                days=subscription.plan.grace_period_days
-            )
-            if subscription.grace_period_until < today:
-                subscription.status = Subscription.STATUS_EXPIRED
-                apple_expired_count += 1
-                users.append(subscription.user)
-            else:
-                subscription.status = Subscription.STATUS_GRACE_PERIOD
-            subscription.save()
+    apple_expired = expiry.expire(expiry.APPLE_EXPIRED, today)
+    expiry.expire(expiry.APPLE_GRACE_PERIOD, today)
+    logger.info('Expired %s Apple subscriptions' % len(apple_expired))
+
+    vip_expired = expiry.expire(expiry.VIP_EXPIRED, today)
+    logger.info('Expired %s VIP subscriptions' % len(vip_expired))
 
-    logger.info('Expired %s Apple subscriptions' % apple_expired_count)
-
-    expired_vip_count = 0
-    expired_vip_subscriptions = Subscription.objects.filter(
-        provider=Subscription.PROVIDER_VIP,
-        status=Subscription.STATUS_ACTIVE,
-        valid_until__lt=today,
-    ).select_related('user')
-    expired_vip_count += expired_vip_subscriptions.count()
-    expired_vip_subscriptions.update(status=Subscription.STATUS_EXPIRED)
-    users += [subscription.user for subscription in expired_vip_subscriptions]
-    logger.info('Expired %s VIP subscriptions' % expired_vip_count)
-
-    users_count = len(users)
-    cache.set(key="users_downgraded-" + str(today), value=users, timeout=604800)
-    if users_count > 0 and settings.ZENDESK_API_TOKEN:
-        update_zendesk_users(users)
-        logger.info('Updated %s Zendesk users' % users_count)
+    user_ids = [user_id for _, user_id in adyen_expired + apple_expired + vip_expired]
+    cache.set(key="users_downgraded-" + str(today), value=user_ids, timeout=604800)
 
 
 def _set_payment_category(previous_payment, new_payment):
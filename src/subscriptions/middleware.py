@@ -0,0 +1,10 @@
+from subscriptions.entitlements import entitlement_scope
+
+
+class EntitlementCacheMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with entitlement_scope():
+            return self.get_response(request)
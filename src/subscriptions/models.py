@@ -5,12 +5,15 @@ from dateutil.relativedelta import relativedelta
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 from django.utils import timezone
 
 from amuse.analytics import update_is_pro_state
 from amuse.db.decorators import with_history
+from countries.models import Country, Currency
+from subscriptions import price_cards
+from subscriptions.entitlements import invalidate_entitlement
 from subscriptions.managers import (
     SubscriptionManager,
     SubscriptionPlanManager,
@@ -88,17 +91,17 @@ class SubscriptionPlan(models.Model):
         return self.name
 
     def get_introductory_price_card(self, country_code, date=timezone.now().date()):
-        introductory_cards = IntroductoryPriceCard.objects.active(date).filter(
-            plan=self, countries__code=country_code
+        introductory_cards = price_cards.get_introductory_price_cards(
+            self.pk, country_code, date
         )
 
-        if introductory_cards.count() > 1:
+        if len(introductory_cards) > 1:
             logger.error(
                 f'More than one IntroductoryPriceCard found for Plan {self.name} (id={self.pk}) and Country {country_code}'
             )
             return None
 
-        return introductory_cards.first()
+        return introductory_cards[0] if introductory_cards else None
 
     def get_price_card(self, country="US", use_intro_price=False, *args, **kwargs):
         """
@@ -115,23 +118,24 @@ class SubscriptionPlan(models.Model):
         return card
 
     def _get_price_card(self, country="US", *args, **kwargs):
-        cards = self.pricecard_set.filter(countries__code=country)
+        country = getattr(country, 'code', country)
+        cards = price_cards.get_price_cards(self.pk, country)
 
         # if no cards exist for the specified Country, it's probably because we've sent
         # the default US plans since no localised plans are available.
         # switch to US PriceCard and continue without errors
-        if not cards.exists():
-            cards = self.pricecard_set.filter(countries__code="US")
+        if not cards:
+            cards = price_cards.get_price_cards(self.pk, "US")
 
-        if cards.count() > 1:
+        if len(cards) > 1:
             raise ValueError(
                 f'More than one PriceCard found for Plan {self.name} (id={self.pk}) and Country {country}'
             )
-        if not cards.exists():
+        if not cards:
             raise ValueError(
                 f'No PriceCard found for Plan {self.name} (id={self.pk}) and Country {country}'
             )
-        return cards.first()
+        return cards[0]
 
     @property
     def has_trial_period(self):
@@ -434,6 +438,8 @@ class Subscription(models.Model):
     def __clear_user_is_pro_cache(self):
         if self.user and hasattr(self.user, 'is_pro'):
             del self.user.is_pro
+        if self.user_id:
+            invalidate_entitlement(self.user_id)
 
     def __subscription_post_save(self):
         self.__clear_user_is_pro_cache()
@@ -463,6 +469,27 @@ class Subscription(models.Model):
             )
 
 
+@receiver(post_delete, sender=Subscription)
+def invalidate_entitlement_on_delete(sender, instance, **kwargs):
+    if instance.user_id:
+        invalidate_entitlement(instance.user_id)
+
+
+@receiver(post_save, sender=SubscriptionPlan)
+@receiver(post_delete, sender=SubscriptionPlan)
+@receiver(post_save, sender=PriceCard)
+@receiver(post_delete, sender=PriceCard)
+@receiver(post_save, sender=IntroductoryPriceCard)
+@receiver(post_delete, sender=IntroductoryPriceCard)
+@receiver(m2m_changed, sender=PriceCard.countries.through)
+@receiver(post_save, sender=Country)
+@receiver(post_delete, sender=Country)
+@receiver(post_save, sender=Currency)
+@receiver(post_delete, sender=Currency)
+def invalidate_price_cards(sender, **kwargs):
+    price_cards.invalidate()
+
+
 class SubscriptionPlanChanges(models.Model):
     subscription = models.ForeignKey(
         'Subscription', on_delete=models.DO_NOTHING, related_name='plan_changes'
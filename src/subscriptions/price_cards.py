@@ -0,0 +1,71 @@
+"""Per-process map of the price cards of every plan by country."""
+from collections import defaultdict
+
+from amuse.versioned_index import VersionedIndex
+
+VERSION_CACHE_KEY = 'subscriptions:price_cards:version'
+
+
+class PriceCardIndex:
+    def __init__(self, cards, introductory_cards):
+        # (plan ID, country code) => [PriceCard] ordered by id
+        self.cards = self._get_cards_by_country(cards)
+        self.introductory_cards = self._get_cards_by_country(introductory_cards)
+
+    @staticmethod
+    def _get_cards_by_country(cards):
+        cards_by_country = defaultdict(list)
+        for card in cards:
+            for country in card.countries.all():
+                cards_by_country[(card.plan_id, country.code)].append(card)
+        return cards_by_country
+
+    def get(self, plan_id, country_code):
+        return self.cards.get((plan_id, country_code), [])
+
+    def get_introductory(self, plan_id, country_code, date):
+        return [
+            card
+            for card in self.introductory_cards.get((plan_id, country_code), [])
+            if card.start_date <= date <= card.end_date
+        ]
+
+
+def _get_cards(queryset):
+    return (
+        queryset.select_related('plan', 'currency')
+        .prefetch_related('countries')
+        .order_by('id')
+    )
+
+
+def _build_index():
+    from subscriptions.models import IntroductoryPriceCard, PriceCard
+
+    # PriceCard.objects excludes the IntroductoryPriceCards
+    return PriceCardIndex(
+        _get_cards(PriceCard.objects.all()),
+        _get_cards(IntroductoryPriceCard.objects.all()),
+    )
+
+
+_index = VersionedIndex(VERSION_CACHE_KEY, _build_index)
+
+
+def get_index():
+    return _index.get()
+
+
+def invalidate():
+    """Reloads the map in every process, queryset updates bypass the signals."""
+    _index.invalidate()
+
+
+def get_price_cards(plan_id, country_code):
+    """Returns the price cards of the plan for the country."""
+    return list(get_index().get(plan_id, country_code))
+
+
+def get_introductory_price_cards(plan_id, country_code, date):
+    """Returns the introductory price cards of the plan active on the date."""
+    return get_index().get_introductory(plan_id, country_code, date)
@@ -0,0 +1,219 @@
+"""Renews Adyen and Apple subscriptions in rate-limited chunks of claimed rows."""
+import logging
+import math
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+
+from subscriptions.models import Subscription
+
+logger = logging.getLogger(__name__)
+
+PROVIDER_ADYEN = 'adyen'
+PROVIDER_APPLE = 'apple'
+RATE_LIMIT_SETTINGS = {
+    PROVIDER_ADYEN: 'ADYEN_RENEWAL_RATE_LIMIT',
+    PROVIDER_APPLE: 'APPLE_RENEWAL_RATE_LIMIT',
+}
+CLAIM_CACHE_KEY = 'subscriptions:renewal:claim:{subscription_id}'
+
+# Outcomes of a single subscription renewal
+RENEWED = 'renewed'
+NOT_DUE = 'not_due'
+NOT_RENEWED = 'not_renewed'
+NO_PAYMENT = 'no_payment'
+NO_RECEIPT = 'no_receipt'
+DUPLICATE_TRANSACTION = 'duplicate_transaction'
+PROVIDER_ERROR = 'provider_error'
+LOCKED = 'locked'
+ERROR = 'error'
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing `rate` acquisitions per second."""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Blocks until a token is available. A rate of 0 is unlimited."""
+        if not self.rate:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+_rate_limiters = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider):
+    """Returns the token bucket of the share of the provider rate limit."""
+    with _rate_limiters_lock:
+        if provider not in _rate_limiters:
+            rate = getattr(settings, RATE_LIMIT_SETTINGS[provider])
+            concurrency = max(1, settings.SUBSCRIPTION_RENEWAL_CONCURRENCY)
+            _rate_limiters[provider] = TokenBucket(rate / concurrency)
+        return _rate_limiters[provider]
+
+
+def percentile(values, percent):
+    """Returns the nearest-rank percentile of the sorted values."""
+    if not values:
+        return None
+    rank = max(1, math.ceil(len(values) * percent / 100))
+    return values[rank - 1]
+
+
+class RenewalReport:
+    """Outcomes and provider call latencies of a renewal run."""
+
+    def __init__(self, provider):
+        self.provider = provider
+        self.outcomes = Counter()
+        self.latencies = []
+        self._started_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def add(self, outcome):
+        with self._lock:
+            self.outcomes[outcome] += 1
+
+    def add_latency(self, latency):
+        """Adds a provider call latency in milliseconds."""
+        with self._lock:
+            self.latencies.append(latency)
+
+    def summary(self):
+        with self._lock:
+            duration = time.monotonic() - self._started_at
+            latencies = sorted(self.latencies)
+            count = sum(self.outcomes.values())
+            return {
+                'provider': self.provider,
+                'count': count,
+                'duration': duration,
+                'throughput': count / duration if duration else 0.0,
+                'latency_p50': percentile(latencies, 50),
+                'latency_p95': percentile(latencies, 95),
+                'latency_p99': percentile(latencies, 99),
+                'outcomes': dict(self.outcomes),
+            }
+
+
+@contextmanager
+def provider_call(provider, report=None):
+    """Waits for the rate limit of the provider and times the call."""
+    get_rate_limiter(provider).acquire()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if report is not None:
+            report.add_latency((time.perf_counter() - started) * 1000)
+
+
+def _get_claim_cache_key(subscription_id):
+    return CLAIM_CACHE_KEY.format(subscription_id=subscription_id)
+
+
+def _claim(subscription):
+    """
+    Returns the subscription read again once claimed, or None when another
+    task is renewing it. The row lock is only held while claiming.
+    """
+    with transaction.atomic():
+        claimed_subscription = (
+            Subscription.objects.select_for_update(skip_locked=True)
+            .filter(pk=subscription.pk)
+            .first()
+        )
+        if claimed_subscription is None or not cache.add(
+            _get_claim_cache_key(subscription.pk),
+            1,
+            settings.SUBSCRIPTION_RENEWAL_CLAIM_TIMEOUT,
+        ):
+            return None
+    return claimed_subscription
+
+
+def _renew_claimed(subscription, renew_subscription, report):
+    try:
+        claimed_subscription = _claim(subscription)
+        if claimed_subscription is None:
+            outcome = LOCKED
+        else:
+            try:
+                outcome = renew_subscription(claimed_subscription, report)
+            finally:
+                cache.delete(_get_claim_cache_key(subscription.pk))
+    except Exception:
+        logger.exception('Error renewing subscription with id %s', subscription.pk)
+        outcome = ERROR
+    report.add(outcome)
+    return outcome
+
+
+def _renew_in_thread(subscription, renew_subscription, report):
+    try:
+        return _renew_claimed(subscription, renew_subscription, report)
+    finally:
+        connection.close()
+
+
+def renew(provider, subscriptions, renew_subscription, workers=None):
+    """
+    Calls `renew_subscription(subscription, report)` for each subscription,
+    which returns the outcome of the renewal, and returns the RenewalReport.
+
+    With more than one worker the subscriptions are renewed concurrently in a
+    bounded thread pool. Every worker thread uses its own database connection
+    which is closed once the subscription is renewed.
+    """
+    report = RenewalReport(provider)
+    subscriptions = list(subscriptions)
+
+    if not workers or workers <= 1 or len(subscriptions) <= 1:
+        for subscription in subscriptions:
+            _renew_claimed(subscription, renew_subscription, report)
+    else:
+        renew_one = partial(
+            _renew_in_thread, renew_subscription=renew_subscription, report=report
+        )
+        with ThreadPoolExecutor(max_workers=min(workers, len(subscriptions))) as pool:
+            list(pool.map(renew_one, subscriptions))
+
+    logger.info('Subscription renewal report: %s', report.summary())
+    return report
+
+
+def get_chunks(subscriptions):
+    """Returns the IDs of the subscriptions in chunks for separate tasks."""
+    subscription_ids = list(
+        subscriptions.order_by('pk').values_list('pk', flat=True).distinct()
+    )
+    size = settings.SUBSCRIPTION_RENEWAL_CHUNK_SIZE
+    return [
+        subscription_ids[i : i + size] for i in range(0, len(subscription_ids), size)
+    ]
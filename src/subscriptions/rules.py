@@ -44,8 +44,14 @@ class ChangeReason(IntEnum):
     APPLE_CANCELED = 100
     APPLE_INTERACTIVE_RENEWAL = 101
     APPLE_DID_CHANGE_RENEWAL_STATUS = 102
+    APPLE_EXPIRED = 103
+    APPLE_GRACE_PERIOD = 104
 
     ADYEN_CANCELED = 200
+    ADYEN_EXPIRED = 201
+    ADYEN_GRACE_PERIOD_EXPIRED = 202
+
+    VIP_EXPIRED = 300
 
     def __str__(self):
         return str(self.name)
@@ -0,0 +1,98 @@
+import responses
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from amuse.tests.helpers import (
+    ZENDESK_MOCK_API_URL_TOKEN,
+    add_zendesk_mock_post_response,
+)
+from subscriptions.entitlements import (
+    entitlement_scope,
+    get_entitlement,
+    shared_entitlements,
+)
+from subscriptions.models import Subscription, SubscriptionPlan
+from subscriptions.tests.factories import SubscriptionFactory, SubscriptionPlanFactory
+from users.models import User
+from users.tests.factories import UserFactory
+
+
+@override_settings(**ZENDESK_MOCK_API_URL_TOKEN)
+class EntitlementTestCase(TestCase):
+    @responses.activate
+    def setUp(self):
+        add_zendesk_mock_post_response()
+        cache.clear()
+        self.user = UserFactory()
+        self.plan = SubscriptionPlanFactory(tier=SubscriptionPlan.TIER_PLUS)
+
+    def test_free_user(self):
+        entitlement = get_entitlement(self.user)
+
+        assert entitlement.subscription is None
+        assert entitlement.plan is None
+        assert entitlement.tier == User.TIER_FREE
+        assert self.user.subscription_tier == 'Free Tier'
+
+    def test_subscribed_user(self):
+        subscription = SubscriptionFactory(user=self.user, plan=self.plan)
+
+        assert self.user.current_entitled_subscription() == subscription
+        assert self.user.tier == SubscriptionPlan.TIER_PLUS
+        assert self.user.is_pro
+
+    def test_snapshot_is_loaded_once_per_scope(self):
+        SubscriptionFactory(user=self.user, plan=self.plan)
+        other_instance = User.objects.get(pk=self.user.pk)
+
+        with entitlement_scope():
+            self.user.tier
+            with self.assertNumQueries(0):
+                self.user.tier
+                self.user.subscription_tier
+                self.user.current_subscription()
+                other_instance.current_entitled_subscription()
+
+    def test_lookups_outside_scope_are_not_cached(self):
+        self.user.tier
+
+        with self.assertNumQueries(1):
+            self.user.tier
+
+    @responses.activate
+    def test_saved_subscription_invalidates_snapshot(self):
+        add_zendesk_mock_post_response()
+        with entitlement_scope():
+            assert self.user.tier == User.TIER_FREE
+
+            subscription = SubscriptionFactory(user=self.user, plan=self.plan)
+            assert self.user.tier == SubscriptionPlan.TIER_PLUS
+
+            subscription.status = Subscription.STATUS_EXPIRED
+            subscription.save()
+            assert self.user.tier == User.TIER_FREE
+
+    def test_deleted_subscription_invalidates_snapshot(self):
+        SubscriptionFactory(user=self.user, plan=self.plan)
+
+        with entitlement_scope():
+            assert self.user.tier == SubscriptionPlan.TIER_PLUS
+            self.user.subscriptions.all().delete()
+            assert self.user.tier == User.TIER_FREE
+
+    @override_settings(ENTITLEMENT_SHARED_CACHE_TIMEOUT=30)
+    def test_shared_cache_is_used_by_decorated_views(self):
+        subscription = SubscriptionFactory(user=self.user, plan=self.plan)
+        get_tier = shared_entitlements(lambda user: user.tier)
+
+        assert get_tier(self.user) == SubscriptionPlan.TIER_PLUS
+        Subscription.objects.filter(pk=subscription.pk).update(
+            status=Subscription.STATUS_EXPIRED
+        )
+
+        assert get_tier(self.user) == SubscriptionPlan.TIER_PLUS
+        assert self.user.tier == User.TIER_FREE
+
+        subscription.refresh_from_db()
+        subscription.save()
+        assert get_tier(self.user) == User.TIER_FREE
@@ -0,0 +1,104 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from payments.tests.factories import PaymentTransactionFactory
+from subscriptions import expiry
+from subscriptions.helpers import expire_subscriptions
+from subscriptions.models import Subscription
+from subscriptions.rules import ChangeReason
+from subscriptions.tests.factories import SubscriptionFactory
+
+
+class ExpireTestCase(TestCase):
+    @mock.patch('amuse.tasks.zendesk_create_or_update_user')
+    def setUp(self, mock_zendesk):
+        self.today = timezone.now().date()
+        self.yesterday = self.today - timedelta(days=1)
+        self.vip_subscriptions = [
+            SubscriptionFactory(
+                provider=Subscription.PROVIDER_VIP, valid_until=self.yesterday
+            )
+            for _ in range(3)
+        ]
+        self.vip_ids = [subscription.pk for subscription in self.vip_subscriptions]
+
+    def _get_change_reasons(self, subscription):
+        return list(
+            Subscription.history.filter(id=subscription.pk)
+            .order_by('history_id')
+            .values_list('history_change_reason', flat=True)
+        )
+
+    @override_settings(SUBSCRIPTION_EXPIRY_BATCH_SIZE=2)
+    @mock.patch('amuse.tasks.update_users_subscription_state.delay')
+    def test_expires_subscriptions_in_batches(self, mock_update_users):
+        expired = expiry.expire(expiry.VIP_EXPIRED, self.today)
+
+        assert sorted(subscription_id for subscription_id, _ in expired) == sorted(
+            self.vip_ids
+        )
+        assert Subscription.objects.filter(
+            pk__in=self.vip_ids, status=Subscription.STATUS_EXPIRED
+        ).count() == len(self.vip_ids)
+        assert mock_update_users.call_count == 2
+
+    @mock.patch('amuse.tasks.update_users_subscription_state.delay')
+    def test_history_records_the_change_reason(self, mock_update_users):
+        expiry.expire(expiry.VIP_EXPIRED, self.today)
+
+        for subscription in self.vip_subscriptions:
+            assert self._get_change_reasons(subscription)[-1] == str(
+                ChangeReason.VIP_EXPIRED
+            )
+        mock_update_users.assert_called_once_with(
+            sorted(subscription.user_id for subscription in self.vip_subscriptions)
+        )
+
+    @mock.patch('amuse.tasks.update_users_subscription_state.delay')
+    def test_apple_grace_period_is_only_set_once(self, mock_update_users):
+        subscription = SubscriptionFactory(
+            provider=Subscription.PROVIDER_IOS,
+            plan__grace_period_days=14,
+            valid_until=self.yesterday,
+        )
+        PaymentTransactionFactory(
+            subscription=subscription, user=subscription.user, paid_until=timezone.now()
+        )
+
+        updated = expiry.expire(expiry.APPLE_GRACE_PERIOD, self.today)
+        assert updated == [(subscription.pk, subscription.user_id)]
+        assert expiry.expire(expiry.APPLE_GRACE_PERIOD, self.today) == []
+        assert expiry.expire(expiry.APPLE_EXPIRED, self.today) == []
+
+        subscription.refresh_from_db()
+        assert subscription.status == Subscription.STATUS_GRACE_PERIOD
+        assert subscription.valid_until == self.today
+        assert subscription.grace_period_until == self.today + timedelta(days=14)
+        assert self._get_change_reasons(subscription)[-1] == str(
+            ChangeReason.APPLE_GRACE_PERIOD
+        )
+
+    @mock.patch('amuse.tasks.update_users_subscription_state.delay')
+    def test_expire_subscriptions_keeps_downgraded_users(self, mock_update_users):
+        adyen_subscription = SubscriptionFactory(
+            status=Subscription.STATUS_GRACE_PERIOD,
+            grace_period_until=self.yesterday,
+        )
+        free_subscription = SubscriptionFactory(
+            plan__price=0, valid_until=self.yesterday
+        )
+
+        expire_subscriptions()
+
+        adyen_subscription.refresh_from_db()
+        free_subscription.refresh_from_db()
+        assert adyen_subscription.status == Subscription.STATUS_EXPIRED
+        assert free_subscription.status == Subscription.STATUS_ACTIVE
+        assert sorted(cache.get(f'users_downgraded-{self.today}')) == sorted(
+            [adyen_subscription.user_id]
+            + [subscription.user_id for subscription in self.vip_subscriptions]
+        )
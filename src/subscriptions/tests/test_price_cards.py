@@ -0,0 +1,86 @@
+from datetime import date
+from decimal import Decimal
+
+from django.test import TestCase, override_settings
+
+from countries.tests.factories import CountryFactory, CurrencyFactory
+from subscriptions import price_cards
+from subscriptions.tests.factories import (
+    IntroductoryPriceCardFactory,
+    PriceCardFactory,
+    SubscriptionPlanFactory,
+)
+
+
+class PriceCardMapTestCase(TestCase):
+    def setUp(self):
+        self.us = CountryFactory(code='US')
+        self.se = CountryFactory(code='SE')
+        self.plan = SubscriptionPlanFactory(
+            create_card=False, countries=[self.us], period=12
+        )
+        self.us_card = PriceCardFactory(
+            plan=self.plan, price=Decimal('60.00'), countries=[self.us]
+        )
+        self.se_card = PriceCardFactory(
+            plan=self.plan,
+            price=Decimal('600.00'),
+            currency=CurrencyFactory(code='SEK'),
+            countries=[self.se],
+        )
+
+    @override_settings(VERSIONED_INDEX_CHECK_INTERVAL=60)
+    def test_price_cards_are_resolved_without_queries(self):
+        self.plan.get_price_card()
+
+        with self.assertNumQueries(0):
+            assert self.plan.get_price_card('SE') == self.se_card
+            assert self.plan.get_price_card(self.se) == self.se_card
+            assert self.plan.get_price_card('US') == self.us_card
+            # No card for the country falls back to the US card
+            assert self.plan.get_price_card('NO') == self.us_card
+            assert self.plan.get_price_card('SE').currency.code == 'SEK'
+            assert self.plan.get_price_card('SE').period_price == '50.00'
+
+    def test_map_is_reloaded_on_changes(self):
+        assert self.plan.get_price_card('SE').price == Decimal('600.00')
+
+        self.se_card.price = Decimal('650.00')
+        self.se_card.save()
+        assert self.plan.get_price_card('SE').price == Decimal('650.00')
+
+        self.se_card.countries.remove(self.se)
+        assert self.plan.get_price_card('SE') == self.us_card
+
+        self.plan.period = 6
+        self.plan.save()
+        assert self.plan.get_price_card('US').period_price == '10.00'
+
+    def test_multiple_cards_for_country_raise_error(self):
+        PriceCardFactory(plan=self.plan, countries=[self.se])
+
+        with self.assertRaises(ValueError):
+            self.plan.get_price_card('SE')
+
+    def test_plan_without_cards_raises_error(self):
+        plan = SubscriptionPlanFactory(create_card=False)
+
+        with self.assertRaises(ValueError):
+            plan.get_price_card('SE')
+
+    def test_get_price_cards_returns_a_copy(self):
+        price_cards.get_price_cards(self.plan.pk, 'SE').clear()
+
+        assert price_cards.get_price_cards(self.plan.pk, 'SE') == [self.se_card]
+
+    def test_introductory_price_cards_are_filtered_on_date(self):
+        card = IntroductoryPriceCardFactory(
+            plan=self.plan,
+            countries=[self.se],
+            start_date=date(2021, 1, 1),
+            end_date=date(2021, 1, 31),
+        )
+
+        assert self.plan.get_introductory_price_card('SE', date(2021, 1, 31)) == card
+        assert self.plan.get_introductory_price_card('SE', date(2021, 2, 1)) is None
+        assert self.plan.get_introductory_price_card('US', date(2021, 1, 15)) is None
@@ -0,0 +1,183 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from amuse.vendor.aws import cloudwatch
+from subscriptions import renewal
+from subscriptions.helpers import renew_adyen_subscriptions
+from subscriptions.models import Subscription
+from subscriptions.tests.factories import SubscriptionFactory
+
+
+class TokenBucketTestCase(TestCase):
+    @mock.patch('subscriptions.renewal.time.sleep')
+    @mock.patch('subscriptions.renewal.time.monotonic', side_effect=[0, 0, 0, 0, 0.5])
+    def test_acquire_waits_when_bucket_is_empty(self, mock_monotonic, mock_sleep):
+        bucket = renewal.TokenBucket(rate=2)
+
+        bucket.acquire()
+        bucket.acquire()
+        mock_sleep.assert_not_called()
+
+        bucket.acquire()
+        mock_sleep.assert_called_once_with(0.5)
+
+    @mock.patch('subscriptions.renewal.time.sleep')
+    def test_zero_rate_is_unlimited(self, mock_sleep):
+        bucket = renewal.TokenBucket(rate=0)
+
+        for _ in range(10):
+            bucket.acquire()
+
+        mock_sleep.assert_not_called()
+
+
+class RenewalReportTestCase(TestCase):
+    def test_summary_has_outcomes_and_latency_percentiles(self):
+        report = renewal.RenewalReport(renewal.PROVIDER_ADYEN)
+        for latency in range(100, 0, -1):
+            report.add_latency(latency)
+        report.add(renewal.RENEWED)
+        report.add(renewal.RENEWED)
+        report.add(renewal.PROVIDER_ERROR)
+
+        summary = report.summary()
+
+        assert summary['provider'] == 'adyen'
+        assert summary['count'] == 3
+        assert summary['outcomes'] == {'renewed': 2, 'provider_error': 1}
+        assert summary['latency_p50'] == 50
+        assert summary['latency_p95'] == 95
+        assert summary['latency_p99'] == 99
+        assert summary['throughput'] > 0
+
+    def test_summary_without_provider_calls(self):
+        summary = renewal.RenewalReport(renewal.PROVIDER_APPLE).summary()
+
+        assert summary['count'] == 0
+        assert summary['latency_p50'] is None
+
+    @mock.patch('amuse.vendor.aws.cloudwatch.get_client')
+    def test_metrics_publish_the_latencies_as_a_statistic_set(self, mock_get_client):
+        report = renewal.RenewalReport(renewal.PROVIDER_ADYEN)
+        for latency in (10, 20, 30):
+            report.add_latency(latency)
+        report.add(renewal.RENEWED)
+
+        cloudwatch.subscription_renewal_metrics(report)
+
+        metric_data = mock_get_client.return_value.put_metric_data.call_args[1][
+            'MetricData'
+        ]
+        latency = next(
+            metric
+            for metric in metric_data
+            if metric['MetricName'] == 'SubscriptionRenewalLatency'
+        )
+        assert latency['StatisticValues'] == {
+            'SampleCount': 3,
+            'Sum': 60,
+            'Minimum': 10,
+            'Maximum': 30,
+        }
+
+
+class RenewTestCase(TestCase):
+    @mock.patch('amuse.tasks.zendesk_create_or_update_user')
+    def setUp(self, mock_zendesk):
+        cache.clear()
+        self.subscriptions = [SubscriptionFactory() for _ in range(3)]
+
+    def test_renews_subscriptions_and_counts_outcomes(self):
+        renewed = []
+
+        def renew_subscription(subscription, report):
+            with renewal.provider_call(renewal.PROVIDER_ADYEN, report):
+                renewed.append(subscription.pk)
+            if subscription.pk == self.subscriptions[1].pk:
+                raise ValueError()
+            return renewal.RENEWED
+
+        report = renewal.renew(
+            renewal.PROVIDER_ADYEN, self.subscriptions, renew_subscription
+        )
+
+        assert renewed == [subscription.pk for subscription in self.subscriptions]
+        assert report.outcomes == {renewal.RENEWED: 2, renewal.ERROR: 1}
+        assert len(report.latencies) == 3
+
+    @mock.patch('subscriptions.renewal._renew_claimed')
+    def test_workers_renew_all_subscriptions(self, mock_renew_claimed):
+        mock_renew_claimed.side_effect = lambda subscription, renew, report: report.add(
+            renewal.RENEWED
+        )
+
+        report = renewal.renew(
+            renewal.PROVIDER_ADYEN, self.subscriptions, mock.Mock(), workers=2
+        )
+
+        assert mock_renew_claimed.call_count == 3
+        assert report.outcomes == {renewal.RENEWED: 3}
+
+    def test_skips_subscription_claimed_by_another_task(self):
+        subscription = self.subscriptions[0]
+        cache.add(renewal._get_claim_cache_key(subscription.pk), 1)
+        renew_subscription = mock.Mock(return_value=renewal.RENEWED)
+
+        report = renewal.renew(
+            renewal.PROVIDER_ADYEN, self.subscriptions, renew_subscription
+        )
+
+        assert report.outcomes == {renewal.RENEWED: 2, renewal.LOCKED: 1}
+        assert subscription not in [
+            call.args[0] for call in renew_subscription.call_args_list
+        ]
+
+    def test_renewal_is_not_rolled_back_on_error(self):
+        def renew_subscription(subscription, report):
+            subscription.status = Subscription.STATUS_ERROR
+            subscription.save()
+            raise ValueError()
+
+        report = renewal.renew(
+            renewal.PROVIDER_ADYEN, self.subscriptions[:1], renew_subscription
+        )
+
+        assert report.outcomes == {renewal.ERROR: 1}
+        assert (
+            Subscription.objects.get(pk=self.subscriptions[0].pk).status
+            == Subscription.STATUS_ERROR
+        )
+        assert cache.add(renewal._get_claim_cache_key(self.subscriptions[0].pk), 1)
+
+    @override_settings(ADYEN_RENEWAL_RATE_LIMIT=20, SUBSCRIPTION_RENEWAL_CONCURRENCY=4)
+    @mock.patch.dict('subscriptions.renewal._rate_limiters', clear=True)
+    def test_rate_limit_is_shared_between_chunk_tasks(self):
+        assert renewal.get_rate_limiter(renewal.PROVIDER_ADYEN).rate == 5
+
+    @override_settings(SUBSCRIPTION_RENEWAL_CHUNK_SIZE=2)
+    def test_get_chunks(self):
+        ids = sorted(subscription.pk for subscription in self.subscriptions)
+
+        chunks = renewal.get_chunks(Subscription.objects.all())
+
+        assert chunks == [ids[:2], ids[2:]]
+
+    @mock.patch('subscriptions.helpers.renew_subscription')
+    def test_renew_adyen_subscriptions_only_renews_the_chunk(self, mock_renewal):
+        report = renew_adyen_subscriptions(
+            is_dry_run=False, subscription_ids=[self.subscriptions[0].pk]
+        )
+
+        assert report.outcomes == {renewal.NO_PAYMENT: 1}
+        mock_renewal.assert_not_called()
+        statuses = [
+            Subscription.objects.get(pk=subscription.pk).status
+            for subscription in self.subscriptions
+        ]
+        assert statuses == [
+            Subscription.STATUS_ERROR,
+            Subscription.STATUS_ACTIVE,
+            Subscription.STATUS_ACTIVE,
+        ]
@@ -45,6 +45,7 @@ from users.models import (
     UserGDPR,
     UserMetadata,
 )
+from users.principal import invalidate_principals
 from users.utils import parse_input_string_to_digits
 
 admin.site.unregister(TokenProxy)
@@ -468,8 +469,11 @@ class UserAdmin(ExportMixin, admin.ModelAdmin):
 
     def deactivate_users(self, request, qs):
         if "post" in request.POST and request.POST["post"] == "yes":
+            # Read before the update, which can change the rows qs matches
+            ids = list(qs.values_list('id', flat=True))
             qs.update(is_active=False)
-            self.message_user(request, f"{qs.count()} users were deactivated.")
+            invalidate_principals(ids)
+            self.message_user(request, f"{len(ids)} users were deactivated.")
             return HttpResponseRedirect(request.get_full_path())
 
         return render(
@@ -20,6 +20,7 @@ from releases.models import RoyaltySplit, Release, FugaMetadata
 from subscriptions.models import Subscription
 from users.models import ArtistV2, Transaction, TransactionWithdrawal, User
 from users.models.user import UserGDPR, UserMetadata
+from users.principal import invalidate_principal
 
 logger = logging.getLogger(__name__)
 
@@ -216,6 +217,7 @@ def clean_user_data(user_id):
         apple_signin_id=None,
         firebase_token=None,
     )
+    invalidate_principal(user_id)
 
     UserGDPR.objects.filter(user_id=user_id).update(
         email_adress=True,
@@ -232,6 +234,7 @@ def clean_user_data(user_id):
 
 def deactivate_user_newsletter_and_active(user_id):
     User.objects.filter(id=user_id).update(newsletter=False, is_active=False)
+    invalidate_principal(user_id)
 
     UserGDPR.objects.filter(user_id=user_id).update(
         user_newsletter_deactivation=True, user_isactive_deactivation=True
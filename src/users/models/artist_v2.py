@@ -70,10 +70,8 @@ class ArtistV2(models.Model):
 
     @property
     def has_owner(self):
-        if self.owner is not None:
-            return True
-        else:
-            return False
+        # Avoids fetching the owner when serializing lists of artists
+        return self.owner_id is not None
 
     def is_accessible_by_admin_roles(self, user_id):
         return self.is_accessible_by(
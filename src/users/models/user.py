@@ -6,6 +6,7 @@ from django.contrib.auth.hashers import (
     make_password,
 )
 from django.db import models
+from django.db.models.signals import post_delete
 from django.dispatch import receiver
 from django.utils import timezone
 from django.utils.functional import cached_property
@@ -17,6 +18,8 @@ from amuse import mails
 from amuse.db.decorators import field_observer, observable_fields
 from amuse.logging import logger
 from amuse.vendor.segment.events import user_frozen
+from subscriptions.entitlements import get_entitlement
+from users.principal import invalidate_principal
 from users.managers import OtpDeviceManager, UserManager
 from users.models import UserArtistRole
 from .transaction import ZERO
@@ -139,29 +142,24 @@ class User(models.Model):
         return self.is_staff
 
     def _is_pro(self):
-        return self.subscriptions.active().exists()
+        return get_entitlement(self).subscription is not None
 
     _is_pro.boolean = True
     is_pro = cached_property(_is_pro, name="is_pro")
 
     @property
     def tier(self):
-        active_subs = self.subscriptions.active()
-        if not active_subs.exists():
-            return self.TIER_FREE
-        active_sub = active_subs.last()
-        return active_sub.plan.tier
+        return get_entitlement(self).tier
 
     @property
     def subscription_tier(self):
         """
         Used only for admin to display user tier
         """
-        active_subs = self.subscriptions.active()
-        if not active_subs.exists():
+        plan = get_entitlement(self).plan
+        if plan is None:
             return 'Free Tier'
-        active_sub = active_subs.last()
-        return active_sub.plan.get_tier_display()
+        return plan.get_tier_display()
 
     @property
     def is_gdpr_wiped(self):
@@ -184,6 +182,7 @@ class User(models.Model):
             self.rotate_token()
 
         super().save(*args, **kwargs)
+        invalidate_principal(self.pk)
 
         if self.__original_artist_name != self.artist_name:
             logger.info(
@@ -391,7 +390,7 @@ class User(models.Model):
         notifications, renewal cron jobs, etc.) takes dates into the calculation
         and sets `status` appropriately.
         """
-        return self.subscriptions.active().last()
+        return get_entitlement(self).subscription
 
     def current_subscription(self):
         """
@@ -477,6 +476,11 @@ class User(models.Model):
         UserMetadata.objects.update_or_create(user=self, defaults=defaults)
 
 
+@receiver(post_delete, sender=User)
+def invalidate_principal_on_delete(sender, instance, **kwargs):
+    invalidate_principal(instance.pk)
+
+
 class UserMetadata(models.Model):
     FLAGGED_REASON_STREAMFARMER = 0
     FLAGGED_REASON_SCAM = 1
@@ -0,0 +1,87 @@
+"""
+Slim, cached projection of users for authentication.
+
+Authentication only needs to know whether a user exists and is active, so the
+principal is cached under the user id in the shared cache and the full User
+row is only loaded once a view actually reads another field.
+
+User.save() and deletes invalidate the principal. Queryset updates bypass them
+and have to call invalidate_principals() themselves.
+"""
+import collections
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.functional import SimpleLazyObject
+
+Principal = collections.namedtuple("Principal", ["id", "is_active"])
+
+CACHE_KEY = 'users:principal:{user_id}'
+# Cached for users that do not exist so unknown ids do not query every time
+MISSING = Principal(id=None, is_active=False)
+
+
+def _get_cache_key(user_id):
+    return CACHE_KEY.format(user_id=user_id)
+
+
+def get_principal(user_id):
+    """Returns the Principal of the user or None if the user does not exist."""
+    from users.models import User
+
+    cache_key = _get_cache_key(user_id)
+    principal = cache.get(cache_key)
+    if principal is None:
+        row = User.objects.filter(id=user_id).values_list('id', 'is_active').first()
+        principal = Principal(*row) if row else MISSING
+        cache.set(cache_key, principal, settings.AUTH_PRINCIPAL_CACHE_TIMEOUT)
+
+    return principal if principal.id is not None else None
+
+
+def invalidate_principals(user_ids):
+    cache_keys = [_get_cache_key(user_id) for user_id in user_ids]
+    cache.delete_many(cache_keys)
+    # Delete again once the change is visible to other processes, they could
+    # otherwise cache the old principal in between.
+    transaction.on_commit(lambda: cache.delete_many(cache_keys))
+
+
+def invalidate_principal(user_id):
+    invalidate_principals([user_id])
+
+
+class AuthenticatedUser(SimpleLazyObject):
+    """
+    User that answers the fields of its Principal without a query and loads
+    the full row on first access to anything else.
+    """
+
+    def __init__(self, principal):
+        from users.models import User
+
+        super().__init__(lambda: User.objects.get(id=principal.id))
+        # LazyObject forwards attribute assignment to the wrapped user
+        self.__dict__['_principal'] = principal
+
+    @property
+    def id(self):
+        return self._principal.id
+
+    pk = id
+
+    @property
+    def is_active(self):
+        return self._principal.is_active
+
+    @property
+    def is_authenticated(self):
+        return True
+
+    @property
+    def is_anonymous(self):
+        return False
+
+    def __bool__(self):
+        return True